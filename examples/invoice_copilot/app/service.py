@@ -14,19 +14,15 @@ Handler Contract:
     def handler(payload: dict) -> dict
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from .graph import build_graph
 
-# Cache the agent instance
-_agent = None
-
 
+@lru_cache(maxsize=1)
 def get_agent():
     """Get or create the agent instance (cached)."""
-    global _agent
-    if _agent is None:
-        _agent = build_graph()
-    return _agent
+    return build_graph()
 
 
 def process_invoice(payload: Dict[str, Any]) -> Dict[str, Any]:
@@ -66,14 +62,13 @@ def process_invoice(payload: Dict[str, Any]) -> Dict[str, Any]:
     # =========================================================================
     
     # Validate required fields
-    if "document_text" not in payload:
+    document_text = payload.get("document_text")
+    if document_text is None:
         return {
             "error": "Missing required field: document_text",
             "success": False
         }
     
-    document_text = payload.get("document_text", "")
-    
     # Clean up the document text
     cleaned_text = document_text.strip()
     if not cleaned_text:
@@ -49,6 +49,7 @@ Usage:
 from .base import (
     AgentAdapter,
     AsyncAgentAdapter,
+    BatchAgentAdapter,
     StatefulAgentAdapter,
     StreamingAgentAdapter,
 )
@@ -82,6 +83,7 @@ __all__ = [
     "AgentAdapter",
     "StreamingAgentAdapter",
     "AsyncAgentAdapter",
+    "BatchAgentAdapter",
     "StatefulAgentAdapter",
     # Adapters
     "LangGraphAdapter",
@@ -26,7 +26,7 @@ Usage:
             pass
 """
 
-from typing import Any, Dict, Iterator, Optional, Protocol
+from typing import Any, Dict, Iterator, List, Optional, Protocol, Union
 
 
 class AgentAdapter(Protocol):
@@ -188,6 +188,33 @@ class AsyncAgentAdapter(AgentAdapter, Protocol):
         ...
 
 
+class BatchAgentAdapter(AgentAdapter, Protocol):
+    """
+    Extended protocol for adapters that can invoke several payloads at once.
+
+    Used by the runtime's invoke batcher to dispatch one call per batch.
+    """
+
+    def batch_invoke(
+        self, payloads: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Invoke the agent for several payloads.
+
+        Args:
+            payloads: Input dictionaries
+            return_exceptions: Return per-payload exceptions in the result
+                list instead of raising the first one
+
+        Returns:
+            Output dictionary (or exception) for each payload, in order
+
+        Examples:
+            >>> results = adapter.batch_invoke([payload_a, payload_b])
+        """
+        ...
+
+
 class StatefulAgentAdapter(AgentAdapter, Protocol):
     """
     Extended protocol for adapters that support stateful execution.
@@ -34,9 +34,13 @@ Usage:
 """
 
 import asyncio
+import concurrent.futures
+import contextvars
 import importlib
 import inspect
-from typing import Any, Callable, Dict, Optional
+import sys
+import threading
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Union
 
 from dockrion_common import get_logger, validate_handler
 
@@ -53,6 +57,69 @@ from .serialization import serialize_for_json
 
 logger = get_logger("handler-adapter")
 
+# Marks a callable missing from the handler module (None is a valid attribute value)
+_MISSING = object()
+
+# Shared executor for handler calls that must run off the calling thread
+_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Shared event loop, running in a daemon thread, for async handlers called from sync code
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
+
+def _get_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Return the shared executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = concurrent.futures.ThreadPoolExecutor(
+                    thread_name_prefix="dockrion-handler"
+                )
+    return _executor
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """Return the shared event loop used to run async handlers from sync code."""
+    global _background_loop
+    if _background_loop is None:
+        with _background_loop_lock:
+            if _background_loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="dockrion-handler-loop", daemon=True
+                ).start()
+                _background_loop = loop
+    return _background_loop
+
+
+def _run_coroutine_sync(coro: Coroutine[Any, Any, Any]) -> Any:
+    """
+    Run a coroutine on the background loop and block until it completes.
+
+    The caller's context variables (e.g. the current StreamContext) are
+    copied into the task so the coroutine sees the same values.
+    """
+    ctx = contextvars.copy_context()
+
+    async def run_with_context() -> Any:
+        for var, value in ctx.items():
+            var.set(value)
+        return await coro
+
+    return asyncio.run_coroutine_threadsafe(run_with_context(), _get_background_loop()).result()
+
+
+def _set_stream_context(context: Optional[Any]) -> None:
+    """Set the current StreamContext if the events package is installed."""
+    try:
+        from dockrion_events import set_current_context
+    except ImportError:
+        return  # Events package not installed
+    set_current_context(context)
+
 
 class HandlerAdapter:
     """
@@ -86,6 +153,14 @@ class HandlerAdapter:
         >>> result = adapter.invoke({"query": "hello"}, context=stream_context)
     """
 
+    __slots__ = (
+        "_handler",
+        "_handler_path",
+        "_is_async",
+        "_signature",
+        "_accepts_context",
+    )
+
     def __init__(self):
         """Initialize handler adapter."""
         self._handler: Optional[Callable] = None
@@ -138,7 +213,8 @@ class HandlerAdapter:
         # Step 2: Import module
         try:
             logger.debug("Importing module", module=module_path)
-            module = importlib.import_module(module_path)
+            # Already-imported modules skip the import machinery entirely
+            module = sys.modules.get(module_path) or importlib.import_module(module_path)
         except ImportError as e:
             logger.error("Module import failed", module=module_path, error=str(e))
             raise ModuleNotFoundError(
@@ -152,7 +228,8 @@ class HandlerAdapter:
             ) from e
 
         # Step 3: Get callable from module
-        if not hasattr(module, callable_name):
+        handler = getattr(module, callable_name, _MISSING)
+        if handler is _MISSING:
             available = [name for name in dir(module) if not name.startswith("_")]
             logger.error(
                 "Callable not found in module",
@@ -163,15 +240,7 @@ class HandlerAdapter:
             raise CallableNotFoundError(
                 module_path=module_path, callable_name=callable_name, available=available[:10]
             )
-
-        try:
-            handler = getattr(module, callable_name)
-            logger.debug("Handler function found", callable=callable_name)
-        except Exception as e:
-            logger.error("Failed to get callable", callable=callable_name, error=str(e))
-            raise AdapterLoadError(
-                f"Failed to get callable '{callable_name}' from module '{module_path}': {e}"
-            ) from e
+        logger.debug("Handler function found", callable=callable_name)
 
         # Step 4: Validate it's callable
         if not callable(handler):
@@ -182,10 +251,27 @@ class HandlerAdapter:
                 f"Hint: Ensure '{callable_name}' is a function, not a class or variable."
             )
 
-        # Step 5: Detect if async
+        # Steps 5-6: Detect async and context support. Reloading the same
+        # handler object keeps the previous result instead of re-inspecting.
+        if handler is not self._handler:
+            self._inspect_handler(handler)
+
+        # Step 7: Store handler
+        self._handler = handler
+        self._handler_path = handler_path
+
+        logger.info(
+            "✅ Handler loaded successfully",
+            handler_path=handler_path,
+            is_async=self._is_async,
+            accepts_context=self._accepts_context,
+            signature=str(self._signature) if self._signature else "unknown",
+        )
+
+    def _inspect_handler(self, handler: Callable[..., Any]) -> None:
+        """Detect whether the handler is async and whether it accepts a context."""
         self._is_async = asyncio.iscoroutinefunction(handler)
 
-        # Step 6: Get signature for validation and detect context support
         try:
             self._signature = inspect.signature(handler)
             # Check if handler accepts a 'context' parameter specifically
@@ -208,18 +294,6 @@ class HandlerAdapter:
             self._signature = None
             self._accepts_context = False
 
-        # Step 7: Store handler
-        self._handler = handler
-        self._handler_path = handler_path
-
-        logger.info(
-            "✅ Handler loaded successfully",
-            handler_path=handler_path,
-            is_async=self._is_async,
-            accepts_context=self._accepts_context,
-            signature=str(self._signature) if self._signature else "unknown",
-        )
-
     def invoke(self, payload: Dict[str, Any], context: Optional[Any] = None) -> Dict[str, Any]:
         """
         Invoke handler with payload and optional StreamContext.
@@ -253,22 +327,18 @@ class HandlerAdapter:
             logger.error("Invoke called before load")
             raise AdapterNotLoadedError()
 
-        logger.debug(
-            "Handler invocation started",
-            handler_path=self._handler_path,
-            input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
-            is_async=self._is_async,
-            has_context=context is not None,
-        )
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "Handler invocation started",
+                handler_path=self._handler_path,
+                input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
+                is_async=self._is_async,
+                has_context=context is not None,
+            )
 
         # Set thread-local context if provided
         if context is not None:
-            try:
-                from dockrion_events import set_current_context
-
-                set_current_context(context)
-            except ImportError:
-                pass  # Events package not installed
+            _set_stream_context(context)
 
         # Invoke handler
         try:
@@ -281,35 +351,154 @@ class HandlerAdapter:
                     result = self._handler(payload, context)
                 else:
                     result = self._handler(payload)
+        except Exception as e:
+            raise self._invocation_error(e, payload) from e
+        finally:
+            # Clear thread-local context
+            if context is not None:
+                _set_stream_context(None)
+
+        return self._process_result(result)
+
+    async def ainvoke(
+        self, payload: Dict[str, Any], context: Optional[Any] = None
+    ) -> Dict[str, Any]:
+        """
+        Async version of invoke().
+
+        Async handlers are awaited directly on the caller's event loop.
+        Sync handlers are run in the default thread pool so they never
+        block the loop.
+
+        Args:
+            payload: Input dictionary to pass to handler
+            context: Optional StreamContext for streaming support
+
+        Returns:
+            Output dictionary from handler
+
+        Raises:
+            AdapterNotLoadedError: If load() not called
+            AgentExecutionError: If handler invocation fails
+            InvalidOutputError: If handler returns non-dict
+
+        Examples:
+            >>> result = await adapter.ainvoke({"document": "INVOICE #123..."})
+        """
+        if self._handler is None:
+            logger.error("Invoke called before load")
+            raise AdapterNotLoadedError()
+
+        if not self._is_async:
+            return await asyncio.to_thread(self.invoke, payload, context)
+
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "Handler invocation started",
+                handler_path=self._handler_path,
+                input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
+                is_async=True,
+                has_context=context is not None,
+            )
+
+        # Set thread-local context if provided
+        if context is not None:
+            _set_stream_context(context)
+
+        try:
+            if self._accepts_context and context is not None:
+                result = await self._handler(payload, context)
+            else:
+                result = await self._handler(payload)
+        except Exception as e:
+            raise self._invocation_error(e, payload) from e
+        finally:
+            if context is not None:
+                _set_stream_context(None)
+
+        return self._process_result(result)
+
+    def batch_invoke(
+        self, payloads: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Invoke handler for several payloads.
+
+        Handlers take a single payload, so the payloads are invoked
+        concurrently on a shared thread pool and results returned in order.
+
+        Args:
+            payloads: Input dictionaries
+            return_exceptions: Return per-payload exceptions in the result
+                list instead of raising the first one
+
+        Returns:
+            Output dictionary (or exception) for each payload, in order
+
+        Raises:
+            AdapterNotLoadedError: If load() not called
+            AgentExecutionError: If a handler invocation fails
+            InvalidOutputError: If handler returns non-dict
+        """
+        if self._handler is None:
+            logger.error("Invoke called before load")
+            raise AdapterNotLoadedError()
 
-        except TypeError as e:
+        def invoke_one(payload: Dict[str, Any]) -> Union[Dict[str, Any], Exception]:
+            try:
+                return self.invoke(payload)
+            except Exception as e:
+                if return_exceptions:
+                    return e
+                raise
+
+        if len(payloads) <= 1:
+            return [invoke_one(payload) for payload in payloads]
+        return list(_get_executor().map(invoke_one, payloads))
+
+    def _invocation_error(self, error: Exception, payload: Any) -> AgentExecutionError:
+        """
+        Log a handler failure and build the AgentExecutionError to raise.
+
+        Args:
+            error: Exception raised by the handler
+            payload: Payload the handler was called with
+
+        Returns:
+            AgentExecutionError describing the failure
+        """
+        if isinstance(error, TypeError):
             logger.error(
                 "Handler invocation failed with TypeError",
-                error=str(e),
+                error=str(error),
                 payload_type=type(payload).__name__,
             )
-            raise AgentExecutionError(
-                f"Handler invocation failed with TypeError: {e}. "
+            return AgentExecutionError(
+                f"Handler invocation failed with TypeError: {error}. "
                 f"Hint: Ensure handler signature matches: def handler(payload: dict) -> dict"
-            ) from e
-        except Exception as e:
-            logger.error(
-                "Handler invocation failed",
-                error=str(e),
-                error_type=type(e).__name__,
-                handler_path=self._handler_path,
             )
-            raise AgentExecutionError(f"Handler invocation failed: {type(e).__name__}: {e}") from e
-        finally:
-            # Clear thread-local context
-            if context is not None:
-                try:
-                    from dockrion_events import set_current_context
 
-                    set_current_context(None)
-                except ImportError:
-                    pass
+        logger.error(
+            "Handler invocation failed",
+            error=str(error),
+            error_type=type(error).__name__,
+            handler_path=self._handler_path,
+        )
+        return AgentExecutionError(f"Handler invocation failed: {type(error).__name__}: {error}")
+
+    def _process_result(self, result: Any) -> Dict[str, Any]:
+        """
+        Validate handler output and make it JSON-serializable.
+
+        Args:
+            result: Raw value returned by the handler
+
+        Returns:
+            JSON-serializable output dictionary
 
+        Raises:
+            InvalidOutputError: If handler returned a non-dict
+        """
         # Validate output is dict
         if not isinstance(result, dict):
             actual_type = type(result).__name__
@@ -327,11 +516,12 @@ class HandlerAdapter:
         # Deep serialize result to ensure JSON-serializable output
         result = serialize_for_json(result)
 
-        logger.debug(
-            "Handler invocation completed",
-            handler_path=self._handler_path,
-            output_keys=list(result.keys()),
-        )
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "Handler invocation completed",
+                handler_path=self._handler_path,
+                output_keys=list(result.keys()),
+            )
 
         return result
 
@@ -339,7 +529,9 @@ class HandlerAdapter:
         self, payload: Dict[str, Any], context: Optional[Any] = None
     ) -> Dict[str, Any]:
         """
-        Invoke async handler, running event loop if needed.
+        Invoke async handler from synchronous code on the shared background loop.
+
+        Prefer ainvoke() from async callers; this path exists for sync callers.
 
         Args:
             payload: Input dictionary
@@ -348,33 +540,18 @@ class HandlerAdapter:
         Returns:
             Output dictionary from async handler
         """
-        # Capture handler reference for thread-safe closure
         handler = self._handler
-        accepts_context = self._accepts_context
         assert handler is not None, "Handler not loaded"
 
-        def run_in_new_loop() -> Dict[str, Any]:
-            """Run the async handler in a fresh event loop (for executor thread)."""
-            if accepts_context and context is not None:
-                return asyncio.run(handler(payload, context))
-            return asyncio.run(handler(payload))
+        if self._accepts_context and context is not None:
+            coro = handler(payload, context)
+        else:
+            coro = handler(payload)
 
-        try:
-            # Try to get running loop
-            asyncio.get_running_loop()
-            # We're already in an async context - run in separate thread
-            # to avoid nested event loop issues
-            import concurrent.futures
-
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                # Defer coroutine creation until inside executor thread
-                future = executor.submit(run_in_new_loop)
-                return future.result()
-        except RuntimeError:
-            # No running loop - create one directly
-            if accepts_context and context is not None:
-                return asyncio.run(handler(payload, context))
-            return asyncio.run(handler(payload))
+        # Run on the shared background loop instead of creating (and tearing
+        # down) an event loop per call. This also works when the caller is
+        # already inside a running loop.
+        return _run_coroutine_sync(coro)
 
     def get_metadata(self) -> Dict[str, Any]:
         """
@@ -17,9 +17,14 @@ Usage:
     result = adapter.invoke({"document_text": "INVOICE #123..."})
 """
 
+import asyncio
 import importlib
 import inspect
-from typing import Any, AsyncIterator, Callable, Dict, Optional
+import sys
+import time
+import weakref
+from functools import lru_cache
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
 
 from dockrion_common import get_logger, validate_entrypoint
 
@@ -36,6 +41,59 @@ from .serialization import serialize_for_json
 
 logger = get_logger("langgraph-adapter")
 
+# Runners built by each factory, shared by every adapter that loads it, with the
+# capabilities detected when the runner was validated: (runner, supports_config,
+# supports_streaming, supports_async). Keyed by the factory object so a reloaded
+# module (new factory) builds and validates a fresh runner.
+_RUNNER_CACHE: "weakref.WeakKeyDictionary[Callable[..., Any], Tuple[Any, bool, bool, bool]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Whether invoke() accepts a config argument, per underlying invoke function
+# (signature inspection is slow and the answer is the same for every runner
+# whose invoke() is that function, whichever class or instance it is bound to)
+_CONFIG_SUPPORT: "weakref.WeakKeyDictionary[Callable[..., Any], bool]" = weakref.WeakKeyDictionary()
+
+# Marks a factory missing from the agent module (None is a valid attribute value)
+_MISSING = object()
+
+# Seconds after a successful invocation during which health_check() trusts it
+# instead of sending a probe invocation to the agent
+_HEALTH_CHECK_TTL = 5.0
+
+
+@lru_cache(maxsize=None)
+def _langgraph_graph_types() -> Optional[Tuple[type, ...]]:
+    """Return the LangGraph compiled-graph types, or None if langgraph isn't installed.
+
+    Imported lazily (langgraph is heavy and optional) and resolved once per
+    process, so strict loads don't repeat the import or its failure.
+    """
+    try:
+        from langgraph.pregel import Pregel
+    except ImportError:
+        return None
+
+    try:
+        from langgraph.graph.state import CompiledStateGraph
+    except ImportError:
+        # Older versions might not have CompiledStateGraph
+        return (Pregel,)
+    return (Pregel, CompiledStateGraph)
+
+
+def _import_module(module_path: str) -> Any:
+    """Import a module, returning it straight from sys.modules when fully imported.
+
+    A module that is still initializing (e.g. an entrypoint loaded from code run
+    during its own import) goes through import_module() so the normal import
+    lock and error handling apply.
+    """
+    module = sys.modules.get(module_path)
+    if module is None or getattr(getattr(module, "__spec__", None), "_initializing", False):
+        module = importlib.import_module(module_path)
+    return module
+
 
 # =============================================================================
 # LangGraph Stream Output Handlers
@@ -464,6 +522,17 @@ class LangGraphAdapter:
         ... )
     """
 
+    __slots__ = (
+        "_runner",
+        "_runner_invoke",
+        "_entrypoint",
+        "_strict_validation",
+        "_supports_streaming",
+        "_supports_async",
+        "_supports_config",
+        "_last_success_at",
+    )
+
     def __init__(self, strict_validation: bool = False):
         """
         Initialize adapter with optional strict validation.
@@ -482,21 +551,36 @@ class LangGraphAdapter:
             >>> adapter = LangGraphAdapter(strict_validation=True)
         """
         self._runner: Optional[Any] = None
+        self._runner_invoke: Optional[Callable[..., Any]] = None
         self._entrypoint: Optional[str] = None
         self._strict_validation: bool = strict_validation
         self._supports_streaming: bool = False
         self._supports_async: bool = False
         self._supports_config: bool = False
+        self._last_success_at: Optional[float] = None
 
         logger.debug("LangGraphAdapter initialized", strict_validation=strict_validation)
 
-    def _validate_langgraph_type(self) -> bool:
+    @staticmethod
+    def clear_cache() -> None:
+        """
+        Forget runners built by previous loads.
+
+        Useful for testing, or when a factory must be called again to pick up
+        changed state.
+        """
+        _RUNNER_CACHE.clear()
+
+    def _validate_langgraph_type(self, runner: Any = None) -> bool:
         """
         Strict validation: Check if agent is actual LangGraph compiled graph.
 
         Uses lazy imports to avoid requiring langgraph as a dependency.
         Only called when strict_validation=True.
 
+        Args:
+            runner: Runner to check (default: the loaded runner)
+
         Returns:
             True if validation passed or was skipped
             False if langgraph not installed (falls back to duck typing)
@@ -511,57 +595,45 @@ class LangGraphAdapter:
         """
         if not self._strict_validation:
             return False  # Skip strict validation
+        if runner is None:
+            runner = self._runner
 
-        try:
-            # Lazy import - only when strict validation requested
-            from langgraph.pregel import Pregel
-
-            # Try to import CompiledStateGraph (newer LangGraph versions)
-            valid_types: tuple[type, ...]
-            try:
-                from langgraph.graph.state import CompiledStateGraph
-
-                valid_types = (Pregel, CompiledStateGraph)
-            except ImportError:
-                # Older versions might not have CompiledStateGraph
-                valid_types = (Pregel,)
-
-            if not isinstance(self._runner, valid_types):
-                agent_type = type(self._runner).__name__
-                agent_module = type(self._runner).__module__
-                expected_types = [t.__name__ for t in valid_types]
-
-                logger.error(
-                    "Strict validation failed: Invalid LangGraph type",
-                    agent_type=agent_type,
-                    agent_module=agent_module,
-                    expected_types=expected_types,
-                )
-
-                raise InvalidAgentError(
-                    f"Strict validation failed: Agent is not a LangGraph compiled graph. "
-                    f"Expected types: {expected_types}, "
-                    f"Got: {agent_type} from module '{agent_module}'. "
-                    f"Hint: Ensure your factory returns graph.compile(). "
-                    f"If using a custom agent, disable strict_validation."
-                )
-
-            logger.debug(
-                "Strict validation passed",
-                agent_type=type(self._runner).__name__,
-                valid_types=[t.__name__ for t in valid_types],
-            )
-            return True
-
-        except ImportError as e:
+        valid_types = _langgraph_graph_types()
+        if valid_types is None:
             logger.warning(
                 "Strict validation requested but LangGraph not installed. "
                 "Falling back to duck typing validation. "
                 "Install langgraph for strict type checking: pip install langgraph",
-                error=str(e),
             )
             return False
 
+        if not isinstance(runner, valid_types):
+            agent_type = type(runner).__name__
+            agent_module = type(runner).__module__
+            expected_types = [t.__name__ for t in valid_types]
+
+            logger.error(
+                "Strict validation failed: Invalid LangGraph type",
+                agent_type=agent_type,
+                agent_module=agent_module,
+                expected_types=expected_types,
+            )
+
+            raise InvalidAgentError(
+                f"Strict validation failed: Agent is not a LangGraph compiled graph. "
+                f"Expected types: {expected_types}, "
+                f"Got: {agent_type} from module '{agent_module}'. "
+                f"Hint: Ensure your factory returns graph.compile(). "
+                f"If using a custom agent, disable strict_validation."
+            )
+
+        logger.debug(
+            "Strict validation passed",
+            agent_type=type(runner).__name__,
+            valid_types=[t.__name__ for t in valid_types],
+        )
+        return True
+
     def _validate_invoke_signature(self) -> bool:
         """
         Validate invoke() method signature and detect config support.
@@ -579,7 +651,32 @@ class LangGraphAdapter:
             InvalidAgentError: If invoke() signature is invalid
         """
         assert self._runner is not None, "Cannot validate signature before loading agent"
-        invoke_method = self._runner.invoke
+        supports_config = self._detect_config_support(self._runner)
+        self._supports_config = bool(supports_config)
+        return supports_config is not None
+
+    def _detect_config_support(self, runner: Any) -> Optional[bool]:
+        """
+        Check a runner's invoke() signature and report whether it accepts config.
+
+        Returns:
+            Whether invoke() takes a config argument, or None if the signature
+            could not be inspected (treated as no config support)
+
+        Raises:
+            InvalidAgentError: If invoke() signature is invalid
+        """
+        invoke_method = runner.invoke
+        # Bound methods share their function, so instances (and subclasses that
+        # don't override invoke) hit the same cache entry
+        invoke_func = getattr(invoke_method, "__func__", invoke_method)
+        try:
+            cached = _CONFIG_SUPPORT.get(invoke_func)
+        except TypeError:  # Not weakly referenceable or not hashable
+            invoke_func = None
+            cached = None
+        if cached is not None:
+            return cached
 
         try:
             sig = inspect.signature(invoke_method)
@@ -600,26 +697,83 @@ class LangGraphAdapter:
 
             # Check if config parameter is supported
             # LangGraph typically has: invoke(input, config=None, **kwargs)
-            self._supports_config = len(params) >= 2 or any(
+            supports_config = len(params) >= 2 or any(
                 param.kind == inspect.Parameter.VAR_KEYWORD for param in sig.parameters.values()
             )
 
-            if self._supports_config:
+            if supports_config:
                 logger.debug("Agent supports config parameter", signature=str(sig), params=params)
             else:
                 logger.debug(
                     "Agent does not support config parameter", signature=str(sig), params=params
                 )
 
-            return True
+            if invoke_func is not None:
+                _CONFIG_SUPPORT[invoke_func] = supports_config
+            return supports_config
 
         except Exception as e:
             logger.warning(
                 "Could not inspect invoke() signature. Assuming no config support.", error=str(e)
             )
             # Don't fail - signature inspection is best-effort
-            self._supports_config = False
-            return False
+            return None
+
+    def _inspect_runner(self, runner: Any) -> Tuple[bool, bool, bool]:
+        """
+        Validate a freshly built runner and detect its capabilities.
+
+        Runs steps 5-8 and 10 of load(): invoke() presence and signature, strict
+        or soft LangGraph type check, and streaming/async support.
+
+        Does not touch the adapter, so a runner that fails validation leaves the
+        previously loaded agent in place.
+
+        Args:
+            runner: Object returned by the agent factory
+
+        Returns:
+            (supports_config, supports_streaming, supports_async)
+
+        Raises:
+            InvalidAgentError: If the runner can't be invoked or fails strict validation
+        """
+        # Step 5: Validate agent has .invoke() method
+        if not hasattr(runner, "invoke"):
+            agent_type = type(runner).__name__
+            logger.error("Agent missing invoke method", agent_type=agent_type)
+            raise InvalidAgentError(
+                f"Agent must have .invoke() method. Got type: {agent_type}. "
+                f"Hint: For LangGraph, ensure you return graph.compile(), not the graph itself."
+            )
+
+        # Step 6: Check if invoke is callable
+        if not callable(runner.invoke):
+            agent_type = type(runner).__name__
+            logger.error("Agent invoke is not callable", agent_type=agent_type)
+            raise InvalidAgentError(f"Agent .invoke() must be callable. Got type: {agent_type}")
+
+        # Step 7: Validate invoke() signature and detect config support
+        supports_config = bool(self._detect_config_support(runner))
+
+        # Step 8: Perform strict type validation if enabled
+        if self._strict_validation:
+            self._validate_langgraph_type(runner)
+        else:
+            # Soft validation - just log warning if not LangGraph type
+            agent_module = type(runner).__module__
+            if not agent_module.startswith("langgraph"):
+                logger.warning(
+                    "Agent may not be a LangGraph type. "
+                    "Enable strict_validation=True for type checking.",
+                    agent_type=type(runner).__name__,
+                    agent_module=agent_module,
+                )
+
+        # Step 10: Check for optional methods (Phase 2 features)
+        supports_streaming = hasattr(runner, "stream") and callable(runner.stream)
+        supports_async = hasattr(runner, "ainvoke") and callable(runner.ainvoke)
+        return supports_config, supports_streaming, supports_async
 
     def load(self, entrypoint: str) -> None:
         """
@@ -629,11 +783,16 @@ class LangGraphAdapter:
         1. Validate entrypoint format (module.path:callable)
         2. Import module dynamically
         3. Get factory function
-        4. Call factory to get compiled graph
+        4. Call factory to get compiled graph (once per factory: later loads of
+           the same entrypoint reuse the graph until clear_cache() is called)
         5. Validate graph has .invoke() method
         6. Store graph for invocations
         7. Check for optional methods (stream, ainvoke)
 
+        Note: the runner is shared by every adapter in the process that loads
+        the same factory, including any state it keeps between invocations
+        (e.g. per-thread memory). Call clear_cache() first to get a fresh one.
+
         Args:
             entrypoint: Format "module.path:callable"
                        Example: "examples.invoice_copilot.app.graph:build_graph"
@@ -664,7 +823,7 @@ class LangGraphAdapter:
         # Step 2: Import module
         try:
             logger.debug("Importing module", module=module_path)
-            module = importlib.import_module(module_path)
+            module = _import_module(module_path)
         except ImportError as e:
             logger.error("Module import failed", module=module_path, error=str(e))
             raise ModuleNotFoundError(
@@ -677,8 +836,15 @@ class LangGraphAdapter:
                 f"Failed to import module '{module_path}': {type(e).__name__}: {e}"
             ) from e
 
-        # Step 3: Get factory function
-        if not hasattr(module, callable_name):
+        # Step 3: Get factory function (one attribute lookup for hit and miss)
+        try:
+            factory: Any = getattr(module, callable_name, _MISSING)
+        except Exception as e:
+            logger.error("Failed to get callable", callable=callable_name, error=str(e))
+            raise AdapterLoadError(
+                f"Failed to get callable '{callable_name}' from module '{module_path}': {e}"
+            ) from e
+        if factory is _MISSING:
             # Get available functions for helpful error message
             available = [name for name in dir(module) if not name.startswith("_")]
             logger.error(
@@ -690,65 +856,55 @@ class LangGraphAdapter:
             raise CallableNotFoundError(
                 module_path=module_path, callable_name=callable_name, available=available[:10]
             )
+        logger.debug("Factory function found", callable=callable_name)
 
+        # Step 4: Call factory to get agent (once per factory, see _RUNNER_CACHE)
         try:
-            factory = getattr(module, callable_name)
-            logger.debug("Factory function found", callable=callable_name)
-        except Exception as e:
-            logger.error("Failed to get callable", callable=callable_name, error=str(e))
-            raise AdapterLoadError(
-                f"Failed to get callable '{callable_name}' from module '{module_path}': {e}"
-            ) from e
-
-        # Step 4: Call factory to get agent
-        try:
-            logger.debug("Calling factory function", factory=callable_name)
-            self._runner = factory()
-        except Exception as e:
-            logger.error("Factory function failed", factory=callable_name, error=str(e))
-            raise AdapterLoadError(
-                f"Factory function '{callable_name}' failed: {type(e).__name__}: {e}. "
-                f"Hint: Check your agent code for errors."
-            ) from e
-
-        # Step 5: Validate agent has .invoke() method
-        if not hasattr(self._runner, "invoke"):
-            agent_type = type(self._runner).__name__
-            logger.error("Agent missing invoke method", agent_type=agent_type)
-            raise InvalidAgentError(
-                f"Agent must have .invoke() method. Got type: {agent_type}. "
-                f"Hint: For LangGraph, ensure you return graph.compile(), not the graph itself."
-            )
-
-        # Step 6: Check if invoke is callable
-        if not callable(self._runner.invoke):
-            agent_type = type(self._runner).__name__
-            logger.error("Agent invoke is not callable", agent_type=agent_type)
-            raise InvalidAgentError(f"Agent .invoke() must be callable. Got type: {agent_type}")
+            cached = _RUNNER_CACHE.get(factory)
+        except TypeError:  # Factory can't be weakly referenced
+            cached = None
+
+        if cached is not None:
+            # Steps 5-8: The runner passed them on an earlier load; reuse its
+            # capabilities and only repeat the per-adapter strict type check
+            runner, supports_config, supports_streaming, supports_async = cached
+            if self._strict_validation:
+                self._validate_langgraph_type(runner)
+        else:
+            try:
+                logger.debug("Calling factory function", factory=callable_name)
+                runner = factory()
+            except Exception as e:
+                logger.error("Factory function failed", factory=callable_name, error=str(e))
+                raise AdapterLoadError(
+                    f"Factory function '{callable_name}' failed: {type(e).__name__}: {e}. "
+                    f"Hint: Check your agent code for errors."
+                ) from e
 
-        # Step 7: Validate invoke() signature and detect config support
-        self._validate_invoke_signature()
+            supports_config, supports_streaming, supports_async = self._inspect_runner(runner)
 
-        # Step 8: Perform strict type validation if enabled
-        if self._strict_validation:
-            self._validate_langgraph_type()
-        else:
-            # Soft validation - just log warning if not LangGraph type
-            agent_module = type(self._runner).__module__
-            if not agent_module.startswith("langgraph"):
-                logger.warning(
-                    "Agent may not be a LangGraph type. "
-                    "Enable strict_validation=True for type checking.",
-                    agent_type=type(self._runner).__name__,
-                    agent_module=agent_module,
+            # Only validated runners are reused by later loads
+            try:
+                _RUNNER_CACHE[factory] = (
+                    runner,
+                    supports_config,
+                    supports_streaming,
+                    supports_async,
                 )
+            except TypeError:
+                pass
 
-        # Step 9: Store entrypoint
+        # Step 9: Store the agent. Everything above only used locals, so a load
+        # that fails validation keeps the previous agent fully intact; from here
+        # the runner, its bound invoke and its capabilities change together.
+        self._runner = runner
+        # Bind the agent's invoke once so the per-request path skips the lookup
+        self._runner_invoke = runner.invoke
+        self._supports_config = supports_config
+        self._supports_streaming = supports_streaming
+        self._supports_async = supports_async
         self._entrypoint = entrypoint
-
-        # Step 10: Check for optional methods (Phase 2 features)
-        self._supports_streaming = hasattr(self._runner, "stream") and callable(self._runner.stream)
-        self._supports_async = hasattr(self._runner, "ainvoke") and callable(self._runner.ainvoke)
+        self._last_success_at = None
 
         logger.info(
             "✅ LangGraph agent loaded successfully",
@@ -825,19 +981,13 @@ class LangGraphAdapter:
             >>> result = adapter.invoke(payload, context=stream_context)
         """
         # Step 1: Check adapter is loaded
-        if self._runner is None:
+        runner_invoke = self._runner_invoke
+        if runner_invoke is None:
             logger.error("Invoke called before load")
             raise AdapterNotLoadedError()
 
         # Step 2: Validate config usage
-        if config and not self._supports_config:
-            logger.warning(
-                "Config provided but agent's invoke() doesn't support config parameter. "
-                "Config will be ignored. This may happen with custom agents or older LangGraph versions.",
-                config_keys=list(config.keys()),
-                agent_type=type(self._runner).__name__,
-            )
-            config = None  # Ignore config if not supported
+        config = self._resolve_config(config)
 
         # Set thread-local context if provided
         if context is not None:
@@ -849,55 +999,108 @@ class LangGraphAdapter:
                 pass  # Events package not installed
 
         # Step 3: Log invocation start
-        logger.debug(
-            "LangGraph agent invocation started",
-            entrypoint=self._entrypoint,
-            input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
-            has_config=config is not None,
-            config_keys=list(config.keys()) if config else None,
-            has_context=context is not None,
-        )
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "LangGraph agent invocation started",
+                entrypoint=self._entrypoint,
+                input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
+                has_config=config is not None,
+                config_keys=list(config.keys()) if config else None,
+                has_context=context is not None,
+            )
 
         # Step 4: Invoke agent
         try:
-            # Add context to config if supported
-            invoke_config = config.copy() if config else {}
-            if context is not None and self._supports_config:
-                invoke_config["stream_context"] = context
-
-            if invoke_config and self._supports_config:
-                # Pass config to LangGraph for state management
-                result = self._runner.invoke(payload, config=invoke_config)
+            if self._supports_config and (config or context is not None):
+                # Pass config (plus context, if any) to LangGraph for state management
+                invoke_config = config.copy() if config else {}
+                if context is not None:
+                    invoke_config["stream_context"] = context
+                result = runner_invoke(payload, config=invoke_config)
             else:
-                # Simple invocation without config
-                result = self._runner.invoke(payload)
-        except TypeError as e:
-            # Common error: wrong input format or config format
-            logger.error(
-                "Agent invocation failed with TypeError",
-                error=str(e),
-                payload_type=type(payload).__name__,
-                has_config=config is not None,
-            )
-            raise AgentExecutionError(
-                f"LangGraph invocation failed with TypeError: {e}. "
-                f"Hint: Check that your input matches the agent's expected format. "
-                f"If using config, ensure agent supports config parameter."
-            ) from e
+                # Simple invocation without config (no per-call dict copy)
+                result = runner_invoke(payload)
         except Exception as e:
-            # General execution error
-            logger.error(
-                "Agent invocation failed",
-                error=str(e),
-                error_type=type(e).__name__,
+            raise self._invocation_error(e, payload, config) from e
+        finally:
+            # Step 5: Clear thread-local context (always, even on exception)
+            if context is not None:
+                try:
+                    from dockrion_events import set_current_context
+
+                    set_current_context(None)
+                except ImportError:
+                    pass
+
+        # Steps 6-8: Validate, serialize and log the output
+        return self._process_result(result)
+
+    async def ainvoke(
+        self,
+        payload: Dict[str, Any],
+        config: Optional[Dict[str, Any]] = None,
+        context: Optional[Any] = None,
+    ) -> Dict[str, Any]:
+        """
+        Async version of invoke().
+
+        Agents exposing a native ``.ainvoke()`` are awaited directly on the
+        caller's event loop. Other agents are run through invoke() in the
+        default thread pool so they never block the loop.
+
+        Args:
+            payload: Input dictionary (matches io_schema.input)
+            config: Optional LangGraph configuration dict (see invoke())
+            context: Optional StreamContext for emitting events
+
+        Returns:
+            Output dictionary (matches io_schema.output)
+
+        Raises:
+            AdapterNotLoadedError: If load() not called
+            AgentExecutionError: If agent invocation fails
+            InvalidOutputError: If agent returns non-dict
+
+        Examples:
+            >>> result = await adapter.ainvoke({"query": "hello"})
+        """
+        if self._runner is None:
+            logger.error("Invoke called before load")
+            raise AdapterNotLoadedError()
+
+        if not self._supports_async:
+            return await asyncio.to_thread(self.invoke, payload, config, context)
+
+        config = self._resolve_config(config)
+
+        if context is not None:
+            try:
+                from dockrion_events import set_current_context
+
+                set_current_context(context)
+            except ImportError:
+                pass  # Events package not installed
+
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "LangGraph agent async invocation started",
                 entrypoint=self._entrypoint,
+                input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
                 has_config=config is not None,
+                has_context=context is not None,
             )
-            raise AgentExecutionError(
-                f"LangGraph invocation failed: {type(e).__name__}: {e}"
-            ) from e
+
+        try:
+            if self._supports_config and (config or context is not None):
+                invoke_config = config.copy() if config else {}
+                if context is not None:
+                    invoke_config["stream_context"] = context
+                result = await self._runner.ainvoke(payload, config=invoke_config)
+            else:
+                result = await self._runner.ainvoke(payload)
+        except Exception as e:
+            raise self._invocation_error(e, payload, config) from e
         finally:
-            # Step 5: Clear thread-local context (always, even on exception)
             if context is not None:
                 try:
                     from dockrion_events import set_current_context
@@ -906,7 +1109,141 @@ class LangGraphAdapter:
                 except ImportError:
                     pass
 
-        # Step 6: Validate output is dict
+        return self._process_result(result)
+
+    def batch_invoke(
+        self, payloads: List[Dict[str, Any]], return_exceptions: bool = False
+    ) -> List[Union[Dict[str, Any], Exception]]:
+        """
+        Invoke LangGraph agent for several payloads in one call.
+
+        Uses the agent's ``.batch()`` when available (LangGraph/LangChain
+        runnables run the inputs concurrently); otherwise falls back to
+        calling invoke() for each payload.
+
+        Args:
+            payloads: Input dictionaries (each matches io_schema.input)
+            return_exceptions: Return per-payload exceptions in the result
+                list instead of raising the first one
+
+        Returns:
+            Output dictionary (or exception) for each payload, in order
+
+        Raises:
+            AdapterNotLoadedError: If load() not called
+            AgentExecutionError: If an agent invocation fails
+            InvalidOutputError: If agent returns non-dict
+        """
+        if self._runner is None:
+            logger.error("Invoke called before load")
+            raise AdapterNotLoadedError()
+
+        results: List[Union[Dict[str, Any], Exception]] = []
+
+        if not hasattr(self._runner, "batch"):
+            for payload in payloads:
+                try:
+                    results.append(self.invoke(payload))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+        logger.debug(
+            "LangGraph agent batch invocation started",
+            entrypoint=self._entrypoint,
+            batch_size=len(payloads),
+        )
+
+        try:
+            raw_results = self._runner.batch(payloads, return_exceptions=True)
+        except Exception as e:
+            raise self._invocation_error(e, payloads, None) from e
+
+        for payload, raw in zip(payloads, raw_results, strict=True):
+            try:
+                if isinstance(raw, Exception):
+                    raise self._invocation_error(raw, payload, None) from raw
+                results.append(self._process_result(raw))
+            except Exception as e:
+                if not return_exceptions:
+                    raise
+                results.append(e)
+
+        return results
+
+    def _resolve_config(self, config: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Drop config (with a warning) if the agent's invoke() can't accept it.
+
+        Args:
+            config: Config passed by the caller
+
+        Returns:
+            Config to use, or None if unsupported
+        """
+        if config and not self._supports_config:
+            logger.warning(
+                "Config provided but agent's invoke() doesn't support config parameter. "
+                "Config will be ignored. This may happen with custom agents or older LangGraph versions.",
+                config_keys=list(config.keys()),
+                agent_type=type(self._runner).__name__,
+            )
+            return None  # Ignore config if not supported
+        return config
+
+    def _invocation_error(
+        self, error: Exception, payload: Any, config: Optional[Dict[str, Any]]
+    ) -> AgentExecutionError:
+        """
+        Log an agent failure and build the AgentExecutionError to raise.
+
+        Args:
+            error: Exception raised by the agent
+            payload: Payload the agent was called with
+            config: Config the agent was called with
+
+        Returns:
+            AgentExecutionError describing the failure
+        """
+        if isinstance(error, TypeError):
+            # Common error: wrong input format or config format
+            logger.error(
+                "Agent invocation failed with TypeError",
+                error=str(error),
+                payload_type=type(payload).__name__,
+                has_config=config is not None,
+            )
+            return AgentExecutionError(
+                f"LangGraph invocation failed with TypeError: {error}. "
+                f"Hint: Check that your input matches the agent's expected format. "
+                f"If using config, ensure agent supports config parameter."
+            )
+
+        # General execution error
+        logger.error(
+            "Agent invocation failed",
+            error=str(error),
+            error_type=type(error).__name__,
+            entrypoint=self._entrypoint,
+            has_config=config is not None,
+        )
+        return AgentExecutionError(f"LangGraph invocation failed: {type(error).__name__}: {error}")
+
+    def _process_result(self, result: Any) -> Dict[str, Any]:
+        """
+        Validate agent output and make it JSON-serializable.
+
+        Args:
+            result: Raw value returned by the agent
+
+        Returns:
+            JSON-serializable output dictionary
+
+        Raises:
+            InvalidOutputError: If agent returned a non-dict
+        """
         if not isinstance(result, dict):
             actual_type = type(result).__name__
             logger.error(
@@ -920,17 +1257,17 @@ class LangGraphAdapter:
                 actual_type=type(result),
             )
 
-        # Step 7: Deep serialize result to ensure JSON-serializable output
+        # Deep serialize result to ensure JSON-serializable output
         result = serialize_for_json(result)
+        self._last_success_at = time.monotonic()
 
-        # Step 8: Log success
-        logger.debug(
-            "LangGraph agent invocation completed",
-            entrypoint=self._entrypoint,
-            output_keys=list(result.keys()),
-        )
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "LangGraph agent invocation completed",
+                entrypoint=self._entrypoint,
+                output_keys=list(result.keys()),
+            )
 
-        # Step 9: Return result
         return result
 
     async def invoke_stream(
@@ -973,7 +1310,6 @@ class LangGraphAdapter:
             >>> async for event in adapter.invoke_stream(payload, events_filter=filter):
             ...     print(f"Event: {event.get('type')}")
         """
-        import asyncio
         import queue as queue_module
         import threading
         import uuid as uuid_module
@@ -1039,13 +1375,14 @@ class LangGraphAdapter:
                 modes=stream_modes,
             )
 
-        logger.debug(
-            "LangGraph streaming started",
-            entrypoint=self._entrypoint,
-            input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
-            has_filter=events_filter is not None,
-            stream_modes=stream_modes,
-        )
+        if logger.is_enabled_for("debug"):
+            logger.debug(
+                "LangGraph streaming started",
+                entrypoint=self._entrypoint,
+                input_keys=list(payload.keys()) if isinstance(payload, dict) else "non-dict",
+                has_filter=events_filter is not None,
+                stream_modes=stream_modes,
+            )
 
         # Use a queue to bridge sync stream to async iteration
         result_queue: queue_module.Queue[Dict[str, Any] | None | Exception] = queue_module.Queue()
@@ -1265,6 +1602,9 @@ class LangGraphAdapter:
         - Adapter is loaded
         - Agent is responsive (can handle test invocation)
 
+        An invocation that succeeded within the last few seconds counts as a
+        passed check, so busy adapters aren't probed on every call.
+
         Returns:
             True if healthy, False otherwise
 
@@ -1276,6 +1616,11 @@ class LangGraphAdapter:
             logger.debug("Health check failed: adapter not loaded")
             return False
 
+        last_success_at = self._last_success_at
+        if last_success_at is not None and time.monotonic() - last_success_at < _HEALTH_CHECK_TTL:
+            logger.debug("Health check passed (recent invocation)")
+            return True
+
         try:
             # Quick test invocation with minimal payload
             # Many LangGraph agents ignore unexpected keys
@@ -76,8 +76,9 @@ def get_adapter(framework: str) -> AgentAdapter:
         ValidationError: Unsupported framework: 'unsupported'
     """
     framework_lower = framework.lower().strip()
+    adapter_class = _ADAPTER_REGISTRY.get(framework_lower)
 
-    if framework_lower not in _ADAPTER_REGISTRY:
+    if adapter_class is None:
         supported = ", ".join(sorted(_ADAPTER_REGISTRY.keys()))
         logger.error(
             "Unsupported framework requested", framework=framework, supported_frameworks=supported
@@ -86,7 +87,6 @@ def get_adapter(framework: str) -> AgentAdapter:
             f"Unsupported framework: '{framework}'. Supported frameworks: {supported}"
         )
 
-    adapter_class = _ADAPTER_REGISTRY[framework_lower]
     adapter = adapter_class()
 
     logger.debug("Adapter created", framework=framework_lower)
@@ -215,15 +215,14 @@ def get_adapter_info(framework: str) -> Dict[str, Any]:
         }
     """
     framework_lower = framework.lower().strip()
+    adapter_class = _ADAPTER_REGISTRY.get(framework_lower)
 
-    if framework_lower not in _ADAPTER_REGISTRY:
+    if adapter_class is None:
         supported = ", ".join(sorted(_ADAPTER_REGISTRY.keys()))
         raise ValidationError(
             f"Unsupported framework: '{framework}'. Supported frameworks: {supported}"
         )
 
-    adapter_class = _ADAPTER_REGISTRY[framework_lower]
-
     return {
         "framework": framework_lower,
         "adapter_class": adapter_class.__name__,
@@ -6,168 +6,480 @@ Used by adapters to ensure agent output can be serialized to JSON.
 """
 
 import uuid
+import weakref
+from dataclasses import fields
 from datetime import date, datetime, time, timedelta
 from decimal import Decimal
 from enum import Enum
+from functools import partial
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import Any, Callable, Dict, Final, List, Set, Tuple, Union
+
+try:
+    import orjson
+except ImportError:  # Optional: pip install dockrion-adapters[fast]
+    orjson = None  # type: ignore[assignment]
 
 # Type alias for JSON-serializable types
 JsonSerializable = Union[None, bool, int, float, str, List[Any], Dict[str, Any]]
 
 
-def deep_serialize(obj: Any, max_depth: int = 50, _depth: int = 0) -> JsonSerializable:
-    """
-    Recursively convert Python objects to JSON-serializable types.
-
-    Handles:
-    - Primitives (None, bool, int, float, str)
-    - Collections (list, tuple, set, dict)
-    - Pydantic models (v1 and v2)
-    - Dataclasses
-    - datetime objects
-    - UUID, Decimal, Enum, Path
-    - Custom classes (via __dict__ or str fallback)
-
-    Args:
-        obj: Any Python object to serialize
-        max_depth: Maximum recursion depth (prevents infinite loops)
-        _depth: Current recursion depth (internal)
-
-    Returns:
-        JSON-serializable Python object (dict, list, or primitive)
-
-    Examples:
-        >>> from langchain_core.messages import HumanMessage
-        >>> msg = HumanMessage(content="Hello")
-        >>> deep_serialize(msg)
-        {'content': 'Hello', 'type': 'human', ...}
+_enum_value = attrgetter("value")
 
-        >>> from dataclasses import dataclass
-        >>> @dataclass
-        ... class Point:
-        ...     x: int
-        ...     y: int
-        >>> deep_serialize(Point(1, 2))
-        {'x': 1, 'y': 2}
-    """
-    # Prevent infinite recursion
-    if _depth > max_depth:
-        return f"<max depth {max_depth} exceeded>"
 
-    # Already JSON-serializable primitives
-    if obj is None or isinstance(obj, (bool, int, float, str)):
-        return obj
+def _decode_bytes(obj: bytes) -> JsonSerializable:
+    # No isascii() pre-check: CPython's UTF-8 decoder already has an ASCII fast
+    # path, so the extra scan only slows long payloads, and binary data usually
+    # fails on an early byte, which keeps the exception path cheap.
+    try:
+        return obj.decode("utf-8")
+    except UnicodeDecodeError:
+        return f"<bytes: {len(obj)} bytes>"
+
+
+# Types that are returned as-is
+_PRIMITIVE_TYPES = frozenset({type(None), bool, int, float, str})
+
+# Mapping key types that need no str() conversion
+_STR_TYPES = frozenset({str})
+
+# Exact-type conversions for leaf values. Methods are registered unbound, so a
+# timestamp costs one call instead of an attribute lookup plus a call.
+# Subclasses (and Pydantic models, dataclasses, enums, ...) miss this table and
+# go through _resolve_fallback(), which adds enums and other value-type
+# subclasses here the first time it meets them.
+_LEAF_CONVERTERS: Dict[type, Callable[[Any], JsonSerializable]] = {
+    bytes: _decode_bytes,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    time: time.isoformat,
+    timedelta: timedelta.total_seconds,
+    uuid.UUID: str,
+    Decimal: float,
+    type(Path()): str,
+}
+
+# Size limit for _LEAF_CONVERTERS once value-type subclasses are registered in it
+_MAX_LEAF_CONVERTERS: Final = 512
+
+# Types converted by value in _resolve_fallback(), subclasses included
+_STRINGIFY_TYPES = (uuid.UUID, Path)
+_VALUE_TYPES = (datetime, date, time, timedelta, Decimal, Enum) + _STRINGIFY_TYPES
+
+# Model conversions (Pydantic v2, Pydantic v1, dataclass) each class supports, in
+# the order to try them, detected once per class. Weak keys let dynamically
+# created models be collected.
+_ModelConverter = Callable[[Any], Tuple[int, Any]]
+_MODEL_CONVERTERS: "weakref.WeakKeyDictionary[type, Tuple[_ModelConverter, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _model_converters(cls: type) -> Tuple[_ModelConverter, ...]:
+    """Return the model conversions supported by a class, in the order to try them."""
+    converters = _MODEL_CONVERTERS.get(cls)
+    if converters is None:
+        found: List[_ModelConverter] = []
+        if callable(getattr(cls, "model_dump", None)):
+            found.append(_dump_pydantic_v2)
+        elif callable(getattr(cls, "dict", None)) and hasattr(cls, "__fields__"):
+            found.append(_dump_pydantic_v1)
+        if hasattr(cls, "__dataclass_fields__"):
+            found.append(partial(_dataclass_field_values, tuple(f.name for f in fields(cls))))
+        converters = _MODEL_CONVERTERS[cls] = tuple(found)
+    return converters
+
+
+# Public __slots__ names per class for the slotted-object fallback, so the
+# underscore filtering happens once per class rather than once per instance
+_PUBLIC_SLOTS: "weakref.WeakKeyDictionary[type, Tuple[str, ...]]" = weakref.WeakKeyDictionary()
+
+
+def _public_slots(cls: type) -> Tuple[str, ...]:
+    """Return the names in a class's __slots__ that don't start with an underscore."""
+    names = _PUBLIC_SLOTS.get(cls)
+    if names is None:
+        slots: Any = getattr(cls, "__slots__", ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        names = _PUBLIC_SLOTS[cls] = tuple(slot for slot in slots if slot[:1] != "_")
+    return names
+
+
+def _dump_pydantic_v2(obj: Any) -> Tuple[int, Any]:
+    return _REPLACE, obj.model_dump()
+
+
+def _dump_pydantic_v1(obj: Any) -> Tuple[int, Any]:
+    return _REPLACE, obj.dict()
+
+
+def _dataclass_field_values(names: Tuple[str, ...], obj: Any) -> Tuple[int, Any]:
+    # Field values go straight to the traversal: unlike asdict() there is no
+    # deep copy of the values to walk a second time
+    return _FIELDS, {name: getattr(obj, name) for name in names}
+
+
+# How _resolve_fallback() asks the traversal to continue with an object.
+# Final lets mypyc inline them when the module is compiled (see setup.py).
+_VALUE: Final = 0  # payload is the final value
+_SEQUENCE: Final = 1  # payload is a sequence whose items are serialized into a list
+_MAPPING: Final = 2  # payload is a mapping whose values are serialized into a dict
+_REPLACE: Final = 3  # payload replaces the object, one level deeper
+_FIELDS: Final = 4  # payload is a fresh dict of attributes, filled in place one level deeper
+
+
+def _value_converter(cls: type) -> Callable[[Any], JsonSerializable]:
+    """Return the conversion for a subclass of one of the _VALUE_TYPES."""
+    if issubclass(cls, timedelta):
+        return cls.total_seconds
+    if issubclass(cls, (datetime, date, time)):
+        return cls.isoformat
+    if issubclass(cls, _STRINGIFY_TYPES):
+        return str
+    if issubclass(cls, Decimal):
+        return float
+    return _enum_value
+
+
+def _resolve_fallback(obj: Any, sort_sets: bool = False) -> Tuple[int, Any]:
+    """Classify an object that missed the exact-type fast paths."""
+    # Already JSON-serializable primitives (subclasses of the builtin types)
+    if isinstance(obj, (bool, int, float, str)):
+        return _VALUE, obj
 
     # Handle bytes
     if isinstance(obj, bytes):
-        try:
-            return obj.decode("utf-8")
-        except UnicodeDecodeError:
-            return f"<bytes: {len(obj)} bytes>"
+        return _VALUE, _decode_bytes(obj)
 
     # Handle lists and tuples
     if isinstance(obj, (list, tuple)):
-        return [deep_serialize(item, max_depth, _depth + 1) for item in obj]
+        return _SEQUENCE, obj
 
-    # Handle sets and frozensets
+    # Handle sets and frozensets (iteration order unless sorting was requested)
     if isinstance(obj, (set, frozenset)):
-        return [deep_serialize(item, max_depth, _depth + 1) for item in sorted(obj, key=str)]
+        return _SEQUENCE, sorted(obj, key=str) if sort_sets else obj
 
     # Handle dicts
     if isinstance(obj, dict):
-        return {str(k): deep_serialize(v, max_depth, _depth + 1) for k, v in obj.items()}
+        return _MAPPING, obj
 
     # === Special Types ===
 
-    # Pydantic v2 models (check first, more common)
-    if hasattr(obj, "model_dump") and callable(obj.model_dump):
+    # Pydantic models (v2 first, more common) and dataclasses
+    for convert in _model_converters(type(obj)):
         try:
-            return deep_serialize(obj.model_dump(), max_depth, _depth + 1)
+            return convert(obj)
         except Exception:
-            pass  # Fall through to other methods
-
-    # Pydantic v1 models
-    if hasattr(obj, "dict") and callable(obj.dict) and hasattr(obj, "__fields__"):
-        try:
-            return deep_serialize(obj.dict(), max_depth, _depth + 1)
-        except Exception:
-            pass
-
-    # Dataclasses
-    if hasattr(obj, "__dataclass_fields__"):
-        try:
-            from dataclasses import asdict
-
-            return deep_serialize(asdict(obj), max_depth, _depth + 1)
-        except Exception:
-            pass
-
-    # datetime types
-    if isinstance(obj, datetime):
-        return obj.isoformat()
-    if isinstance(obj, date):
-        return obj.isoformat()
-    if isinstance(obj, time):
-        return obj.isoformat()
-    if isinstance(obj, timedelta):
-        return obj.total_seconds()
-
-    # UUID
-    if isinstance(obj, uuid.UUID):
-        return str(obj)
-
-    # Decimal
-    if isinstance(obj, Decimal):
-        return float(obj)
-
-    # Enum
-    if isinstance(obj, Enum):
-        return obj.value
-
-    # Path
-    if isinstance(obj, Path):
-        return str(obj)
+            continue  # Fall through to other methods
+
+    # Value types (datetime family, UUID, Decimal, Enum, Path) behind one gate,
+    # so custom objects pay a single isinstance() before the generic fallbacks
+    if isinstance(obj, _VALUE_TYPES):
+        cls = type(obj)
+        converter = _value_converter(cls)
+        # Later instances of this class (enum members, datetime subclasses, ...)
+        # then take the exact-type fast path in deep_serialize(). Bounded so
+        # classes created at runtime can't grow the table without limit.
+        if len(_LEAF_CONVERTERS) < _MAX_LEAF_CONVERTERS:
+            _LEAF_CONVERTERS[cls] = converter
+        return _VALUE, converter(obj)
 
     # === Generic Fallbacks ===
 
     # Objects with __dict__ (most custom classes)
     if hasattr(obj, "__dict__"):
         # Filter out private/dunder attributes
-        obj_dict = {k: v for k, v in vars(obj).items() if not k.startswith("_")}
+        obj_dict = {k: v for k, v in vars(obj).items() if k[:1] != "_"}
         if obj_dict:
-            return deep_serialize(obj_dict, max_depth, _depth + 1)
+            return _FIELDS, obj_dict
 
     # Objects with __slots__
     if hasattr(obj, "__slots__"):
-        obj_dict = {
-            slot: getattr(obj, slot, None) for slot in obj.__slots__ if not slot.startswith("_")
-        }
+        obj_dict = {slot: getattr(obj, slot, None) for slot in _public_slots(type(obj))}
         if obj_dict:
-            return deep_serialize(obj_dict, max_depth, _depth + 1)
+            return _FIELDS, obj_dict
 
     # Callable (functions, methods)
     if callable(obj):
-        return f"<callable: {getattr(obj, '__name__', str(obj))}>"
+        return _VALUE, f"<callable: {getattr(obj, '__name__', str(obj))}>"
 
     # Last resort: string representation
     try:
-        return str(obj)
+        return _VALUE, str(obj)
     except Exception:
-        return f"<unserializable: {type(obj).__name__}>"
+        return _VALUE, f"<unserializable: {type(obj).__name__}>"
 
 
-def serialize_for_json(data: Dict[str, Any]) -> Dict[str, Any]:
+def deep_serialize(
+    obj: Any, max_depth: int = 50, _depth: int = 0, sort_sets: bool = False
+) -> JsonSerializable:
+    """
+    Convert Python objects (recursively, through nested values) to JSON-serializable types.
+
+    Handles:
+    - Primitives (None, bool, int, float, str)
+    - Collections (list, tuple, set, dict)
+    - Pydantic models (v1 and v2)
+    - Dataclasses
+    - datetime objects
+    - UUID, Decimal, Enum, Path
+    - Custom classes (via __dict__ or str fallback)
+
+    Args:
+        obj: Any Python object to serialize
+        max_depth: Maximum recursion depth (prevents infinite loops)
+        _depth: Starting depth (internal)
+        sort_sets: Sort set items by their string form for a deterministic order.
+            By default sets are emitted in iteration order.
+
+    Returns:
+        JSON-serializable Python object (dict, list, or primitive)
+
+    Examples:
+        >>> from langchain_core.messages import HumanMessage
+        >>> msg = HumanMessage(content="Hello")
+        >>> deep_serialize(msg)
+        {'content': 'Hello', 'type': 'human', ...}
+
+        >>> from dataclasses import dataclass
+        >>> @dataclass
+        ... class Point:
+        ...     x: int
+        ...     y: int
+        >>> deep_serialize(Point(1, 2))
+        {'x': 1, 'y': 2}
+    """
+    # Primitives and empty containers (no-op agent output) need none of the
+    # traversal state. Exact-type checks, so bool/str subclasses such as
+    # str-based enums still take the full path.
+    obj_type = type(obj)
+    if _depth <= max_depth:
+        if obj_type in _PRIMITIVE_TYPES:
+            return obj
+        if (obj_type is dict or obj_type is list or obj_type is tuple) and not obj:
+            return {} if obj_type is dict else []
+
+    # Walk the object graph with an explicit stack instead of recursion. Each
+    # entry writes its serialized value into parent[key]. Output containers are
+    # attached to their parent straight away; their non-primitive items are
+    # pushed and overwrite their slot once serialized.
+    root: List[Any] = [None]
+    stack: List[Tuple[Any, Any, Any, int]] = [(root, 0, obj, _depth)]
+    pop = stack.pop
+    push = stack.append
+    max_depth_marker = f"<max depth {max_depth} exceeded>"
+
+    # Module globals and builtins used per item, bound to locals for the loop
+    type_of = type
+    primitive_types = _PRIMITIVE_TYPES
+    str_types = _STR_TYPES
+    get_converter = _LEAF_CONVERTERS.get
+    resolve_fallback = _resolve_fallback
+    kind: int
+    payload: Any
+
+    # Cycle and shared-object tracking, keyed by id(). `memo` maps an object to
+    # the value built for it and `keep_alive` holds the objects so their ids stay
+    # unique; `active` holds objects whose items are still being serialized, so
+    # meeting one of them again means a cycle.
+    memo: Dict[int, Any] = {}
+    keep_alive: List[Any] = []
+    active: Set[int] = set()
+
+    while stack:
+        parent, key, item, depth = pop()
+
+        # Exit marker: every item below these objects has been serialized
+        if parent is None:
+            active.difference_update(key)
+            continue
+
+        # Objects that resolve to this entry's value (more than one when a
+        # model or custom object is replaced by its field dict)
+        sources: Any = None
+        while True:
+            # Prevent infinite recursion
+            if depth > max_depth:
+                value: Any = max_depth_marker
+                break
+
+            item_type = type_of(item)
+            if item_type in primitive_types:
+                value = item
+                break
+
+            if item_type is list or item_type is tuple:
+                kind, payload = _SEQUENCE, item
+            elif item_type is dict:
+                kind, payload = _MAPPING, item
+            elif item_type is set or item_type is frozenset:
+                # Sets hold only hashable items, so they can't contain cycles
+                kind, payload = _SEQUENCE, sorted(item, key=str) if sort_sets else item
+            else:
+                converter = get_converter(item_type)
+                if converter is not None:
+                    value = converter(item)
+                    break
+
+                # Models and custom objects are where reference cycles and shared
+                # state show up, so only they pay for cycle tracking
+                item_id = id(item)
+                if item_id in active:
+                    value = f"<cycle: {item_type.__name__}>"
+                    break
+                if item_id in memo:
+                    # Shared object: reuse the value built the first time
+                    value = memo[item_id]
+                    break
+                if sources is None:
+                    sources = [item_id]
+                else:
+                    sources.append(item_id)
+                keep_alive.append(item)
+
+                kind, payload = resolve_fallback(item, sort_sets)
+
+            if kind == _REPLACE:
+                item = payload
+                depth += 1
+                continue
+
+            # Primitive and leaf-convertible children (datetimes, UUIDs, ...) are
+            # written directly; only the rest are pushed.
+            # Pushing in reverse keeps items processed in their original order.
+            child_depth = depth + 1
+            if kind == _FIELDS:
+                # The attribute dict sits one level below its object, as with _REPLACE
+                if child_depth > max_depth:
+                    value = max_depth_marker
+                    break
+                child_depth += 1
+            if child_depth > max_depth:
+                # Every child is past the depth limit: write the marker for each
+                # one here rather than pushing them only to be replaced by it
+                if kind == _SEQUENCE:
+                    value = [max_depth_marker for _ in payload]
+                elif kind == _MAPPING:
+                    value = {k if type_of(k) is str else str(k): max_depth_marker for k in payload}
+                elif kind == _FIELDS:
+                    value = dict.fromkeys(payload, max_depth_marker)
+                else:
+                    value = payload
+                break
+            mark = len(stack)
+            # All-primitive containers (the common case for agent I/O) are copied
+            # after a single type scan done entirely in C.
+            if kind == _SEQUENCE:
+                value = list(payload)
+                if not primitive_types.issuperset(map(type_of, value)):
+                    for index in range(len(value) - 1, -1, -1):
+                        child = value[index]
+                        child_type = type_of(child)
+                        if child_type in primitive_types:
+                            continue
+                        converter = get_converter(child_type)
+                        if converter is not None:
+                            value[index] = converter(child)
+                            continue
+                        push((value, index, child, child_depth))
+            elif kind == _MAPPING:
+                if primitive_types.issuperset(
+                    map(type_of, payload.values())
+                ) and str_types.issuperset(map(type_of, payload)):
+                    value = dict(payload)
+                else:
+                    value = {}
+                    # Keyed by output key: when str(k) collides the last entry wins
+                    pending: Dict[str, Any] = {}
+                    for k, child in payload.items():
+                        entry_key = k if type_of(k) is str else str(k)
+                        child_type = type_of(child)
+                        if child_type in primitive_types:
+                            value[entry_key] = child
+                            pending.pop(entry_key, None)
+                            continue
+                        converter = get_converter(child_type)
+                        if converter is not None:
+                            value[entry_key] = converter(child)
+                            pending.pop(entry_key, None)
+                            continue
+                        value[entry_key] = child
+                        pending[entry_key] = child
+                    for entry_key, child in reversed(pending.items()):
+                        push((value, entry_key, child, child_depth))
+            elif kind == _FIELDS:
+                # Attribute names are already str: serialize values in place
+                value = payload
+                for k, child in reversed(payload.items()):
+                    child_type = type_of(child)
+                    if child_type in primitive_types:
+                        continue
+                    converter = get_converter(child_type)
+                    if converter is not None:
+                        value[k] = converter(child)
+                        continue
+                    push((value, k, child, child_depth))
+            else:
+                value = payload
+
+            if sources is not None and len(stack) > mark:
+                # Items were pushed: mark the sources active until they are done
+                # and remember the value for later references to the same object
+                for source_id in sources:
+                    memo[source_id] = value
+                active.update(sources)
+                stack.insert(mark, (None, sources, None, 0))
+            break
+
+        parent[key] = value
+
+    return root[0]
+
+
+def _is_flat_json(data: Any) -> bool:
+    """Return True for a str-keyed dict of primitives, the typical handler output."""
+    return (
+        type(data) is dict
+        and _PRIMITIVE_TYPES.issuperset(map(type, data.values()))
+        and _STR_TYPES.issuperset(map(type, data))
+    )
+
+
+def serialize_for_json(data: Dict[str, Any], sort_sets: bool = False) -> Dict[str, Any]:
     """
     Convenience wrapper for serializing agent output.
 
+    A flat dict of primitives with str keys (the common case for handler
+    agents) is already JSON-clean and is returned as-is, without a copy.
+    Otherwise, when orjson is installed, the payload is encoded in C with
+    deep_serialize() called only for the objects orjson does not handle natively
+    (models, sets, custom classes, ...). Payloads orjson rejects outright (non-str
+    keys, ints beyond 64 bits, reference cycles) take the pure-Python path
+    instead. On the orjson path NaN/Infinity become None, and nesting is bounded
+    by orjson's own limit rather than deep_serialize's max_depth.
+
     Args:
         data: Agent output dictionary (may contain non-serializable objects)
+        sort_sets: Sort set items for a deterministic order (see deep_serialize)
 
     Returns:
         JSON-serializable dictionary
     """
-    result = deep_serialize(data)
+    if data is None:
+        return {"result": None}
+    if _is_flat_json(data):
+        return data
+    if orjson is not None:
+        try:
+            result = orjson.loads(
+                orjson.dumps(data, default=partial(deep_serialize, sort_sets=sort_sets))
+            )
+        except orjson.JSONEncodeError:
+            result = deep_serialize(data, sort_sets=sort_sets)
+    else:
+        result = deep_serialize(data, sort_sets=sort_sets)
     # Result should always be a dict when input is a dict
     if isinstance(result, dict):
         return result
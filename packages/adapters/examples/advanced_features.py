@@ -10,8 +10,9 @@ Demonstrates:
 """
 
 import sys
+import types
 from pathlib import Path
-from typing import Optional
+from typing import Callable, List, Optional
 
 # Add current directory to Python path for mock agent imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -21,20 +22,36 @@ from dockrion_adapters import (
     LangGraphAdapter,
 )
 
-print("=" * 70)
-print("dockrion ADAPTERS - ADVANCED FEATURES DEMO")
-print("=" * 70)
-print()
+# Names of the temporary agent modules registered in sys.modules by the demos
+_DEMO_MODULES: List[str] = []
+
+
+def _register_agent_module(module_name: str, factory: Callable[[], object]) -> None:
+    """Expose a factory as `module_name:<factory name>` for adapter.load()."""
+    module = types.ModuleType(module_name)
+    setattr(module, factory.__name__, factory)
+    sys.modules[module_name] = module
+    _DEMO_MODULES.append(module_name)
+
+
+# Demo output is collected here and written with one call per chunk. Chunks are
+# flushed before adapter calls so the adapter's log lines stay in order.
+_lines: List[str] = []
+_emit = _lines.append
+
+
+def _flush() -> None:
+    """Write the buffered demo output to stdout."""
+    if _lines:
+        sys.stdout.write("\n".join(_lines) + "\n")
+        _lines.clear()
+
 
 # =============================================================================
-# DEMO 1: Basic vs Strict Validation
+# MOCK AGENTS
 # =============================================================================
 
-print("📋 DEMO 1: Validation Modes")
-print("-" * 70)
 
-
-# Create mock agent for demonstration
 def build_demo_agent():
     """Mock agent for demonstration"""
 
@@ -48,53 +65,6 @@ def build_demo_agent():
     return DemoAgent()
 
 
-# Save mock agent to temporary module
-import types
-
-demo_module = types.ModuleType("demo_agent_module")
-demo_module.build_demo_agent = build_demo_agent  # type: ignore[attr-defined]
-sys.modules["demo_agent_module"] = demo_module
-
-print("\n1️⃣  Duck Typing (Default - No strict validation)")
-print("-" * 70)
-adapter_duck = LangGraphAdapter()
-adapter_duck.load("demo_agent_module:build_demo_agent")
-
-metadata = adapter_duck.get_metadata()
-print("✅ Loaded successfully")
-print(f"   Strict validation: {metadata['strict_validation']}")
-print(f"   Agent type: {metadata['agent_type']}")
-print(f"   Is LangGraph type: {metadata['is_langgraph_type']}")
-print(f"   Supports config: {metadata['supports_config']}")
-print()
-
-print("2️⃣  Strict Validation (Type checking enabled)")
-print("-" * 70)
-try:
-    adapter_strict = LangGraphAdapter(strict_validation=True)
-    adapter_strict.load("demo_agent_module:build_demo_agent")
-    print("✅ Loaded successfully")
-except InvalidAgentError as e:
-    print("❌ Validation failed (expected with mock agents)")
-    print(f"   Error: {str(e)[:80]}...")
-except Exception:
-    # LangGraph not installed - falls back to duck typing
-    print("⚠️  LangGraph not installed - fell back to duck typing")
-    print("   This is expected behavior!")
-
-print()
-input("Press Enter to continue to Demo 2...\n")
-
-# =============================================================================
-# DEMO 2: Config Parameter Support
-# =============================================================================
-
-print("=" * 70)
-print("📋 DEMO 2: Config Parameter Support")
-print("-" * 70)
-
-
-# Create stateful agent
 def build_stateful_agent():
     """Agent that supports state persistence via config"""
 
@@ -129,85 +99,6 @@ def build_stateful_agent():
     return StatefulAgent()
 
 
-# Register stateful agent
-stateful_module = types.ModuleType("stateful_agent_module")
-stateful_module.build_stateful_agent = build_stateful_agent  # type: ignore[attr-defined]
-sys.modules["stateful_agent_module"] = stateful_module
-
-print("\n1️⃣  Load Agent and Check Config Support")
-print("-" * 70)
-adapter = LangGraphAdapter()
-adapter.load("stateful_agent_module:build_stateful_agent")
-
-metadata = adapter.get_metadata()
-print("✅ Agent loaded")
-print(f"   Supports config: {metadata['supports_config']}")
-print(f"   Agent type: {metadata['agent_type']}")
-print()
-
-print("2️⃣  Invocation WITHOUT Config (No Memory)")
-print("-" * 70)
-result = adapter.invoke({"query": "Hello!"})
-print(f"Response: {result['response']}")
-print(f"Turn: {result['turn']}")
-if "note" in result:
-    print(f"Note: {result['note']}")
-print()
-
-print("3️⃣  Invocation WITH Config (Multi-Turn Conversation)")
-print("-" * 70)
-print("Starting conversation (thread_id='user-123')...")
-print()
-
-# Turn 1
-print("🔵 Turn 1:")
-result1 = adapter.invoke({"query": "My name is Alice"}, config={"thread_id": "user-123"})
-print("   Query: 'My name is Alice'")
-print(f"   Response: {result1['response']}")
-print(f"   Turn: {result1['turn']}")
-print(f"   History: {result1['history']}")
-print()
-
-# Turn 2
-print("🔵 Turn 2 (same thread):")
-result2 = adapter.invoke({"query": "What is my name?"}, config={"thread_id": "user-123"})
-print("   Query: 'What is my name?'")
-print(f"   Response: {result2['response']}")
-print(f"   Turn: {result2['turn']}")
-print(f"   History: {result2['history']}")
-print()
-
-# Turn 3
-print("🔵 Turn 3 (same thread):")
-result3 = adapter.invoke({"query": "I like Python programming"}, config={"thread_id": "user-123"})
-print("   Query: 'I like Python programming'")
-print(f"   Response: {result3['response']}")
-print(f"   Turn: {result3['turn']}")
-print(f"   History: {result3['history']}")
-print()
-
-print("4️⃣  New Conversation (Different thread_id)")
-print("-" * 70)
-result4 = adapter.invoke({"query": "Hello, I'm Bob"}, config={"thread_id": "user-456"})
-print("   Query: 'Hello, I'm Bob'")
-print(f"   Response: {result4['response']}")
-print(f"   Turn: {result4['turn']}")
-print(f"   History: {result4['history']}")
-print("   ✅ New conversation - independent state!")
-print()
-
-input("Press Enter to continue to Demo 3...\n")
-
-# =============================================================================
-# DEMO 3: Signature Detection
-# =============================================================================
-
-print("=" * 70)
-print("📋 DEMO 3: Automatic Signature Detection")
-print("-" * 70)
-
-
-# Create agent WITHOUT config support
 def build_simple_no_config():
     """Agent that doesn't support config"""
 
@@ -218,7 +109,6 @@ def build_simple_no_config():
     return SimpleAgent()
 
 
-# Create agent WITH config support
 def build_with_config():
     """Agent that supports config"""
 
@@ -229,121 +119,297 @@ def build_with_config():
     return ConfigAgent()
 
 
-# Register agents
-simple_module = types.ModuleType("simple_module")
-simple_module.build_simple_no_config = build_simple_no_config  # type: ignore[attr-defined]
-sys.modules["simple_module"] = simple_module
-
-config_module = types.ModuleType("config_module")
-config_module.build_with_config = build_with_config  # type: ignore[attr-defined]
-sys.modules["config_module"] = config_module
-
-print("\n1️⃣  Agent WITHOUT Config Parameter")
-print("-" * 70)
-adapter1 = LangGraphAdapter()
-adapter1.load("simple_module:build_simple_no_config")
-
-meta1 = adapter1.get_metadata()
-print(f"Agent type: {meta1['agent_type']}")
-print(f"Supports config: {meta1['supports_config']}")
-print("✅ Signature correctly detected!")
-print()
-
-# Try to use config (should be ignored gracefully)
-print("   Attempting to use config (should be ignored)...")
-result = adapter1.invoke({"input": "test"}, config={"thread_id": "123"})
-print(f"   Result: {result}")
-print("   ⚠️  Config was ignored (as expected)")
-print()
-
-print("2️⃣  Agent WITH Config Parameter")
-print("-" * 70)
-adapter2 = LangGraphAdapter()
-adapter2.load("config_module:build_with_config")
-
-meta2 = adapter2.get_metadata()
-print(f"Agent type: {meta2['agent_type']}")
-print(f"Supports config: {meta2['supports_config']}")
-print("✅ Signature correctly detected!")
-print()
-
-# Use config (should work)
-print("   Using config...")
-result = adapter2.invoke({"input": "test"}, config={"thread_id": "123"})
-print(f"   Result: {result}")
-print("   ✅ Config was used!")
-print()
-
-input("Press Enter to continue to Demo 4...\n")
+def build_invalid_agent():
+    """Agent without invoke method"""
+
+    class InvalidAgent:
+        def process(self, payload):  # Wrong method name
+            return {"result": "test"}
+
+    return InvalidAgent()
+
+
+# =============================================================================
+# DEMO 1: Basic vs Strict Validation
+# =============================================================================
+
+
+def demo_validation_modes():
+    """Compare duck typing with strict validation"""
+    _emit("📋 DEMO 1: Validation Modes")
+    _emit("-" * 70)
+
+    _register_agent_module("demo_agent_module", build_demo_agent)
+
+    _emit("\n1️⃣  Duck Typing (Default - No strict validation)")
+    _emit("-" * 70)
+    adapter_duck = LangGraphAdapter()
+    _flush()
+    adapter_duck.load("demo_agent_module:build_demo_agent")
+
+    metadata = adapter_duck.get_metadata()
+    _emit("✅ Loaded successfully")
+    _emit(f"   Strict validation: {metadata['strict_validation']}")
+    _emit(f"   Agent type: {metadata['agent_type']}")
+    _emit(f"   Is LangGraph type: {metadata['is_langgraph_type']}")
+    _emit(f"   Supports config: {metadata['supports_config']}")
+    _emit("")
+
+    _emit("2️⃣  Strict Validation (Type checking enabled)")
+    _emit("-" * 70)
+    try:
+        adapter_strict = LangGraphAdapter(strict_validation=True)
+        _flush()
+        adapter_strict.load("demo_agent_module:build_demo_agent")
+        _emit("✅ Loaded successfully")
+    except InvalidAgentError as e:
+        _emit("❌ Validation failed (expected with mock agents)")
+        _emit(f"   Error: {str(e)[:80]}...")
+    except Exception:
+        # LangGraph not installed - falls back to duck typing
+        _emit("⚠️  LangGraph not installed - fell back to duck typing")
+        _emit("   This is expected behavior!")
+
+    _emit("")
+
+
+# =============================================================================
+# DEMO 2: Config Parameter Support
+# =============================================================================
+
+
+def demo_config_support():
+    """Multi-turn conversations through the config parameter"""
+    _emit("=" * 70)
+    _emit("📋 DEMO 2: Config Parameter Support")
+    _emit("-" * 70)
+
+    _register_agent_module("stateful_agent_module", build_stateful_agent)
+
+    _emit("\n1️⃣  Load Agent and Check Config Support")
+    _emit("-" * 70)
+    adapter = LangGraphAdapter()
+    _flush()
+    adapter.load("stateful_agent_module:build_stateful_agent")
+
+    metadata = adapter.get_metadata()
+    _emit("✅ Agent loaded")
+    _emit(f"   Supports config: {metadata['supports_config']}")
+    _emit(f"   Agent type: {metadata['agent_type']}")
+    _emit("")
+
+    _emit("2️⃣  Invocation WITHOUT Config (No Memory)")
+    _emit("-" * 70)
+    result = adapter.invoke({"query": "Hello!"})
+    _emit(f"Response: {result['response']}")
+    _emit(f"Turn: {result['turn']}")
+    if "note" in result:
+        _emit(f"Note: {result['note']}")
+    _emit("")
+
+    _emit("3️⃣  Invocation WITH Config (Multi-Turn Conversation)")
+    _emit("-" * 70)
+    _emit("Starting conversation (thread_id='user-123')...")
+    _emit("")
+
+    # Turn 1
+    _emit("🔵 Turn 1:")
+    result1 = adapter.invoke({"query": "My name is Alice"}, config={"thread_id": "user-123"})
+    _emit("   Query: 'My name is Alice'")
+    _emit(f"   Response: {result1['response']}")
+    _emit(f"   Turn: {result1['turn']}")
+    _emit(f"   History: {result1['history']}")
+    _emit("")
+
+    # Turn 2
+    _emit("🔵 Turn 2 (same thread):")
+    result2 = adapter.invoke({"query": "What is my name?"}, config={"thread_id": "user-123"})
+    _emit("   Query: 'What is my name?'")
+    _emit(f"   Response: {result2['response']}")
+    _emit(f"   Turn: {result2['turn']}")
+    _emit(f"   History: {result2['history']}")
+    _emit("")
+
+    # Turn 3
+    _emit("🔵 Turn 3 (same thread):")
+    result3 = adapter.invoke(
+        {"query": "I like Python programming"}, config={"thread_id": "user-123"}
+    )
+    _emit("   Query: 'I like Python programming'")
+    _emit(f"   Response: {result3['response']}")
+    _emit(f"   Turn: {result3['turn']}")
+    _emit(f"   History: {result3['history']}")
+    _emit("")
+
+    _emit("4️⃣  New Conversation (Different thread_id)")
+    _emit("-" * 70)
+    result4 = adapter.invoke({"query": "Hello, I'm Bob"}, config={"thread_id": "user-456"})
+    _emit("   Query: 'Hello, I'm Bob'")
+    _emit(f"   Response: {result4['response']}")
+    _emit(f"   Turn: {result4['turn']}")
+    _emit(f"   History: {result4['history']}")
+    _emit("   ✅ New conversation - independent state!")
+    _emit("")
+
+
+# =============================================================================
+# DEMO 3: Signature Detection
+# =============================================================================
+
+
+def demo_signature_detection():
+    """Automatic detection of config support from invoke() signatures"""
+    _emit("=" * 70)
+    _emit("📋 DEMO 3: Automatic Signature Detection")
+    _emit("-" * 70)
+
+    _register_agent_module("simple_module", build_simple_no_config)
+    _register_agent_module("config_module", build_with_config)
+
+    _emit("\n1️⃣  Agent WITHOUT Config Parameter")
+    _emit("-" * 70)
+    adapter1 = LangGraphAdapter()
+    _flush()
+    adapter1.load("simple_module:build_simple_no_config")
+
+    meta1 = adapter1.get_metadata()
+    _emit(f"Agent type: {meta1['agent_type']}")
+    _emit(f"Supports config: {meta1['supports_config']}")
+    _emit("✅ Signature correctly detected!")
+    _emit("")
+
+    # Try to use config (should be ignored gracefully)
+    _emit("   Attempting to use config (should be ignored)...")
+    _flush()
+    result = adapter1.invoke({"input": "test"}, config={"thread_id": "123"})
+    _emit(f"   Result: {result}")
+    _emit("   ⚠️  Config was ignored (as expected)")
+    _emit("")
+
+    _emit("2️⃣  Agent WITH Config Parameter")
+    _emit("-" * 70)
+    adapter2 = LangGraphAdapter()
+    _flush()
+    adapter2.load("config_module:build_with_config")
+
+    meta2 = adapter2.get_metadata()
+    _emit(f"Agent type: {meta2['agent_type']}")
+    _emit(f"Supports config: {meta2['supports_config']}")
+    _emit("✅ Signature correctly detected!")
+    _emit("")
+
+    # Use config (should work)
+    _emit("   Using config...")
+    result = adapter2.invoke({"input": "test"}, config={"thread_id": "123"})
+    _emit(f"   Result: {result}")
+    _emit("   ✅ Config was used!")
+    _emit("")
+
 
 # =============================================================================
 # DEMO 4: Complete Metadata
 # =============================================================================
 
-print("=" * 70)
-print("📋 DEMO 4: Enhanced Metadata")
-print("-" * 70)
 
-adapter = LangGraphAdapter(strict_validation=False)
-adapter.load("config_module:build_with_config")
+def demo_metadata():
+    """Print the full adapter metadata (uses config_module from demo 3)"""
+    _emit("=" * 70)
+    _emit("📋 DEMO 4: Enhanced Metadata")
+    _emit("-" * 70)
+
+    adapter = LangGraphAdapter(strict_validation=False)
+    _flush()
+    adapter.load("config_module:build_with_config")
 
-metadata = adapter.get_metadata()
+    metadata = adapter.get_metadata()
+
+    _emit("\n📊 Complete Metadata:")
+    _emit("-" * 70)
+    for key, value in metadata.items():
+        _emit(f"{key:25} : {value}")
+    _emit("")
 
-print("\n📊 Complete Metadata:")
-print("-" * 70)
-for key, value in metadata.items():
-    print(f"{key:25} : {value}")
-print()
 
 # =============================================================================
 # DEMO 5: Error Handling
 # =============================================================================
 
-print("=" * 70)
-print("📋 DEMO 5: Error Handling")
-print("-" * 70)
 
-print("\n1️⃣  Invalid Agent (No invoke method)")
-print("-" * 70)
+def demo_error_handling():
+    """Loading an agent without an invoke() method"""
+    _emit("=" * 70)
+    _emit("📋 DEMO 5: Error Handling")
+    _emit("-" * 70)
 
+    _emit("\n1️⃣  Invalid Agent (No invoke method)")
+    _emit("-" * 70)
 
-def build_invalid_agent():
-    """Agent without invoke method"""
+    _register_agent_module("invalid_module", build_invalid_agent)
 
-    class InvalidAgent:
-        def process(self, payload):  # Wrong method name
-            return {"result": "test"}
+    try:
+        adapter = LangGraphAdapter()
+        _flush()
+        adapter.load("invalid_module:build_invalid_agent")
+    except InvalidAgentError as e:
+        _emit("❌ Caught InvalidAgentError (expected)")
+        _emit(f"   Error: {str(e)[:100]}...")
+        _emit("   ✅ Error message is helpful!")
+    _emit("")
 
-    return InvalidAgent()
 
+# =============================================================================
+# MAIN
+# =============================================================================
 
-invalid_module = types.ModuleType("invalid_module")
-invalid_module.build_invalid_agent = build_invalid_agent  # type: ignore[attr-defined]
-sys.modules["invalid_module"] = invalid_module
 
-try:
-    adapter = LangGraphAdapter()
-    adapter.load("invalid_module:build_invalid_agent")
-except InvalidAgentError as e:
-    print("❌ Caught InvalidAgentError (expected)")
-    print(f"   Error: {str(e)[:100]}...")
-    print("   ✅ Error message is helpful!")
-print()
-
-print("=" * 70)
-print("✨ ALL DEMOS COMPLETED SUCCESSFULLY!")
-print("=" * 70)
-print()
-print("🎓 Key Takeaways:")
-print("  1. Duck typing (default) is flexible and doesn't require LangGraph")
-print("  2. Strict validation provides type safety when needed")
-print("  3. Config parameter enables stateful conversations")
-print("  4. Signature detection is automatic")
-print("  5. Enhanced metadata provides complete introspection")
-print("  6. Error messages are helpful and actionable")
-print()
-print("📚 Next Steps:")
-print("  - Check README.md for complete API reference")
-print("  - See test_langgraph_adapter.py for more examples")
-print("  - Try with real LangGraph agents!")
-print()
+def main():
+    """Run all demonstrations"""
+    _emit("=" * 70)
+    _emit("dockrion ADAPTERS - ADVANCED FEATURES DEMO")
+    _emit("=" * 70)
+    _emit("")
+
+    try:
+        demo_validation_modes()
+        _flush()
+        input("Press Enter to continue to Demo 2...\n")
+
+        demo_config_support()
+        _flush()
+        input("Press Enter to continue to Demo 3...\n")
+
+        demo_signature_detection()
+        _flush()
+        input("Press Enter to continue to Demo 4...\n")
+
+        demo_metadata()
+        demo_error_handling()
+    finally:
+        _flush()
+        # Drop the temporary agent modules (and the agents they reference)
+        for module_name in _DEMO_MODULES:
+            sys.modules.pop(module_name, None)
+        _DEMO_MODULES.clear()
+
+    _emit("=" * 70)
+    _emit("✨ ALL DEMOS COMPLETED SUCCESSFULLY!")
+    _emit("=" * 70)
+    _emit("")
+    _emit("🎓 Key Takeaways:")
+    _emit("  1. Duck typing (default) is flexible and doesn't require LangGraph")
+    _emit("  2. Strict validation provides type safety when needed")
+    _emit("  3. Config parameter enables stateful conversations")
+    _emit("  4. Signature detection is automatic")
+    _emit("  5. Enhanced metadata provides complete introspection")
+    _emit("  6. Error messages are helpful and actionable")
+    _emit("")
+    _emit("📚 Next Steps:")
+    _emit("  - Check README.md for complete API reference")
+    _emit("  - See test_langgraph_adapter.py for more examples")
+    _emit("  - Try with real LangGraph agents!")
+    _emit("")
+    _flush()
+
+
+if __name__ == "__main__":
+    main()
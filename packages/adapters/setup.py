@@ -0,0 +1,24 @@
+"""
+Optional mypyc build for dockrion_adapters.
+
+Project metadata lives in pyproject.toml. This file only opts the serializer
+into ahead-of-time compilation when DOCKRION_MYPYC=1 is set:
+
+    pip install mypy
+    DOCKRION_MYPYC=1 pip install --no-build-isolation -e .
+
+The compiled extension is imported in place of serialization.py; when it is
+absent (the default build) the pure-Python module is used unchanged.
+"""
+
+import os
+
+from setuptools import setup
+
+ext_modules = []
+if os.environ.get("DOCKRION_MYPYC") == "1":
+    from mypyc.build import mypycify
+
+    ext_modules = mypycify(["dockrion_adapters/serialization.py"], opt_level="3")
+
+setup(ext_modules=ext_modules)
@@ -1,54 +1,64 @@
 """Pytest configuration and fixtures for adapter tests.
 
-This conftest.py ensures tests work for both developers (editable install)
-and users (pip installed package).
+The package root and this tests directory are put on sys.path by the
+pythonpath setting in pyproject.toml, so `fixtures.sample_agents` is
+importable wherever pytest is run from.
 """
 
-import sys
-from pathlib import Path
-
 import pytest
 
 
 def pytest_configure(config):
-    """Configure pytest with custom markers and path setup."""
+    """Configure pytest with custom markers."""
     # Register custom markers
     config.addinivalue_line(
         "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
     )
     config.addinivalue_line("markers", "integration: marks tests as integration tests")
+    # Label only: tests that need langgraph skip with pytest.importorskip("langgraph")
     config.addinivalue_line("markers", "requires_langgraph: marks tests that require langgraph")
 
 
-@pytest.fixture(scope="session", autouse=True)
-def setup_test_path():
-    """Ensure the package root and tests directory are in the Python path.
+@pytest.fixture(autouse=True)
+def clear_langgraph_runner_cache():
+    """Start each test without runners cached by earlier LangGraph loads.
 
-    This makes fixtures importable whether tests are run from:
-    - The package directory (packages/adapters)
-    - The project root (Dockrion)
-    - Or after pip install
+    load() reuses one runner per factory for the whole process, so without
+    this a stateful runner built by one test would be handed to the next.
     """
-    package_root = Path(__file__).parent.parent
-    tests_root = Path(__file__).parent
+    from dockrion_adapters import LangGraphAdapter
+
+    LangGraphAdapter.clear_cache()
+    yield
+    LangGraphAdapter.clear_cache()
 
-    # Add package root to path for local development
-    package_root_str = str(package_root)
-    if package_root_str not in sys.path:
-        sys.path.insert(0, package_root_str)
 
-    # Add tests directory for fixture imports
-    tests_root_str = str(tests_root)
-    if tests_root_str not in sys.path:
-        sys.path.insert(0, tests_root_str)
+@pytest.fixture(scope="module")
+def adapter_factory():
+    """Return loaded LangGraphAdapters, one per (entrypoint, strict_validation) per module.
 
-    yield
+    Only for tests that do not mutate the adapter or its runner; tests that
+    reload, clear caches or keep state across invocations build their own.
+    """
+    from dockrion_adapters import LangGraphAdapter
+
+    adapters = {}
+
+    def _make(entrypoint: str, strict: bool = False) -> LangGraphAdapter:
+        key = (entrypoint, strict)
+        if key not in adapters:
+            adapter = LangGraphAdapter(strict_validation=strict)
+            adapter.load(entrypoint)
+            adapters[key] = adapter
+        return adapters[key]
 
-    # Cleanup (optional, but good practice)
-    if package_root_str in sys.path:
-        sys.path.remove(package_root_str)
-    if tests_root_str in sys.path:
-        sys.path.remove(tests_root_str)
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_payload():
+    """Canonical invocation payload shared by tests; treat it as read-only."""
+    return {"input": "test"}
 
 
 @pytest.fixture
@@ -121,18 +131,3 @@ def agent_without_invoke():
     from fixtures.sample_agents import build_agent_without_invoke
 
     return build_agent_without_invoke()
-
-
-def pytest_collection_modifyitems(config, items):
-    """Modify test collection to handle optional dependencies."""
-    try:
-        import langgraph
-
-        has_langgraph = True
-    except ImportError:
-        has_langgraph = False
-
-    for item in items:
-        # Skip tests marked as requires_langgraph if langgraph is not installed
-        if "requires_langgraph" in item.keywords and not has_langgraph:
-            item.add_marker(pytest.mark.skip(reason="langgraph not installed"))
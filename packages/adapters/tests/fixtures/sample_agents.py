@@ -136,6 +136,39 @@ def build_async_agent():
     return AsyncAgent()
 
 
+def build_batch_agent():
+    """
+    Build agent with a LangChain-style .batch() method.
+
+    Inputs containing "fail" produce an exception in the batch results.
+    """
+
+    class BatchAgent:
+        def __init__(self):
+            self.batch_calls = 0
+
+        def invoke(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+            """Sync invoke"""
+            if payload.get("fail"):
+                raise RuntimeError("Batch item failed")
+            return {"output": payload.get("input")}
+
+        def batch(self, inputs, config=None, *, return_exceptions=False):
+            """Invoke each input, optionally returning exceptions"""
+            self.batch_calls += 1
+            results = []
+            for payload in inputs:
+                try:
+                    results.append(self.invoke(payload))
+                except Exception as e:
+                    if not return_exceptions:
+                        raise
+                    results.append(e)
+            return results
+
+    return BatchAgent()
+
+
 def build_crashing_agent():
     """
     Build agent that crashes on invoke (for error testing).
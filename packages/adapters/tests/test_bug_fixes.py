@@ -261,3 +261,124 @@ def handler_no_context(payload, verbose=False):
             sys.path.remove(str(tmp_path))
             if "test_module2" in sys.modules:
                 del sys.modules["test_module2"]
+
+    def test_reload_same_handler_skips_inspection(self, tmp_path, mocker):
+        """Reloading the same handler should not re-inspect its signature."""
+        module_file = tmp_path / "test_module3.py"
+        module_file.write_text("""
+def handler_with_context(payload, context):
+    return {"result": "ok"}
+""")
+
+        import sys
+
+        sys.path.insert(0, str(tmp_path))
+
+        try:
+            from dockrion_adapters.handler_adapter import HandlerAdapter
+
+            adapter = HandlerAdapter()
+            spy = mocker.spy(HandlerAdapter, "_inspect_handler")
+            adapter.load("test_module3:handler_with_context")
+            adapter.load("test_module3:handler_with_context")
+
+            assert spy.call_count == 1
+            assert adapter._accepts_context is True
+        finally:
+            sys.path.remove(str(tmp_path))
+            if "test_module3" in sys.modules:
+                del sys.modules["test_module3"]
+
+
+class TestHandlerAdapterAinvoke:
+    """Test ainvoke() awaits async handlers and offloads sync ones."""
+
+    def _make_adapter(self, handler):
+        from dockrion_adapters.handler_adapter import HandlerAdapter
+
+        adapter = HandlerAdapter()
+        adapter._handler = handler
+        adapter._handler_path = f"test:{handler.__name__}"
+        adapter._signature = inspect.signature(handler)
+        adapter._is_async = inspect.iscoroutinefunction(handler)
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_awaits_async_handler_on_loop(self):
+        """Async handlers should run on the caller's event loop."""
+        import threading
+
+        main_thread = threading.get_ident()
+
+        async def async_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {"thread": threading.get_ident(), **payload}
+
+        result = await self._make_adapter(async_handler).ainvoke({"x": 1})
+
+        assert result == {"thread": main_thread, "x": 1}
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_offloads_sync_handler(self):
+        """Sync handlers should run in a worker thread, not on the loop."""
+        import threading
+
+        main_thread = threading.get_ident()
+
+        def sync_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {"thread": threading.get_ident()}
+
+        result = await self._make_adapter(sync_handler).ainvoke({})
+
+        assert result["thread"] != main_thread
+
+    @pytest.mark.asyncio
+    async def test_ainvoke_wraps_handler_errors(self):
+        """Errors from async handlers should be normalized like invoke()."""
+        from dockrion_adapters.errors import AgentExecutionError
+
+        async def failing_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            raise ValueError("boom")
+
+        with pytest.raises(AgentExecutionError, match="ValueError: boom"):
+            await self._make_adapter(failing_handler).ainvoke({})
+
+    def test_batch_invoke_preserves_order(self):
+        """batch_invoke should return one result per payload, in order."""
+
+        def sync_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            if payload.get("fail"):
+                raise ValueError("boom")
+            return {"n": payload["n"]}
+
+        adapter = self._make_adapter(sync_handler)
+        results = adapter.batch_invoke([{"n": 1}, {"fail": True}, {"n": 3}], return_exceptions=True)
+
+        assert results[0] == {"n": 1}
+        assert isinstance(results[1], Exception)
+        assert results[2] == {"n": 3}
+
+    def test_invoke_async_handler_reuses_background_loop(self):
+        """Sync invoke() of an async handler should not create a loop per call."""
+        import asyncio
+
+        async def async_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {"loop": id(asyncio.get_running_loop())}
+
+        adapter = self._make_adapter(async_handler)
+
+        assert adapter.invoke({}) == adapter.invoke({})
+
+    @pytest.mark.asyncio
+    async def test_invoke_async_handler_inside_running_loop_sees_context(self):
+        """Sync invoke() from a running loop should pass the StreamContext through."""
+        from dockrion_events import get_current_context
+
+        async def async_handler(payload: Dict[str, Any]) -> Dict[str, Any]:
+            return {"has_context": get_current_context() is not None}
+
+        class MockContext:
+            pass
+
+        adapter = self._make_adapter(async_handler)
+
+        assert adapter.invoke({}, context=MockContext()) == {"has_context": True}
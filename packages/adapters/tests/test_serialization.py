@@ -13,6 +13,24 @@ import pytest
 from dockrion_adapters.serialization import deep_serialize, serialize_for_json
 
 
+@pytest.fixture(scope="session")
+def pydantic():
+    """The pydantic module, or skip the test when it is not installed."""
+    return pytest.importorskip("pydantic")
+
+
+@pytest.fixture(scope="session")
+def langchain_messages():
+    """The langchain_core.messages module, or skip the test when it is not installed."""
+    return pytest.importorskip("langchain_core.messages")
+
+
+@pytest.fixture(scope="session")
+def orjson():
+    """The orjson module, or skip the test when it is not installed."""
+    return pytest.importorskip("orjson")
+
+
 class TestPrimitives:
     """Test serialization of primitive types."""
 
@@ -62,10 +80,23 @@ class TestCollections:
     def test_nested_list(self):
         assert deep_serialize([[1, 2], [3, 4]]) == [[1, 2], [3, 4]]
 
+    def test_primitive_containers_are_copied(self):
+        data = {"tags": ["a", "b"], "meta": {"k": 1, "ok": True}}
+        result = deep_serialize(data)
+        assert result == data
+        assert result["tags"] is not data["tags"]
+        assert result["meta"] is not data["meta"]
+
+    def test_primitive_dict_with_non_str_keys(self):
+        assert deep_serialize({1: "a", 2: "b"}) == {"1": "a", "2": "b"}
+
     def test_tuple(self):
         # Tuples are converted to lists
         assert deep_serialize((1, 2, 3)) == [1, 2, 3]
 
+    def test_tuple_empty(self):
+        assert deep_serialize(()) == []
+
     def test_tuple_nested(self):
         assert deep_serialize(((1, 2), (3, 4))) == [[1, 2], [3, 4]]
 
@@ -74,6 +105,10 @@ class TestCollections:
         assert isinstance(result, list)
         assert sorted(result) == [1, 2, 3]
 
+    def test_set_sorted_on_request(self):
+        assert deep_serialize({"b", "c", "a"}, sort_sets=True) == ["a", "b", "c"]
+        assert serialize_for_json({"s": frozenset([3, 1, 2])}, sort_sets=True) == {"s": [1, 2, 3]}
+
     def test_set_empty(self):
         assert deep_serialize(set()) == []
 
@@ -97,6 +132,14 @@ class TestCollections:
         result = deep_serialize(data)
         assert result == {"list": [1, 2], "nested": {"tuple": [3, 4]}}
 
+    def test_collection_subclasses(self):
+        # Subclasses miss the exact-type fast path and use the isinstance checks
+        from collections import OrderedDict, namedtuple
+
+        Pair = namedtuple("Pair", ["x", "y"])
+        data = OrderedDict(pair=Pair(1, 2))
+        assert deep_serialize(data) == {"pair": [1, 2]}
+
 
 class TestSpecialTypes:
     """Test serialization of special types."""
@@ -125,6 +168,20 @@ class TestSpecialTypes:
         td = timedelta(days=2, hours=3)
         assert deep_serialize(td) == 2 * 86400 + 3 * 3600  # seconds
 
+    def test_temporal_subclasses(self):
+        # A datetime subclass is also a date subclass and must keep its time part
+        class Stamp(datetime):
+            pass
+
+        class Day(date):
+            pass
+
+        class Span(timedelta):
+            pass
+
+        data = [Stamp(2024, 1, 1, 12), Day(2024, 1, 1), Span(seconds=90)]
+        assert deep_serialize(data) == ["2024-01-01T12:00:00", "2024-01-01", 90.0]
+
     def test_uuid(self):
         u = uuid.UUID("12345678-1234-5678-1234-567812345678")
         assert deep_serialize(u) == "12345678-1234-5678-1234-567812345678"
@@ -184,6 +241,19 @@ class TestEnum:
         result = deep_serialize(data)
         assert result == {"priority": "high", "count": 5}
 
+    def test_repeated_value_subclasses(self):
+        class Priority(Enum):
+            HIGH = "high"
+
+        class Stamp(datetime):
+            pass
+
+        data = [Priority.HIGH, Stamp(2024, 1, 1)]
+        expected = ["high", "2024-01-01T00:00:00"]
+        # Later calls use the converter registered on first sight
+        assert deep_serialize(data) == expected
+        assert deep_serialize(data) == expected
+
 
 class TestDataclass:
     """Test dataclass serialization."""
@@ -227,13 +297,27 @@ class TestDataclass:
         obj = Container(items=[1, 2, 3])
         assert deep_serialize(obj) == {"items": [1, 2, 3]}
 
+    def test_dataclass_fields_are_not_deep_copied(self):
+        class NoCopy:
+            def __init__(self):
+                self.value = 1
+
+            def __deepcopy__(self, memo):
+                raise TypeError("not copyable")
+
+        @dataclass
+        class Holder:
+            item: Any
+            _hidden: int = 0
+
+        assert deep_serialize(Holder(NoCopy())) == {"item": {"value": 1}, "_hidden": 0}
+
 
 class TestPydanticModels:
     """Test Pydantic model serialization."""
 
-    def test_pydantic_v2_model(self):
-        pytest.importorskip("pydantic")
-        from pydantic import BaseModel
+    def test_pydantic_v2_model(self, pydantic):
+        BaseModel = pydantic.BaseModel
 
         class User(BaseModel):
             name: str
@@ -243,9 +327,8 @@ class TestPydanticModels:
         result = deep_serialize(user)
         assert result == {"name": "Alice", "age": 30}
 
-    def test_nested_pydantic(self):
-        pytest.importorskip("pydantic")
-        from pydantic import BaseModel
+    def test_nested_pydantic(self, pydantic):
+        BaseModel = pydantic.BaseModel
 
         class Address(BaseModel):
             city: str
@@ -258,9 +341,8 @@ class TestPydanticModels:
         result = deep_serialize(person)
         assert result == {"name": "Bob", "address": {"city": "NYC"}}
 
-    def test_pydantic_with_optional(self):
-        pytest.importorskip("pydantic")
-        from pydantic import BaseModel
+    def test_pydantic_with_optional(self, pydantic):
+        BaseModel = pydantic.BaseModel
 
         class Config(BaseModel):
             name: str
@@ -272,13 +354,24 @@ class TestPydanticModels:
         assert result["name"] == "test"
         assert result.get("debug") is None
 
+    def test_model_kind_detected_once_per_class(self, pydantic):
+        from dockrion_adapters.serialization import _MODEL_CONVERTERS, _dump_pydantic_v2
+
+        BaseModel = pydantic.BaseModel
+
+        class Item(BaseModel):
+            id: int
+
+        result = deep_serialize([Item(id=1), Item(id=2)])
+        assert result == [{"id": 1}, {"id": 2}]
+        assert _MODEL_CONVERTERS[Item] == (_dump_pydantic_v2,)
+
 
 class TestLangChainMessages:
     """Test LangChain message serialization."""
 
-    def test_human_message(self):
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import HumanMessage  # type: ignore[import-untyped]
+    def test_human_message(self, langchain_messages):
+        HumanMessage = langchain_messages.HumanMessage
 
         msg = HumanMessage(content="Hello, world!")
         result = deep_serialize(msg)
@@ -287,9 +380,8 @@ class TestLangChainMessages:
         assert result["content"] == "Hello, world!"
         assert result["type"] == "human"
 
-    def test_ai_message(self):
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import AIMessage  # type: ignore[import-untyped]
+    def test_ai_message(self, langchain_messages):
+        AIMessage = langchain_messages.AIMessage
 
         msg = AIMessage(content="I'm an AI assistant.")
         result = deep_serialize(msg)
@@ -298,9 +390,9 @@ class TestLangChainMessages:
         assert result["content"] == "I'm an AI assistant."
         assert result["type"] == "ai"
 
-    def test_message_list(self):
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import AIMessage, HumanMessage  # type: ignore[import-untyped]
+    def test_message_list(self, langchain_messages):
+        AIMessage = langchain_messages.AIMessage
+        HumanMessage = langchain_messages.HumanMessage
 
         messages = [
             HumanMessage(content="Hi"),
@@ -314,9 +406,8 @@ class TestLangChainMessages:
         assert result["messages"][0]["type"] == "human"
         assert result["messages"][1]["type"] == "ai"
 
-    def test_system_message(self):
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import SystemMessage  # type: ignore[import-untyped]
+    def test_system_message(self, langchain_messages):
+        SystemMessage = langchain_messages.SystemMessage
 
         msg = SystemMessage(content="You are a helpful assistant.")
         result = deep_serialize(msg)
@@ -357,6 +448,15 @@ class TestCustomClasses:
 
         assert result == {"x": 1, "y": 2}
 
+    def test_class_with_single_string_slot(self):
+        class Single:
+            __slots__ = "value"
+
+            def __init__(self, value):
+                self.value = value
+
+        assert deep_serialize([Single(1), Single(2)]) == [{"value": 1}, {"value": 2}]
+
     def test_class_with_nested_objects(self):
         class Inner:
             def __init__(self, value):
@@ -371,6 +471,35 @@ class TestCustomClasses:
         result = deep_serialize(obj)
         assert result == {"inner": {"value": "test"}, "count": 5}
 
+    def test_reference_cycle_is_cut(self):
+        class Node:
+            def __init__(self, name):
+                self.name = name
+                self.children = []
+                self.parent = None
+
+        root = Node("root")
+        child = Node("child")
+        child.parent = root
+        root.children.append(child)
+
+        result = deep_serialize(root)
+        assert result == {
+            "name": "root",
+            "children": [{"name": "child", "children": [], "parent": "<cycle: Node>"}],
+            "parent": None,
+        }
+
+    def test_shared_object_serialized_once(self):
+        class Leaf:
+            def __init__(self):
+                self.items = [1, 2]
+
+        leaf = Leaf()
+        result = deep_serialize({"a": leaf, "b": leaf})
+        assert result == {"a": {"items": [1, 2]}, "b": {"items": [1, 2]}}
+        assert result["a"] is result["b"]
+
 
 class TestEdgeCases:
     """Test edge cases and error handling."""
@@ -396,6 +525,36 @@ class TestEdgeCases:
         # Should have truncated somewhere
         assert isinstance(result, dict)
 
+    def test_children_past_max_depth_are_marked(self):
+        class Box:
+            def __init__(self):
+                self.label = "box"
+
+        data = {"items": [1, "a"], "map": {1: "x"}, "box": Box()}
+        marker = "<max depth 1 exceeded>"
+        assert deep_serialize(data, max_depth=1) == {
+            "items": [marker, marker],
+            "map": {"1": marker},
+            "box": marker,
+        }
+        assert deep_serialize([Box()], max_depth=2) == [{"label": "<max depth 2 exceeded>"}]
+
+    def test_nesting_beyond_recursion_limit(self):
+        """Deep structures are walked without Python recursion."""
+        import sys
+
+        depth = sys.getrecursionlimit() * 2
+        deep: list[Any] = []
+        current = deep
+        for _ in range(depth):
+            current.append([])
+            current = current[0]
+
+        result = deep_serialize(deep, max_depth=depth + 1)
+        for _ in range(depth):
+            result = result[0]
+        assert result == []
+
     def test_callable(self):
         def my_func():
             pass
@@ -448,6 +607,14 @@ class TestSerializeForJson:
         result = serialize_for_json(data)
         assert result == data
 
+    def test_none_and_empty(self):
+        assert serialize_for_json(None) == {"result": None}
+        assert serialize_for_json({}) == {}
+
+    def test_flat_output_returned_as_is(self):
+        data = {"output": "done", "status": "success", "score": 0.9, "extra": None}
+        assert serialize_for_json(data) is data
+
     def test_with_complex_objects(self):
         data = {
             "timestamp": datetime(2024, 12, 31),
@@ -458,9 +625,8 @@ class TestSerializeForJson:
         assert result["timestamp"] == "2024-12-31T00:00:00"
         assert result["id"] == "12345678-1234-5678-1234-567812345678"
 
-    def test_with_nested_pydantic(self):
-        pytest.importorskip("pydantic")
-        from pydantic import BaseModel
+    def test_with_nested_pydantic(self, pydantic):
+        BaseModel = pydantic.BaseModel
 
         class Item(BaseModel):
             name: str
@@ -472,9 +638,9 @@ class TestSerializeForJson:
         assert result["items"][0]["name"] == "Widget"
         assert result["items"][0]["price"] == 9.99
 
-    def test_with_langchain_messages(self):
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import AIMessage, HumanMessage  # type: ignore[import-untyped]
+    def test_with_langchain_messages(self, langchain_messages):
+        AIMessage = langchain_messages.AIMessage
+        HumanMessage = langchain_messages.HumanMessage
 
         data = {
             "messages": [
@@ -488,14 +654,35 @@ class TestSerializeForJson:
         assert result["messages"][0]["content"] == "Hello"
         assert result["messages"][1]["content"] == "Hi there!"
 
+    @pytest.mark.usefixtures("orjson")
+    def test_orjson_path_matches_deep_serialize(self):
+
+        @dataclass
+        class Point:
+            x: int
+            y: int
+
+        data = {"when": datetime(2024, 12, 31), "point": Point(1, 2), "tags": {"a"}}
+        assert serialize_for_json(data) == deep_serialize(data)
+
+    @pytest.mark.usefixtures("orjson")
+    def test_orjson_rejected_payload_falls_back(self):
+        data = {"counts": {1: "a", 2: "b"}, "big": 2**70}
+        assert serialize_for_json(data) == {"counts": {"1": "a", "2": "b"}, "big": 2**70}
+
+    def test_without_orjson(self, monkeypatch):
+        monkeypatch.setattr("dockrion_adapters.serialization.orjson", None)
+        data = {"timestamp": datetime(2024, 12, 31), "ok": True}
+        assert serialize_for_json(data) == {"timestamp": "2024-12-31T00:00:00", "ok": True}
+
 
 class TestIntegrationScenarios:
     """Test real-world integration scenarios."""
 
-    def test_langgraph_chat_output(self):
+    def test_langgraph_chat_output(self, langchain_messages):
         """Test typical LangGraph chat agent output."""
-        pytest.importorskip("langchain_core")
-        from langchain_core.messages import AIMessage, HumanMessage  # type: ignore[import-untyped]
+        AIMessage = langchain_messages.AIMessage
+        HumanMessage = langchain_messages.HumanMessage
 
         # Simulate LangGraph chat output
         output = {
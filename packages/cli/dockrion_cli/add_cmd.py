@@ -4,7 +4,6 @@ from pathlib import Path
 from typing import List, Optional, Union
 
 import typer
-import yaml
 
 from .utils import confirm_action, console, error, success, warning
 
@@ -29,6 +28,8 @@ def load_dockfile(path: Path) -> dict:
     Raises:
         typer.Exit: If file doesn't exist or is invalid
     """
+    import yaml
+
     if not path.exists():
         error(f"Dockfile not found: {path}")
         raise typer.Exit(1)
@@ -52,6 +53,8 @@ def save_dockfile(path: Path, data: dict) -> None:
         path: Path to Dockfile
         data: Dockfile data dict
     """
+    import yaml
+
     # Use block style for better readability
     content = yaml.dump(
         data,
@@ -1,12 +1,8 @@
 """Build command - Build Docker image for agent deployment."""
 
-from pathlib import Path
-
 import typer
-from dockrion_common import MissingSecretError, get_env_summary, load_env_files, resolve_secrets
-from dockrion_sdk import deploy, load_dockspec
 
-from .utils import console, error, handle_error, info, success, warning
+from .utils import console, error, handle_error, info, status, success, warning
 
 app = typer.Typer()
 
@@ -65,22 +61,22 @@ def build(
         dockrion build --verbose
     """
     try:
-        # Validate file exists
-        if not Path(path).exists():
-            error(f"Dockfile not found: {path}")
-            raise typer.Exit(1)
+        from dockrion_common import get_env_summary, resolve_secrets
+        from dockrion_sdk import deploy, load_dockspec
 
-        # Load spec to show info (non-strict to get full info first)
+        # Load the spec once. A missing Dockfile is reported by the loader's own
+        # open(), not a separate stat. Secrets are checked here rather than in
+        # the loader so the summary below is the only resolution pass.
         try:
-            spec = load_dockspec(path, env_file=env_file, strict_secrets=False)
+            spec = load_dockspec(path, env_file=env_file, validate_secrets=False)
             agent_name = spec.agent.name
             expose_port = spec.expose.port if spec.expose else 8080
 
             # Show secrets validation status
             if spec.secrets:
-                project_root = Path(path).resolve().parent
-                loaded_env = load_env_files(project_root, env_file)
-                resolved = resolve_secrets(spec.secrets, loaded_env)
+                # load_dockspec has already injected the project's env files into
+                # os.environ, which resolve_secrets reads as the shell environment
+                resolved = resolve_secrets(spec.secrets, {})
                 summary = get_env_summary(spec.secrets, resolved)
 
                 if summary.get("has_secrets_config"):
@@ -115,18 +111,8 @@ def build(
                             f"Secrets: {req['set']}/{req['declared']} required ✓, {opt['set']}/{opt['declared']} optional"
                         )
 
-        except MissingSecretError as e:
-            if allow_missing_secrets:
-                warning(f"Missing required secrets: {', '.join(e.missing)}")
-                console.print("[dim]  ⚠️  These must be provided at container runtime[/dim]")
-                # Re-load without strict validation
-                spec = load_dockspec(path, env_file=env_file, strict_secrets=False)
-                agent_name = spec.agent.name
-                expose_port = spec.expose.port if spec.expose else 8080
-            else:
-                error(f"Missing required secrets: {', '.join(e.missing)}")
-                console.print("\n[dim]💡 Tip: Use --allow-missing-secrets to build anyway[/dim]")
-                raise typer.Exit(1)
+        except typer.Exit:
+            raise
         except Exception as e:
             error(f"Failed to load Dockfile: {str(e)}")
             raise typer.Exit(1)
@@ -143,7 +129,7 @@ def build(
         if use_local_dockrion_packages:
             info("Using local PyPI server for Dockrion packages")
 
-        with console.status("[bold green]Building Docker image..."):
+        with status("[bold green]Building Docker image..."):
             result = deploy(
                 path,
                 target=target,
@@ -170,33 +156,31 @@ def build(
             if len(required_secrets) > 1:
                 secret_env_example += "... "
 
-        # Show next steps
-        console.print("\n[bold]Next steps:[/bold]")
-        console.print("  1. Run locally:")
+        # Show next steps, rendered and written in one print
+        steps = ["\n[bold]Next steps:[/bold]", "  1. Run locally:"]
         if has_required_secrets:
-            console.print(
+            steps.append(
                 f"     [cyan]docker run -p {expose_port}:{expose_port} {secret_env_example}{result['image']}[/cyan]"
             )
-            console.print(
+            steps.append(
                 f"     [dim]Or use an env file:[/dim] [cyan]docker run -p {expose_port}:{expose_port} --env-file .env {result['image']}[/cyan]"
             )
-            console.print()
-            console.print(
-                "     [yellow]⚠️  Required secrets (must be provided at runtime):[/yellow]"
-            )
+            steps.append("")
+            steps.append("     [yellow]⚠️  Required secrets (must be provided at runtime):[/yellow]")
             for secret in required_secrets:
                 desc = f" - {secret.description}" if secret.description else ""
-                console.print(f"        [dim]• {secret.name}{desc}[/dim]")
+                steps.append(f"        [dim]• {secret.name}{desc}[/dim]")
         else:
-            console.print(
+            steps.append(
                 f"     [cyan]docker run -p {expose_port}:{expose_port} {result['image']}[/cyan]"
             )
-        console.print()
-        console.print("  2. Push to registry:")
-        console.print(
+        steps.append("")
+        steps.append("  2. Push to registry:")
+        steps.append(
             f"     [cyan]docker tag {result['image']} <registry>/{agent_name}:latest[/cyan]"
         )
-        console.print(f"     [cyan]docker push <registry>/{agent_name}:latest[/cyan]")
+        steps.append(f"     [cyan]docker push <registry>/{agent_name}:latest[/cyan]")
+        console.print("\n".join(steps))
 
     except typer.Exit:
         raise
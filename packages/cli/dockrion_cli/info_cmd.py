@@ -1,8 +1,11 @@
 """Info commands - Version and doctor diagnostics."""
 
+import importlib.util
+import json
+import os
 import subprocess
 import sys
-from pathlib import Path
+from typing import Callable, List, Optional, Tuple
 
 import typer
 from rich.table import Table
@@ -11,6 +14,44 @@ from .utils import console, error, info, success, warning
 
 app = typer.Typer()
 
+DOCKER_SOCKET = "/var/run/docker.sock"
+
+# Packages doctor expects to be installed
+DOCKRION_PACKAGES = ("dockrion_sdk", "dockrion_schema", "dockrion_common", "dockrion_adapters")
+
+
+def _docker_daemon_version(timeout: float = 0.5) -> Optional[str]:
+    """
+    Ask the Docker daemon for its version over its Unix socket.
+
+    Much cheaper than spawning the docker CLI, and also confirms the daemon
+    is actually running. Returns None when the socket is unavailable (no
+    AF_UNIX, a TCP DOCKER_HOST, Docker Desktop's alternate socket paths) or
+    the daemon does not answer, so callers can fall back to the CLI.
+    """
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        return None
+    docker_host = os.environ.get("DOCKER_HOST", "")
+    if docker_host and not docker_host.startswith("unix://"):
+        return None
+    socket_path = docker_host[len("unix://") :] or DOCKER_SOCKET
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(socket_path)
+            # HTTP/1.0 so the daemon closes the connection after an unchunked body
+            sock.sendall(b"GET /version HTTP/1.0\r\nHost: docker\r\n\r\n")
+            chunks = []
+            while chunk := sock.recv(4096):
+                chunks.append(chunk)
+        _, _, body = b"".join(chunks).partition(b"\r\n\r\n")
+        return str(json.loads(body)["Version"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
 
 @app.command(name="version")
 def version():
@@ -51,6 +92,87 @@ def version():
         raise typer.Exit(1)
 
 
+# A doctor check result: (passed, lines to print as (printer, message), issues)
+_CheckResult = Tuple[bool, List[Tuple[Callable[[str], None], str]], List[str]]
+
+
+def _check_docker() -> _CheckResult:
+    """Check that Docker is available, preferring the daemon socket over the CLI."""
+    daemon_version = _docker_daemon_version()
+    if daemon_version:
+        return True, [(success, f"Docker daemon running: version {daemon_version}")], []
+
+    try:
+        result = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=5)
+        if result.returncode == 0:
+            docker_version = result.stdout.strip()
+            return True, [(success, f"Docker installed: {docker_version}")], []
+        return (
+            False,
+            [(warning, "Docker found but not responding correctly")],
+            ["Check Docker installation"],
+        )
+    except FileNotFoundError:
+        return (
+            False,
+            [(warning, "Docker not found")],
+            ["Install Docker: https://docs.docker.com/get-docker/"],
+        )
+    except subprocess.TimeoutExpired:
+        return (
+            False,
+            [(warning, "Docker command timed out")],
+            ["Check if Docker daemon is running"],
+        )
+    except Exception as e:
+        return False, [(warning, f"Docker check failed: {str(e)}")], ["Verify Docker installation"]
+
+
+def _check_dockfile() -> _CheckResult:
+    """Check for a Dockfile in the current directory and validate it if present."""
+    dockfile_path = "Dockfile.yaml"
+    if not os.path.exists(dockfile_path):
+        return (
+            False,
+            [
+                (info, "No Dockfile.yaml in current directory"),
+                (console.print, "  [dim]Create one with: dockrion init <name>[/dim]"),
+            ],
+            [],
+        )
+
+    lines: List[Tuple[Callable[[str], None], str]] = [
+        (success, "Found Dockfile.yaml in current directory")
+    ]
+    issues: List[str] = []
+    try:
+        from dockrion_sdk import validate_dockspec
+
+        result = validate_dockspec(dockfile_path)
+        if result["valid"]:
+            lines.append((success, "Dockfile is valid"))
+        else:
+            lines.append(
+                (warning, f"Dockfile has validation errors ({len(result['errors'])} errors)")
+            )
+            issues.append("Run 'dockrion validate' to see details")
+    except Exception:
+        pass
+    return True, lines, issues
+
+
+def _check_packages() -> _CheckResult:
+    """Check that the dockrion packages are installed, without importing them."""
+    missing = [name for name in DOCKRION_PACKAGES if importlib.util.find_spec(name) is None]
+    if missing:
+        return (
+            False,
+            [(warning, f"Missing package: {', '.join(missing)}")],
+            ["Install missing packages with: pip install dockrion"],
+        )
+    return True, [(success, "All dockrion packages installed")], []
+
+
 @app.command(name="doctor")
 def doctor():
     """
@@ -80,76 +202,38 @@ def doctor():
         warning(f"Python {sys.version.split()[0]} (3.12+ recommended)")
         issues.append("Upgrade to Python 3.12 or higher")
 
-    # Check Docker
-    total_checks += 1
-    try:
-        result = subprocess.run(["docker", "--version"], capture_output=True, text=True, timeout=5)
-        if result.returncode == 0:
-            docker_version = result.stdout.strip()
-            success(f"Docker installed: {docker_version}")
-            checks_passed += 1
+    # The remaining checks are independent and I/O bound (daemon probe or
+    # subprocess, Dockfile validation, package imports), so run them
+    # concurrently and print their reports in a fixed order afterwards.
+    from concurrent.futures import ThreadPoolExecutor
+
+    checks = (_check_docker, _check_dockfile, _check_packages)
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(check) for check in checks]
+        results = [future.result() for future in futures]
+
+    # Buffer the reports and summary so they reach the terminal in one write
+    with console:
+        for passed, lines, check_issues in results:
+            total_checks += 1
+            if passed:
+                checks_passed += 1
+            for printer, message in lines:
+                printer(message)
+            issues.extend(check_issues)
+
+        # Summary
+        console.print()
+        console.print("[bold]Summary:[/bold]")
+        if checks_passed == total_checks:
+            success(f"All checks passed! ({checks_passed}/{total_checks})")
+            console.print("\n[bold green]✨ Your setup looks good![/bold green]")
         else:
-            warning("Docker found but not responding correctly")
-            issues.append("Check Docker installation")
-    except FileNotFoundError:
-        warning("Docker not found")
-        issues.append("Install Docker: https://docs.docker.com/get-docker/")
-    except subprocess.TimeoutExpired:
-        warning("Docker command timed out")
-        issues.append("Check if Docker daemon is running")
-    except Exception as e:
-        warning(f"Docker check failed: {str(e)}")
-        issues.append("Verify Docker installation")
-
-    # Check for Dockfile
-    total_checks += 1
-    dockfile_path = Path("Dockfile.yaml")
-    if dockfile_path.exists():
-        success("Found Dockfile.yaml in current directory")
-        checks_passed += 1
-
-        # Try to validate it
-        try:
-            from dockrion_sdk import validate_dockspec
-
-            result = validate_dockspec(str(dockfile_path))
-            if result["valid"]:
-                success("Dockfile is valid")
-            else:
-                warning(f"Dockfile has validation errors ({len(result['errors'])} errors)")
-                issues.append("Run 'dockrion validate' to see details")
-        except Exception:
-            pass
-    else:
-        info("No Dockfile.yaml in current directory")
-        console.print("  [dim]Create one with: dockrion init <name>[/dim]")
-
-    # Check SDK installation
-    total_checks += 1
-    try:
-        import dockrion_adapters
-        import dockrion_common
-        import dockrion_schema
-        import dockrion_sdk
-
-        success("All dockrion packages installed")
-        checks_passed += 1
-    except ImportError as e:
-        warning(f"Missing package: {str(e)}")
-        issues.append("Install missing packages with: pip install dockrion")
-
-    # Summary
-    console.print()
-    console.print("[bold]Summary:[/bold]")
-    if checks_passed == total_checks:
-        success(f"All checks passed! ({checks_passed}/{total_checks})")
-        console.print("\n[bold green]✨ Your setup looks good![/bold green]")
-    else:
-        info(f"Passed {checks_passed}/{total_checks} checks")
+            info(f"Passed {checks_passed}/{total_checks} checks")
 
-        if issues:
-            console.print("\n[bold yellow]📋 Action items:[/bold yellow]")
-            for idx, issue in enumerate(issues, 1):
-                console.print(f"  {idx}. {issue}")
+            if issues:
+                console.print("\n[bold yellow]📋 Action items:[/bold yellow]")
+                for idx, issue in enumerate(issues, 1):
+                    console.print(f"  {idx}. {issue}")
 
-    console.print()
+        console.print()
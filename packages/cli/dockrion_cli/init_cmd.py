@@ -1,30 +1,22 @@
 """Init command - Create new Dockfile template."""
 
+import re
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import TYPE_CHECKING, List, Optional, Union
 
 import typer
-from dockrion_schema import (
-    AgentConfig,
-    ApiKeysConfig,
-    AuthConfig,
-    DockSpec,
-    ExposeConfig,
-    IOSchema,
-    IOSubSchema,
-    Metadata,
-    Observability,
-    SecretDefinition,
-    SecretsConfig,
-    StreamingConfig,
-    StreamingEventsConfig,
-    to_yaml_string,
-)
 
 from .utils import confirm_action, console, error, success, warning
 
+if TYPE_CHECKING:
+    from dockrion_schema import IOSchema
+
 app = typer.Typer()
 
+# Characters accepted in an agent name (the schema enforces the stricter lowercase rule)
+AGENT_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
 # Available auth modes
 AUTH_MODES = ["none", "api_key", "jwt"]
 
@@ -41,6 +33,27 @@ STREAMING_EVENTS_PRESETS = ["all", "chat", "debug", "minimal"]
 STREAMING_BACKENDS = ["memory", "redis"]
 
 
+@lru_cache(maxsize=1)
+def _default_io_schema() -> "IOSchema":
+    """Placeholder io_schema shared by every generated template.
+
+    Built once since it never depends on the init options; the spec using it
+    is only dumped. Deferred so the schema models load only when init runs.
+    """
+    from dockrion_schema import IOSchema, IOSubSchema
+
+    return IOSchema(
+        input=IOSubSchema(
+            type="object",
+            properties={"text": {"type": "string"}},
+        ),
+        output=IOSubSchema(
+            type="object",
+            properties={"result": {"type": "string"}},
+        ),
+    )
+
+
 def generate_dockfile_template(
     name: str,
     framework: str = "langgraph",
@@ -79,6 +92,21 @@ def generate_dockfile_template(
     Returns:
         YAML string representation of the Dockfile template
     """
+    from dockrion_schema import (
+        AgentConfig,
+        ApiKeysConfig,
+        AuthConfig,
+        DockSpec,
+        ExposeConfig,
+        Metadata,
+        Observability,
+        SecretDefinition,
+        SecretsConfig,
+        StreamingConfig,
+        StreamingEventsConfig,
+        to_yaml_string,
+    )
+
     # Build agent config based on mode
     if handler_mode:
         agent = AgentConfig(
@@ -208,16 +236,7 @@ def generate_dockfile_template(
     spec = DockSpec(
         version="1.0",
         agent=agent,
-        io_schema=IOSchema(
-            input=IOSubSchema(
-                type="object",
-                properties={"text": {"type": "string"}},
-            ),
-            output=IOSubSchema(
-                type="object",
-                properties={"result": {"type": "string"}},
-            ),
-        ),
+        io_schema=_default_io_schema(),
         expose=expose,
         auth=auth,
         secrets=secrets,
@@ -385,7 +404,7 @@ def init(
     """
     try:
         # Validate agent name
-        if not name.replace("-", "").replace("_", "").isalnum():
+        if not AGENT_NAME_RE.fullmatch(name):
             error("Agent name must contain only letters, numbers, hyphens, and underscores")
             raise typer.Exit(1)
 
@@ -497,24 +516,25 @@ def init(
         if observability:
             console.print("  • Observability: [green]enabled[/green]")
 
-        # Show next steps
-        console.print("\n[bold cyan]Next steps:[/bold cyan]")
+        # Show next steps, rendered and written in one print
+        steps = ["\n[bold cyan]Next steps:[/bold cyan]"]
         if handler:
-            console.print("  1. Edit the Dockfile to customize your service:")
-            console.print("     [dim]• Set the correct handler path[/dim]")
+            steps.append("  1. Edit the Dockfile to customize your service:")
+            steps.append("     [dim]• Set the correct handler path[/dim]")
         else:
-            console.print("  1. Edit the Dockfile to customize your agent:")
-            console.print("     [dim]• Set the correct entrypoint[/dim]")
-        console.print("     [dim]• Define input/output schema[/dim]")
+            steps.append("  1. Edit the Dockfile to customize your agent:")
+            steps.append("     [dim]• Set the correct entrypoint[/dim]")
+        steps.append("     [dim]• Define input/output schema[/dim]")
         if auth == "api_key":
-            console.print("     [dim]• Configure API key environment variable[/dim]")
+            steps.append("     [dim]• Configure API key environment variable[/dim]")
         elif auth == "jwt":
-            console.print("     [dim]• Configure JWT settings (jwks_url, issuer, audience)[/dim]")
-        console.print("  2. Implement your agent code")
-        console.print("  3. Validate the Dockfile:")
-        console.print(f"     [cyan]dockrion validate {output}[/cyan]")
-        console.print("  4. Test your agent:")
-        console.print(f"     [cyan]dockrion test {output} --payload '{{}}'[/cyan]")
+            steps.append("     [dim]• Configure JWT settings (jwks_url, issuer, audience)[/dim]")
+        steps.append("  2. Implement your agent code")
+        steps.append("  3. Validate the Dockfile:")
+        steps.append(f"     [cyan]dockrion validate {output}[/cyan]")
+        steps.append("  4. Test your agent:")
+        steps.append(f"     [cyan]dockrion test {output} --payload '{{}}'[/cyan]")
+        console.print("\n".join(steps))
 
     except typer.Exit:
         raise
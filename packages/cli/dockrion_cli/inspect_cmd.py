@@ -1,23 +1,55 @@
 """Inspect command - Analyze agent output and generate schemas."""
 
 import json
-from pathlib import Path
+import os
 from typing import Any, Dict, List, Optional
 
 import typer
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-from .utils import console, error, handle_error, info, success, warning
+from .utils import console, error, handle_error, info, status, success, warning
+
+# Serialized output larger than this is printed without syntax highlighting
+HIGHLIGHT_MAX_CHARS = 64 * 1024
 
 # Note: The inspect function is standalone, not using Typer app pattern
 # because main.py uses app.command() decorator pattern
 
 
+# JSON Schema type for each exact built-in type. bool is keyed separately from
+# int, so a dict lookup gets it right without isinstance ordering.
+_JSON_TYPES: Dict[type, str] = {
+    type(None): "null",
+    bool: "boolean",
+    int: "integer",
+    float: "number",
+    str: "string",
+    list: "array",
+    dict: "object",
+}
+
+
+def _json_type(value: Any) -> str:
+    """Map a Python value to its JSON Schema type name."""
+    json_type = _JSON_TYPES.get(type(value))
+    if json_type is not None:
+        return json_type
+
+    # Subclasses of the built-ins (bool before int, since bool is an int)
+    for base in (bool, int, float, str, list, dict):
+        if isinstance(value, base):
+            return _JSON_TYPES[base]
+
+    # Fallback for any other type
+    return "string"
+
+
 def infer_json_schema(value: Any, required: bool = True) -> Dict[str, Any]:
     """
     Infer JSON Schema from a Python value.
 
+    Nested values are walked with an explicit stack rather than recursion, so
+    deeply nested agent output cannot hit the interpreter's recursion limit.
+
     Args:
         value: Any Python value (after serialization)
         required: Whether to mark fields as required
@@ -25,51 +57,38 @@ def infer_json_schema(value: Any, required: bool = True) -> Dict[str, Any]:
     Returns:
         JSON Schema dictionary
     """
-    if value is None:
-        return {"type": "null"}
+    root: Dict[str, Any] = {}
+    stack = [(value, root)]
 
-    if isinstance(value, bool):
-        return {"type": "boolean"}
+    while stack:
+        value, schema = stack.pop()
+        json_type = _json_type(value)
+        schema["type"] = json_type
 
-    if isinstance(value, int):
-        return {"type": "integer"}
+        if json_type == "array":
+            # Infer items schema from first element
+            # (Could be smarter and merge schemas from all elements)
+            items_schema: Dict[str, Any] = {}
+            schema["items"] = items_schema
+            if value:
+                stack.append((value[0], items_schema))
 
-    if isinstance(value, float):
-        return {"type": "number"}
+        elif json_type == "object":
+            properties: Dict[str, Any] = {}
+            required_fields = []
 
-    if isinstance(value, str):
-        return {"type": "string"}
+            for k, v in value.items():
+                child: Dict[str, Any] = {}
+                properties[k] = child
+                stack.append((v, child))
+                if v is not None:
+                    required_fields.append(k)
 
-    if isinstance(value, list):
-        if not value:
-            return {"type": "array", "items": {}}
+            schema["properties"] = properties
+            if required_fields:
+                schema["required"] = sorted(required_fields)
 
-        # Infer items schema from first element
-        # (Could be smarter and merge schemas from all elements)
-        items_schema = infer_json_schema(value[0], required=False)
-        return {"type": "array", "items": items_schema}
-
-    if isinstance(value, dict):
-        properties = {}
-        required_fields = []
-
-        for k, v in value.items():
-            properties[k] = infer_json_schema(v, required=False)
-            if v is not None:
-                required_fields.append(k)
-
-        schema: Dict[str, Any] = {
-            "type": "object",
-            "properties": properties,
-        }
-
-        if required_fields:
-            schema["required"] = sorted(required_fields)
-
-        return schema
-
-    # Fallback for any other type
-    return {"type": "string"}
+    return root
 
 
 def generate_io_schema_yaml(
@@ -101,7 +120,13 @@ def generate_io_schema_yaml(
         }
     }
 
-    return yaml.dump(io_schema, default_flow_style=False, sort_keys=False)
+    # Prefer the libyaml emitter when available (same output, several times faster)
+    return yaml.dump(
+        io_schema,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+    )
 
 
 def inspect(
@@ -141,8 +166,11 @@ def inspect(
         dockrion inspect -f input.json --generate-schema
     """
     try:
+        from rich.panel import Panel
+        from rich.syntax import Syntax
+
         # Validate Dockfile exists
-        if not Path(path).exists():
+        if not os.path.exists(path):
             error(f"Dockfile not found: {path}")
             raise typer.Exit(1)
 
@@ -188,7 +216,7 @@ def inspect(
             raise typer.Exit(1)
 
         # Invoke agent
-        with console.status("[bold green]Invoking agent..."):
+        with status("[bold green]Invoking agent..."):
             result = invoke_local(path, payload_data)
 
         success("Agent invocation successful")
@@ -204,8 +232,14 @@ def inspect(
             console.print("[bold]Serialized Output:[/bold]")
             try:
                 output_json = json.dumps(result, indent=2)
-                syntax = Syntax(output_json, "json", theme="monokai")
-                console.print(Panel(syntax, title="Agent Output", border_style="green"))
+                if len(output_json) > HIGHLIGHT_MAX_CHARS:
+                    # Tokenizing and laying out a large payload with Pygments takes
+                    # seconds; write it through as plain JSON instead
+                    console.print("[dim](large output, shown without highlighting)[/dim]")
+                    console.file.write(output_json + "\n")
+                else:
+                    syntax = Syntax(output_json, "json", theme="monokai")
+                    console.print(Panel(syntax, title="Agent Output", border_style="green"))
             except TypeError as e:
                 warning(f"Output contains non-serializable objects: {e}")
                 console.print("[yellow]Falling back to repr():[/yellow]")
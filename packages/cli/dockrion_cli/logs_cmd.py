@@ -1,7 +1,6 @@
 """Logs command - View agent logs."""
 
 import typer
-from dockrion_sdk import get_local_logs, stream_agent_logs
 
 from .utils import console, handle_error, info
 
@@ -27,6 +26,8 @@ def logs(
         dockrion logs invoice-copilot --follow
     """
     try:
+        from dockrion_sdk import get_local_logs, stream_agent_logs
+
         if follow:
             info(f"Following logs for {agent} (Press Ctrl+C to stop)")
             console.print()
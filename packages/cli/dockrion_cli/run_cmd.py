@@ -1,15 +1,58 @@
 """Run command - Run agent server locally for development."""
 
-from pathlib import Path
+import os
+import select
+import subprocess
 
 import typer
-from dockrion_common import MissingSecretError, get_env_summary
-from dockrion_sdk import load_dockspec, run_local
 
 from .utils import console, error, handle_error, info, success
 
 app = typer.Typer()
 
+# Endpoints served by the generated runtime, shown once the server starts
+ENDPOINTS_BANNER = "\n".join(
+    [
+        "\n[bold cyan]Available endpoints:[/bold cyan]",
+        "  • POST {base_url}/invoke - Invoke agent",
+        "  • GET  {base_url}/health - Health check",
+        "  • GET  {base_url}/schema - I/O schema",
+        "  • GET  {base_url}/metrics - Metrics",
+        "  • GET  {base_url}/docs - Swagger UI",
+        "\n[bold yellow]Press Ctrl+C to stop the server[/bold yellow]",
+    ]
+)
+
+
+def _wait_process(proc: subprocess.Popen, timeout: float) -> int:
+    """
+    Wait up to ``timeout`` seconds for ``proc`` to exit and return its exit code.
+
+    ``Popen.wait(timeout=...)`` polls ``waitpid`` in a sleep loop; on Linux a
+    pidfd becomes readable the moment the process exits, so the shutdown path
+    wakes up once instead. Falls back to ``Popen.wait`` where pidfds are
+    unavailable.
+
+    Raises:
+        subprocess.TimeoutExpired: If the process is still running after ``timeout``
+    """
+    if proc.returncode is not None:
+        # Already reaped: the pid may have been reused, don't open a pidfd on it
+        return proc.returncode
+    try:
+        pidfd = os.pidfd_open(proc.pid)
+    except (AttributeError, OSError):
+        # No pidfd support (non-Linux, old kernel)
+        return proc.wait(timeout=timeout)
+
+    try:
+        ready, _, _ = select.select([pidfd], [], [], timeout)
+    finally:
+        os.close(pidfd)
+    if not ready:
+        raise subprocess.TimeoutExpired(proc.args, timeout)
+    return proc.wait()
+
 
 @app.command(name="run")
 def run(
@@ -59,8 +102,11 @@ def run(
         dockrion run --verbose
     """
     try:
+        from dockrion_common import MissingSecretError, get_env_summary
+        from dockrion_sdk import load_dockspec, run_local
+
         # Validate file exists
-        if not Path(path).exists():
+        if not os.path.exists(path):
             error(f"Dockfile not found: {path}")
             raise typer.Exit(1)
 
@@ -72,11 +118,11 @@ def run(
 
             # Show secrets status if configured
             if spec.secrets and verbose:
-                from dockrion_common import load_env_files, resolve_secrets
+                from dockrion_common import resolve_secrets
 
-                project_root = Path(path).resolve().parent
-                loaded_env = load_env_files(project_root, env_file)
-                resolved = resolve_secrets(spec.secrets, loaded_env)
+                # load_dockspec has already injected the project's env files into
+                # os.environ, which resolve_secrets reads as the shell environment
+                resolved = resolve_secrets(spec.secrets, {})
                 summary = get_env_summary(spec.secrets, resolved)
 
                 if summary.get("has_secrets_config"):
@@ -110,15 +156,8 @@ def run(
         console.print()
         success(f"Server started at [bold]http://{effective_host}:{effective_port}[/bold]")
 
-        # Show available endpoints
-        console.print("\n[bold cyan]Available endpoints:[/bold cyan]")
-        console.print(f"  • POST http://{effective_host}:{effective_port}/invoke - Invoke agent")
-        console.print(f"  • GET  http://{effective_host}:{effective_port}/health - Health check")
-        console.print(f"  • GET  http://{effective_host}:{effective_port}/schema - I/O schema")
-        console.print(f"  • GET  http://{effective_host}:{effective_port}/metrics - Metrics")
-        console.print(f"  • GET  http://{effective_host}:{effective_port}/docs - Swagger UI")
-
-        console.print("\n[bold yellow]Press Ctrl+C to stop the server[/bold yellow]")
+        # Show available endpoints, rendered and written in one print
+        console.print(ENDPOINTS_BANNER.format(base_url=f"http://{effective_host}:{effective_port}"))
 
         # Wait for Ctrl+C
         try:
@@ -128,7 +167,7 @@ def run(
             info("Shutting down server...")
             proc.terminate()
             try:
-                proc.wait(timeout=5)
+                _wait_process(proc, timeout=5)
             except Exception:
                 proc.kill()
             console.print()
@@ -1,12 +1,20 @@
 """Test command - Test agent locally without starting a server."""
 
 import json
-from pathlib import Path
+import os
 
 import typer
-from dockrion_sdk import invoke_local
 
-from .utils import console, error, handle_error, info, print_dict_as_json, success, warning
+from .utils import (
+    console,
+    error,
+    handle_error,
+    info,
+    print_dict_as_json,
+    status,
+    success,
+    warning,
+)
 
 app = typer.Typer()
 
@@ -34,8 +42,10 @@ def test(
         dockrion test --verbose
     """
     try:
+        from dockrion_sdk import invoke_local
+
         # Validate Dockfile exists
-        if not Path(path).exists():
+        if not os.path.exists(path):
             error(f"Dockfile not found: {path}")
             raise typer.Exit(1)
 
@@ -76,7 +86,7 @@ def test(
             print_dict_as_json(payload_data, "Input")
 
         # Invoke agent
-        with console.status("[bold green]Invoking agent..."):
+        with status("[bold green]Invoking agent..."):
             result = invoke_local(path, payload_data)
 
         # Show success
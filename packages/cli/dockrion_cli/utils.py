@@ -1,12 +1,11 @@
 """Utility functions and helpers for CLI commands."""
 
 import traceback
-from typing import Any, Dict, List
+from contextlib import nullcontext
+from typing import Any, ContextManager, Dict, List
 
-from dockrion_common.errors import DockrionError, ValidationError
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
+from rich.markup import escape
 from rich.table import Table
 
 # Global console instance
@@ -33,6 +32,19 @@ def info(message: str):
     console.print(f"[bold blue]ℹ️  {message}[/bold blue]")
 
 
+def status(message: str) -> ContextManager[Any]:
+    """
+    Show a spinner with ``message`` while the block runs, on terminals only.
+
+    Rich's status spinner repaints from a background thread and redirects
+    stdout/stderr; when output goes to a pipe or CI log nothing is shown, so
+    skip it there.
+    """
+    if console.is_terminal:
+        return console.status(message)
+    return nullcontext()
+
+
 def print_validation_result(result: Dict[str, Any]):
     """
     Pretty print validation results with errors and warnings.
@@ -67,6 +79,9 @@ def print_dict_as_json(data: Dict[str, Any], title: str = "Output"):
     """Print a dictionary as formatted JSON."""
     import json
 
+    from rich.panel import Panel
+    from rich.syntax import Syntax
+
     json_str = json.dumps(data, indent=2)
     syntax = Syntax(json_str, "json", theme="monokai", line_numbers=False)
     console.print(Panel(syntax, title=title, border_style="green"))
@@ -80,6 +95,8 @@ def handle_error(e: Exception, verbose: bool = False):
         e: The exception to handle
         verbose: If True, show full stack trace
     """
+    from dockrion_common.errors import DockrionError, ValidationError
+
     if isinstance(e, ValidationError):
         error(f"Validation Error: {str(e)}")
         console.print(
@@ -142,9 +159,14 @@ def confirm_action(message: str, default: bool = False) -> bool:
     Returns:
         True if user confirms, False otherwise
     """
-    from rich.prompt import Confirm
-
-    return Confirm.ask(message, default=default)
+    # A single line read on the shared console; rich.prompt.Confirm adds an
+    # import and a re-prompt loop that a yes/no question doesn't need.
+    # Anything other than y/yes (or Enter when default is True) means no.
+    choices = "[Y/n]" if default else "[y/N]"
+    answer = console.input(f"{escape(message)} {escape(choices)} ").strip().lower()
+    if not answer:
+        return default
+    return answer in ("y", "yes")
 
 
 def print_command_examples(command_name: str, examples: List[str]):
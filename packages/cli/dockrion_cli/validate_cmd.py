@@ -1,9 +1,8 @@
 """Validate command - Validate Dockfile configuration."""
 
-from pathlib import Path
+import os
 
 import typer
-from dockrion_sdk import validate_dockspec
 
 from .utils import (
     console,
@@ -11,6 +10,7 @@ from .utils import (
     handle_error,
     print_agent_info,
     print_validation_result,
+    status,
     success,
     warning,
 )
@@ -43,9 +43,10 @@ def validate(
         dockrion validate --verbose
     """
     try:
+        from dockrion_sdk import validate_dockspec
+
         # Check if file exists
-        file_path = Path(path)
-        if not file_path.exists():
+        if not os.path.exists(path):
             error(f"File not found: {path}")
             if not quiet:
                 console.print(
@@ -55,7 +56,7 @@ def validate(
 
         # Validate
         if not quiet:
-            with console.status("[bold green]Validating Dockfile..."):
+            with status("[bold green]Validating Dockfile..."):
                 result = validate_dockspec(path)
         else:
             result = validate_dockspec(path)
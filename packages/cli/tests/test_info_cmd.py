@@ -1,7 +1,13 @@
 """Tests for info commands (version, doctor)."""
 
+import socket
+import tempfile
+import threading
+from pathlib import Path
+
 from typer.testing import CliRunner
 
+from dockrion_cli.info_cmd import _docker_daemon_version
 from dockrion_cli.main import app
 
 runner = CliRunner()
@@ -20,3 +26,68 @@ def test_doctor():
     result = runner.invoke(app, ["doctor"])
     assert result.exit_code == 0
     assert "diagnostic" in result.stdout.lower() or "check" in result.stdout.lower()
+
+
+def test_doctor_reads_docker_version_from_socket(monkeypatch):
+    """Test that doctor asks the daemon socket for its version."""
+    # AF_UNIX paths are length-limited, so avoid pytest's long tmp_path
+    with tempfile.TemporaryDirectory() as tmp:
+        socket_path = str(Path(tmp) / "docker.sock")
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(socket_path)
+        server.listen(1)
+
+        def serve():
+            conn, _ = server.accept()
+            with conn:
+                conn.recv(4096)
+                conn.sendall(
+                    b"HTTP/1.0 200 OK\r\nContent-Type: application/json\r\n\r\n"
+                    b'{"Version": "27.1.1", "ApiVersion": "1.46"}'
+                )
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        monkeypatch.setenv("DOCKER_HOST", f"unix://{socket_path}")
+        result = runner.invoke(app, ["doctor"])
+        thread.join(timeout=5)
+        server.close()
+
+    assert result.exit_code == 0
+    assert "Docker daemon running: version 27.1.1" in result.stdout
+
+
+def test_docker_daemon_version_missing_socket(monkeypatch):
+    """Test that a missing socket reports no daemon so doctor falls back to the CLI."""
+    monkeypatch.setenv("DOCKER_HOST", "unix:///nonexistent/docker.sock")
+    assert _docker_daemon_version() is None
+    monkeypatch.setenv("DOCKER_HOST", "tcp://127.0.0.1:2375")
+    assert _docker_daemon_version() is None
+
+
+def test_doctor_reports_checks_in_order(sample_dockfile, monkeypatch):
+    """Test that concurrently run checks are still reported in a fixed order."""
+    monkeypatch.chdir(Path(sample_dockfile).parent)
+    result = runner.invoke(app, ["doctor"])
+    assert result.exit_code == 0
+
+    stdout = result.stdout
+    found = stdout.index("Found Dockfile.yaml")
+    assert stdout.index("Python") < stdout.index("Docker") < found
+    assert found < stdout.index("Dockfile is valid") < stdout.index("All dockrion packages")
+
+
+def test_doctor_reports_missing_packages(monkeypatch):
+    """Test that doctor names packages it can't find, without importing them."""
+    import importlib.util
+
+    find_spec = importlib.util.find_spec
+    monkeypatch.setattr(
+        importlib.util,
+        "find_spec",
+        lambda name, *args: None if name == "dockrion_adapters" else find_spec(name, *args),
+    )
+    result = runner.invoke(app, ["doctor"])
+    assert result.exit_code == 0
+    assert "Missing package: dockrion_adapters" in result.stdout
+    assert "pip install dockrion" in result.stdout
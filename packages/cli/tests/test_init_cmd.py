@@ -42,6 +42,16 @@ def test_init_existing_file_no_force(tmp_path, monkeypatch):
     assert Path("Dockfile.yaml").read_text() == "existing"
 
 
+def test_init_overwrite_confirmed(tmp_path, monkeypatch):
+    """Test init replaces an existing Dockfile when the user answers yes."""
+    monkeypatch.chdir(tmp_path)
+    Path("Dockfile.yaml").write_text("existing")
+    result = runner.invoke(app, ["init", "test-agent"], input="yes\n")
+    assert result.exit_code == 0
+    assert "Overwrite? [y/N]" in result.stdout
+    assert "test-agent" in Path("Dockfile.yaml").read_text()
+
+
 def test_init_with_force(tmp_path, monkeypatch):
     """Test init with force flag."""
     monkeypatch.chdir(tmp_path)
@@ -106,6 +106,31 @@ class TestInferJsonSchema:
         assert schema["properties"]["count"]["type"] == "integer"
         assert schema["properties"]["data"]["type"] == "object"
 
+    def test_infer_subclassed_values(self):
+        class Label(str):
+            pass
+
+        schema = infer_json_schema({"label": Label("x"), "flag": True, "other": object()})
+
+        assert schema["properties"]["label"] == {"type": "string"}
+        assert schema["properties"]["flag"] == {"type": "boolean"}
+        assert schema["properties"]["other"] == {"type": "string"}
+
+    def test_infer_deeply_nested(self):
+        data: list = []
+        current = data
+        for _ in range(5000):
+            current.append([])
+            current = current[0]
+
+        schema = infer_json_schema(data)
+
+        depth = 0
+        while schema["items"]:
+            schema = schema["items"]
+            depth += 1
+        assert depth == 5000
+
 
 class TestGenerateIoSchema:
     """Tests for io_schema generation."""
@@ -266,6 +291,19 @@ class TestInspectCommand:
         if result.exit_code == 0:
             assert "input" in result.stdout.lower()
 
+    def test_inspect_large_output_skips_highlighting(self, sample_dockfile, monkeypatch):
+        """Large outputs are printed as plain JSON rather than a highlighted panel."""
+        import dockrion_sdk
+
+        output = {"items": [{"id": i, "name": f"item {i}"} for i in range(3000)]}
+        monkeypatch.setattr(dockrion_sdk, "invoke_local", lambda path, payload: output)
+
+        result = runner.invoke(app, ["inspect", sample_dockfile, "--payload", '{"text": "test"}'])
+
+        assert result.exit_code == 0
+        assert "without highlighting" in result.stdout
+        assert json.dumps(output, indent=2) in result.stdout
+
 
 class TestInspectCommandHelp:
     """Test inspect command help and documentation."""
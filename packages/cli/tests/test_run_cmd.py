@@ -0,0 +1,38 @@
+"""Tests for run command helpers."""
+
+import subprocess
+import sys
+
+import pytest
+
+from dockrion_cli.run_cmd import _wait_process
+
+
+def _spawn(code: str) -> subprocess.Popen:
+    return subprocess.Popen([sys.executable, "-c", code])
+
+
+def test_wait_process_returns_exit_code():
+    """Exited processes are reaped and their exit code returned."""
+    proc = _spawn("import sys; sys.exit(3)")
+    assert _wait_process(proc, timeout=10) == 3
+    assert proc.returncode == 3
+
+
+def test_wait_process_after_reap():
+    """Waiting on an already reaped process returns its exit code."""
+    proc = _spawn("pass")
+    proc.wait()
+    assert _wait_process(proc, timeout=1) == 0
+
+
+def test_wait_process_times_out():
+    """A process still running after the timeout raises TimeoutExpired."""
+    proc = _spawn("import time; time.sleep(30)")
+    try:
+        with pytest.raises(subprocess.TimeoutExpired):
+            _wait_process(proc, timeout=0.1)
+        assert proc.returncode is None
+    finally:
+        proc.kill()
+        proc.wait()
@@ -31,3 +31,15 @@ def test_validate_with_quiet(sample_dockfile):
     """Test validate with quiet flag."""
     result = runner.invoke(app, ["validate", sample_dockfile, "--quiet"])
     assert result.exit_code == 0
+
+
+def test_validate_skips_spinner_without_terminal(sample_dockfile, monkeypatch):
+    """No status spinner is started when output is not a terminal."""
+    from dockrion_cli.utils import console
+
+    def fail_status(*args, **kwargs):
+        raise AssertionError("spinner started for non-terminal output")
+
+    monkeypatch.setattr(console, "status", fail_status)
+    result = runner.invoke(app, ["validate", sample_dockfile])
+    assert result.exit_code == 0
@@ -138,6 +138,13 @@ class _RuntimeDefaults:
     # Rate limiting
     RATE_LIMIT: str = "100/m"
 
+    # Invoke batching (a max size of 1 disables batching)
+    BATCH_MAX_SIZE: int = 1
+    BATCH_MAX_WAIT_MS: int = 10
+
+    # Seconds a rendered /metrics payload is reused across scrapes (0 disables)
+    METRICS_CACHE_TTL_SEC: float = 0.5
+
 
 RuntimeDefaults = _RuntimeDefaults()
 
@@ -25,6 +25,16 @@ from contextvars import ContextVar
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+# Log level names (lowercase) to logging constants
+_LOG_LEVELS: Dict[str, int] = {
+    "debug": logging.DEBUG,
+    "info": logging.INFO,
+    "warn": logging.WARNING,
+    "warning": logging.WARNING,
+    "error": logging.ERROR,
+    "critical": logging.CRITICAL,
+}
+
 # Thread-safe context variable for request/correlation ID
 _request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
 
@@ -140,15 +150,25 @@ class DockrionLogger:
 
     def _get_log_level(self, level: str) -> int:
         """Convert log level string to logging constant"""
-        level_map = {
-            "debug": logging.DEBUG,
-            "info": logging.INFO,
-            "warn": logging.WARNING,
-            "warning": logging.WARNING,
-            "error": logging.ERROR,
-            "critical": logging.CRITICAL,
-        }
-        return level_map.get(level.lower(), logging.INFO)
+        return _LOG_LEVELS.get(level.lower(), logging.INFO)
+
+    def is_enabled_for(self, level: str) -> bool:
+        """
+        Check whether messages at a level would be emitted.
+
+        Use it to skip building expensive context fields on hot paths.
+
+        Args:
+            level: Lowercase log level (debug, info, warning, error, critical)
+
+        Returns:
+            True if the level is enabled
+
+        Example:
+            >>> if logger.is_enabled_for("debug"):
+            ...     logger.debug("Payload received", keys=list(payload.keys()))
+        """
+        return self.logger.isEnabledFor(_LOG_LEVELS.get(level, logging.INFO))
 
     def _log(self, level: str, msg: str, **extra: Any) -> None:
         """
@@ -159,11 +179,15 @@ class DockrionLogger:
             msg: Log message
             **extra: Additional context fields
         """
+        # Skip building the context dict when the level is filtered out
+        if not self.is_enabled_for(level):
+            return
+
         # Combine persistent context with extra fields
         context = {**self.context, **extra}
 
         # Create log record with context
-        log_method = getattr(self.logger, level.lower())
+        log_method = getattr(self.logger, level)
         log_method(msg, extra={"service_name": self.service_name, "context": context})
 
     def debug(self, msg: str, **context: Any) -> None:
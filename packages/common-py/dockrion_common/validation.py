@@ -12,12 +12,15 @@ Usage:
 """
 
 import re
+from functools import lru_cache
 from typing import Tuple
 
 from .constants import Patterns
 from .errors import ValidationError
 
 
+# Parsing is pure, so results are cached for repeated loads of the same path
+@lru_cache(maxsize=256)
 def validate_entrypoint(entrypoint: str) -> Tuple[str, str]:
     """
     Validate and parse entrypoint format: 'module.path:callable'.
@@ -41,19 +44,17 @@ def validate_entrypoint(entrypoint: str) -> Tuple[str, str]:
     if not entrypoint:
         raise ValidationError("Entrypoint cannot be empty")
 
-    if ":" not in entrypoint:
+    module_path, separator, callable_name = entrypoint.partition(":")
+    if not separator:
         raise ValidationError(
             f"Entrypoint must be in format 'module:callable'. Got: '{entrypoint}'"
         )
 
-    parts = entrypoint.split(":")
-    if len(parts) != 2:
+    if ":" in callable_name:
         raise ValidationError(
             f"Entrypoint must have exactly one ':' separator. Got: '{entrypoint}'"
         )
 
-    module_path, callable_name = parts
-
     if not module_path or not callable_name:
         raise ValidationError(f"Both module and callable must be non-empty. Got: '{entrypoint}'")
 
@@ -68,6 +69,7 @@ def validate_entrypoint(entrypoint: str) -> Tuple[str, str]:
     return module_path.strip(), callable_name.strip()
 
 
+@lru_cache(maxsize=256)
 def validate_handler(handler: str) -> Tuple[str, str]:
     """
     Validate and parse handler format: 'module.path:callable'.
@@ -96,15 +98,13 @@ def validate_handler(handler: str) -> Tuple[str, str]:
     if not handler:
         raise ValidationError("Handler cannot be empty")
 
-    if ":" not in handler:
+    module_path, separator, callable_name = handler.partition(":")
+    if not separator:
         raise ValidationError(f"Handler must be in format 'module:callable'. Got: '{handler}'")
 
-    parts = handler.split(":")
-    if len(parts) != 2:
+    if ":" in callable_name:
         raise ValidationError(f"Handler must have exactly one ':' separator. Got: '{handler}'")
 
-    module_path, callable_name = parts
-
     if not module_path or not callable_name:
         raise ValidationError(f"Both module and callable must be non-empty. Got: '{handler}'")
 
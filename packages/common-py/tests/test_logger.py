@@ -57,6 +57,20 @@ class TestLogger:
         logger.critical("Critical message", severity="high")
         # Just verify no exceptions
 
+    def test_logger_skips_disabled_level(self, mocker):
+        """Test records below the configured level are not emitted"""
+        logger = get_logger("test-service-level", log_level="INFO")
+        debug = mocker.patch.object(logger.logger, "debug")
+        logger.debug("Debug message", data={"key": "value"})
+        debug.assert_not_called()
+
+    def test_logger_is_enabled_for(self):
+        """Test level checks follow the configured level"""
+        logger = get_logger("test-service-enabled", log_level="INFO")
+        assert logger.is_enabled_for("info")
+        assert logger.is_enabled_for("error")
+        assert not logger.is_enabled_for("debug")
+
     def test_logger_with_context(self):
         """Test logger with context"""
         logger = get_logger("test-service")
@@ -27,6 +27,7 @@ from .endpoints import (
     create_runs_router,
     create_welcome_router,
 )
+from .invocation import InvokeBatcher
 from .metrics import RuntimeMetrics
 from .openapi import build_security_schemes, configure_openapi_security
 from .policies import create_policy_engine
@@ -123,6 +124,20 @@ def create_app(
                 adapter.load(config.agent_entrypoint or "")
                 logger.info(f"✅ Agent loaded from {config.agent_entrypoint}")
 
+            # Start invoke batcher if enabled
+            if config.batch_max_size > 1:
+                state.batcher = InvokeBatcher(
+                    adapter,
+                    max_batch=config.batch_max_size,
+                    max_wait_ms=config.batch_max_wait_ms,
+                )
+                state.batcher.start()
+                logger.info(
+                    "✅ Invoke batching enabled",
+                    max_batch=config.batch_max_size,
+                    max_wait_ms=config.batch_max_wait_ms,
+                )
+
             # Initialize streaming components if enabled
             if config.enable_async_runs or config.streaming.enabled:
                 try:
@@ -175,6 +190,10 @@ def create_app(
 
         yield
 
+        # Stop invoke batcher
+        if state.batcher is not None:
+            await state.batcher.stop()
+
         # Cleanup streaming components
         if state.event_bus is not None:
             try:
@@ -218,7 +237,7 @@ def create_app(
             raise HTTPException(status_code=e.status_code, detail=e.to_dict())
 
     # Generate dynamic Pydantic models from Dockfile schema
-    agent_name_clean = config.agent_name.replace("-", "_").replace(".", "_").capitalize()
+    agent_name_clean = config.model_name_prefix
 
     InputModel = create_pydantic_model_from_schema(
         f"{agent_name_clean}Input", spec.io_schema.input if spec.io_schema else None
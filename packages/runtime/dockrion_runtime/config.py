@@ -6,6 +6,7 @@ and RuntimeState for managing runtime state between lifespan and endpoints.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Union
 
 from dockrion_adapters.base import AgentAdapter
@@ -14,6 +15,7 @@ from dockrion_common.constants import RuntimeDefaults, StreamingDefaults, Timeou
 from dockrion_schema import DockSpec
 
 from .auth import BaseAuthHandler
+from .invocation import InvokeBatcher
 from .metrics import RuntimeMetrics
 from .policies import RuntimePolicyEngine
 
@@ -104,6 +106,13 @@ class RuntimeConfig:
     enable_async_runs: bool = False
     timeout_sec: int = Timeouts.REQUEST
 
+    # Invoke batching (batch_max_size <= 1 disables batching)
+    batch_max_size: int = RuntimeDefaults.BATCH_MAX_SIZE
+    batch_max_wait_ms: int = RuntimeDefaults.BATCH_MAX_WAIT_MS
+
+    # Metrics (metrics_cache_ttl_sec <= 0 renders every scrape)
+    metrics_cache_ttl_sec: float = RuntimeDefaults.METRICS_CACHE_TTL_SEC
+
     # Streaming configuration
     streaming: StreamingRuntimeConfig = field(default_factory=StreamingRuntimeConfig)
 
@@ -126,6 +135,11 @@ class RuntimeConfig:
             raise ValueError("No invocation target configured (missing handler or entrypoint)")
         return target
 
+    @cached_property
+    def model_name_prefix(self) -> str:
+        """Agent name normalized for use as a prefix in generated Pydantic model names."""
+        return self.agent_name.replace("-", "_").replace(".", "_").capitalize()
+
     @classmethod
     def from_spec(
         cls,
@@ -164,6 +178,15 @@ class RuntimeConfig:
             else Timeouts.REQUEST
         )
 
+        # Extract invoke batching options from arguments dict
+        batch_max_size = int(arguments.get("batch_max_size", RuntimeDefaults.BATCH_MAX_SIZE))
+        batch_max_wait_ms = int(
+            arguments.get("batch_max_wait_ms", RuntimeDefaults.BATCH_MAX_WAIT_MS)
+        )
+        metrics_cache_ttl_sec = float(
+            arguments.get("metrics_cache_ttl_sec", RuntimeDefaults.METRICS_CACHE_TTL_SEC)
+        )
+
         # cors is Optional[Dict[str, List[str]]] in schema - extract safely
         cors_config = expose.cors if expose and expose.cors else None
         if cors_config and isinstance(cors_config, dict):
@@ -220,6 +243,9 @@ class RuntimeConfig:
             enable_async_runs=enable_async_runs,
             streaming=streaming_config,
             timeout_sec=timeout_sec,
+            batch_max_size=batch_max_size,
+            batch_max_wait_ms=batch_max_wait_ms,
+            metrics_cache_ttl_sec=metrics_cache_ttl_sec,
             auth_enabled=bool(auth and auth.mode != "none"),
             auth_mode=auth.mode if auth else RuntimeDefaults.AUTH_MODE,
             version=metadata.version
@@ -246,6 +272,9 @@ class RuntimeState:
         self.policy_engine: Optional[RuntimePolicyEngine] = None
         self.ready: bool = False
 
+        # Invoke batcher (initialized if batching enabled)
+        self.batcher: Optional[InvokeBatcher] = None
+
         # Streaming components (initialized if streaming enabled)
         self.event_bus: Optional[Any] = None  # EventBus
         self.run_manager: Optional[Any] = None  # RunManager
@@ -5,6 +5,7 @@ Provides health check, readiness check, and Prometheus metrics endpoints.
 """
 
 import time
+from typing import Tuple
 
 from dockrion_common.http_models import HealthResponse, ReadyResponse
 from fastapi import APIRouter, HTTPException
@@ -27,6 +28,9 @@ def create_health_router(config: RuntimeConfig, state: RuntimeState) -> APIRoute
     """
     router = APIRouter(tags=["health"])
 
+    # Last rendered metrics payload and the monotonic time it was rendered
+    metrics_cache: Tuple[float, bytes] = (float("-inf"), b"")
+
     @router.get("/health", response_model=HealthResponse)
     async def health_check() -> HealthResponse:
         """Health check for load balancers and orchestrators."""
@@ -48,8 +52,13 @@ def create_health_router(config: RuntimeConfig, state: RuntimeState) -> APIRoute
 
     @router.get("/metrics")
     async def prometheus_metrics():
-        """Prometheus metrics endpoint."""
-        data = generate_latest()
+        """Prometheus metrics endpoint (rendered at most once per cache TTL)."""
+        nonlocal metrics_cache
+        now = time.monotonic()
+        rendered_at, data = metrics_cache
+        if now - rendered_at >= config.metrics_cache_ttl_sec:
+            data = generate_latest()
+            metrics_cache = (now, data)
         return Response(content=data, media_type=CONTENT_TYPE_LATEST)
 
     return router
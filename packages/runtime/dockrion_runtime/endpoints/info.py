@@ -9,6 +9,7 @@ from typing import Any, Dict
 from dockrion_common.http_models import InfoResponse, SchemaResponse
 from dockrion_schema import DockSpec
 from fastapi import APIRouter
+from fastapi.responses import Response
 
 from ..config import RuntimeConfig
 
@@ -26,42 +27,45 @@ def create_info_router(config: RuntimeConfig, spec: DockSpec) -> APIRouter:
     """
     router = APIRouter(tags=["info"])
 
+    # Both responses depend only on the spec and config, so they are
+    # serialized once here instead of on every request.
+    io_schema = spec.io_schema
+    schema_body = SchemaResponse(
+        agent=config.agent_name,
+        input_schema=io_schema.input.model_dump() if io_schema and io_schema.input else {},
+        output_schema=io_schema.output.model_dump() if io_schema and io_schema.output else {},
+    ).model_dump_json()
+
+    # Build agent info based on invocation mode
+    agent_info: Dict[str, Any] = {
+        "name": config.agent_name,
+        "description": config.agent_description,
+        "framework": config.agent_framework,
+        "mode": "handler" if config.use_handler_mode else "entrypoint",
+        "target": config.invocation_target,
+    }
+
+    # Include mode-specific field for clarity
+    if config.use_handler_mode and config.agent_handler:
+        agent_info["handler"] = config.agent_handler
+    elif config.agent_entrypoint:
+        agent_info["entrypoint"] = config.agent_entrypoint
+
+    info_body = InfoResponse(
+        agent=agent_info,
+        auth_enabled=config.auth_enabled,
+        version=config.version,
+        metadata=spec.metadata.model_dump() if spec.metadata else None,
+    ).model_dump_json()
+
     @router.get("/schema", response_model=SchemaResponse)
-    async def get_schema() -> SchemaResponse:
+    async def get_schema() -> Response:
         """Get the input/output schema for this agent."""
-        io_schema = spec.io_schema
-        return SchemaResponse(
-            agent=config.agent_name,
-            input_schema=io_schema.input.model_dump() if io_schema and io_schema.input else {},
-            output_schema=io_schema.output.model_dump() if io_schema and io_schema.output else {},
-        )
+        return Response(content=schema_body, media_type="application/json")
 
     @router.get("/info", response_model=InfoResponse)
-    async def get_info() -> InfoResponse:
+    async def get_info() -> Response:
         """Get agent metadata and configuration."""
-        # Build agent info based on invocation mode
-        agent_info: Dict[str, Any] = {
-            "name": config.agent_name,
-            "description": config.agent_description,
-            "framework": config.agent_framework,
-            "mode": "handler" if config.use_handler_mode else "entrypoint",
-            "target": config.invocation_target,
-        }
-
-        # Include mode-specific field for clarity
-        if config.use_handler_mode and config.agent_handler:
-            agent_info["handler"] = config.agent_handler
-        elif config.agent_entrypoint:
-            agent_info["entrypoint"] = config.agent_entrypoint
-
-        # Get optional metadata
-        metadata = spec.metadata.model_dump() if spec.metadata else None
-
-        return InfoResponse(
-            agent=agent_info,
-            auth_enabled=config.auth_enabled,
-            version=config.version,
-            metadata=metadata,
-        )
+        return Response(content=info_body, media_type="application/json")
 
     return router
@@ -13,11 +13,13 @@ from dockrion_common.errors import DockrionError, ValidationError
 from dockrion_common.http_models import ErrorResponse
 from dockrion_common.logger import get_logger
 from fastapi import APIRouter, Body, Depends, HTTPException, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, create_model
 
 from ..auth import AuthContext
 from ..config import RuntimeConfig, RuntimeState
+from ..invocation import invoke_adapter
+from .responses import error_response
 
 logger = get_logger(__name__)
 
@@ -46,7 +48,7 @@ def create_invoke_router(
     router = APIRouter(tags=["invoke"])
 
     # Create dynamic response model with typed output
-    agent_name_clean = config.agent_name.replace("-", "_").replace(".", "_").capitalize()
+    agent_name_clean = config.model_name_prefix
 
     InvokeResponseModel: Type[BaseModel] = create_model(
         f"{agent_name_clean}InvokeResponse",
@@ -64,15 +66,21 @@ def create_invoke_router(
         },
     )
     async def invoke_agent(
+        request: Request,
         payload: input_model = Body(..., description="Agent input payload"),  # type: ignore[valid-type]
         auth_context: AuthContext = Depends(auth_dependency),
-    ) -> Union[BaseModel, JSONResponse]:
+    ) -> Union[BaseModel, Response]:
         """
         Invoke the agent with the given payload.
 
         The adapter layer handles framework-specific invocation logic.
         Request body is automatically validated against the input schema.
+        When streaming is enabled, clients sending ``Accept: text/event-stream``
+        receive the same SSE response as ``/invoke/stream``.
         """
+        if config.enable_streaming and "text/event-stream" in request.headers.get("accept", ""):
+            return await invoke_agent_stream(payload=payload, auth_context=auth_context)
+
         assert state.metrics is not None
         assert state.policy_engine is not None
         assert state.adapter is not None
@@ -88,31 +96,27 @@ def create_invoke_router(
                 else payload.dict()  # type: ignore[attr-defined]
             )
 
-            logger.info(
-                "📥 Invoke request received", extra={"payload_keys": list(payload_dict.keys())}
-            )
+            logger.info("📥 Invoke request received", payload_keys=list(payload_dict))
 
             # Apply input policies
             payload_dict = state.policy_engine.validate_input(payload_dict)
 
             # Invoke agent via adapter
-            logger.debug(f"Invoking {config.agent_framework} agent...")
+            logger.debug("Invoking agent...", framework=config.agent_framework)
 
-            # Capture adapter reference for lambda
-            adapter = state.adapter
+            invocation = (
+                state.batcher.submit(payload_dict)
+                if state.batcher is not None
+                else invoke_adapter(state.adapter, payload_dict)
+            )
 
             if config.timeout_sec > 0:
                 try:
-                    result = await asyncio.wait_for(
-                        asyncio.get_event_loop().run_in_executor(
-                            None, lambda: adapter.invoke(payload_dict)
-                        ),
-                        timeout=config.timeout_sec,
-                    )
+                    result = await asyncio.wait_for(invocation, timeout=config.timeout_sec)
                 except asyncio.TimeoutError:
                     raise DockrionError(f"Agent invocation timed out after {config.timeout_sec}s")
             else:
-                result = adapter.invoke(payload_dict)
+                result = await invocation
 
             # Apply output policies
             result = state.policy_engine.apply_output_policies(result)
@@ -123,7 +127,7 @@ def create_invoke_router(
             state.metrics.inc_request("invoke", "success")
             state.metrics.observe_latency("invoke", latency)
 
-            logger.info(f"✅ Invoke completed in {latency:.3f}s")
+            logger.info("✅ Invoke completed", latency_seconds=round(latency, 3))
 
             # Validate output against schema (if strict mode enabled)
             if strict_output_validation:
@@ -150,26 +154,18 @@ def create_invoke_router(
 
         except ValidationError as e:
             state.metrics.inc_request("invoke", "validation_error")
-            logger.warning(f"⚠️ Validation error: {e}")
-            return JSONResponse(
-                status_code=400,
-                content=ErrorResponse(error=str(e), code="VALIDATION_ERROR").model_dump(),
-            )
+            logger.warning("⚠️ Validation error", error=str(e))
+            return error_response(400, str(e), "VALIDATION_ERROR")
 
         except DockrionError as e:
             state.metrics.inc_request("invoke", "dockrion_error")
-            logger.error(f"❌ Dockrion error: {e}")
-            return JSONResponse(
-                status_code=500, content=ErrorResponse(error=e.message, code=e.code).model_dump()
-            )
+            logger.error("❌ Dockrion error", error=e.message, code=e.code)
+            return error_response(500, e.message, e.code)
 
         except Exception as e:
             state.metrics.inc_request("invoke", "error")
-            logger.error(f"❌ Unexpected error: {e}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content=ErrorResponse(error=str(e), code="INTERNAL_ERROR").model_dump(),
-            )
+            logger.exception("❌ Unexpected error", error=str(e))
+            return error_response(500, str(e), "INTERNAL_ERROR")
 
         finally:
             state.metrics.dec_active()
@@ -264,7 +260,7 @@ def create_invoke_router(
                                         yield f"event: token\ndata: {json.dumps({'request_id': request_id, 'content': str(chunk)})}\n\n"
                         else:
                             # Non-streaming adapter: invoke and emit result
-                            result = adapter.invoke(payload_dict)
+                            result = await invoke_adapter(adapter, payload_dict)
 
                             # Apply output policies
                             result = state.policy_engine.apply_output_policies(result)
@@ -286,7 +282,9 @@ def create_invoke_router(
 
                     except Exception as e:
                         metrics.inc_request("invoke", "error")
-                        logger.error(f"Streaming invoke error: {e}", exc_info=True)
+                        logger.exception(
+                            "❌ Streaming invoke error", request_id=request_id, error=str(e)
+                        )
                         # Error event is mandatory, always emitted
                         yield f"event: error\ndata: {json.dumps({'request_id': request_id, 'type': 'error', 'error': str(e), 'code': 'INTERNAL_ERROR'})}\n\n"
                     finally:
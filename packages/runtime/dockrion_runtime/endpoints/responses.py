@@ -0,0 +1,28 @@
+"""
+Endpoint Responses
+
+Helpers for building the JSON responses shared by runtime endpoints.
+"""
+
+from fastapi.responses import Response
+from pydantic_core import to_json
+
+# Pre-serialized ErrorResponse envelope; only the message and code are
+# encoded per call
+_ERROR_TEMPLATE = b'{"success":false,"error":%b,"code":%b}'
+
+
+def error_response(status_code: int, error: str, code: str) -> Response:
+    """
+    Build a JSON error response matching ``ErrorResponse``.
+
+    Args:
+        status_code: HTTP status code
+        error: Error message
+        code: Error code for programmatic handling
+
+    Returns:
+        Response with the serialized error body
+    """
+    body = _ERROR_TEMPLATE % (to_json(error), to_json(code))
+    return Response(content=body, status_code=status_code, media_type="application/json")
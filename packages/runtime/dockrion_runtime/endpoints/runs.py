@@ -21,11 +21,12 @@ from dockrion_common.errors import ValidationError
 from dockrion_common.http_models import ErrorResponse
 from dockrion_common.logger import get_logger
 from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request
-from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel
 
 from ..auth import AuthContext
 from ..config import RuntimeConfig, RuntimeState
+from .responses import error_response
 
 logger = get_logger(__name__)
 
@@ -66,7 +67,7 @@ def create_runs_router(
         payload: input_model = Body(..., description="Agent input payload"),  # type: ignore[valid-type]
         run_id: Optional[str] = Query(None, description="Optional client-provided run ID"),
         auth_context: AuthContext = Depends(auth_dependency),
-    ) -> JSONResponse:
+    ) -> Response:
         """
         Start an async agent execution.
 
@@ -126,16 +127,10 @@ def create_runs_router(
 
         except ValidationError as e:
             logger.warning(f"Run creation failed: {e}")
-            return JSONResponse(
-                status_code=400,
-                content=ErrorResponse(error=str(e), code="VALIDATION_ERROR").model_dump(),
-            )
+            return error_response(400, str(e), "VALIDATION_ERROR")
         except Exception as e:
             logger.error(f"Run creation failed: {e}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content=ErrorResponse(error=str(e), code="INTERNAL_ERROR").model_dump(),
-            )
+            return error_response(500, str(e), "INTERNAL_ERROR")
 
     @router.get(
         "/{run_id}",
@@ -147,7 +142,7 @@ def create_runs_router(
     async def get_run_status(
         run_id: str,
         auth_context: AuthContext = Depends(auth_dependency),
-    ) -> JSONResponse:
+    ) -> Response:
         """
         Get the current status and result of a run.
         """
@@ -155,13 +150,7 @@ def create_runs_router(
 
         run = await state.run_manager.get_run(run_id)
         if not run:
-            return JSONResponse(
-                status_code=404,
-                content=ErrorResponse(
-                    error=f"Run '{run_id}' not found",
-                    code="NOT_FOUND",
-                ).model_dump(),
-            )
+            return error_response(404, f"Run '{run_id}' not found", "NOT_FOUND")
 
         return JSONResponse(status_code=200, content=run.to_response())
 
@@ -270,7 +259,7 @@ def create_runs_router(
         run_id: str,
         reason: Optional[str] = Query(None, description="Cancellation reason"),
         auth_context: AuthContext = Depends(auth_dependency),
-    ) -> JSONResponse:
+    ) -> Response:
         """
         Cancel a running execution.
         """
@@ -291,20 +280,11 @@ def create_runs_router(
 
         except ValidationError as e:
             if "not found" in str(e).lower():
-                return JSONResponse(
-                    status_code=404,
-                    content=ErrorResponse(error=str(e), code="NOT_FOUND").model_dump(),
-                )
-            return JSONResponse(
-                status_code=400,
-                content=ErrorResponse(error=str(e), code="VALIDATION_ERROR").model_dump(),
-            )
+                return error_response(404, str(e), "NOT_FOUND")
+            return error_response(400, str(e), "VALIDATION_ERROR")
         except Exception as e:
             logger.error(f"Cancel run failed: {e}", exc_info=True)
-            return JSONResponse(
-                status_code=500,
-                content=ErrorResponse(error=str(e), code="INTERNAL_ERROR").model_dump(),
-            )
+            return error_response(500, str(e), "INTERNAL_ERROR")
 
     return router
 
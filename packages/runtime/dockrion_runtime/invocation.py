@@ -0,0 +1,180 @@
+"""
+Adapter Invocation
+
+Helpers for calling the loaded adapter from async endpoints without blocking
+the event loop.
+
+InvokeBatcher collects concurrent /invoke payloads into micro-batches so adapters that can
+process several inputs in one call (e.g. LangGraph's ``.batch()``) are invoked
+once per batch instead of once per request.
+
+Batching is opt-in via Dockfile arguments:
+
+    arguments:
+      batch_max_size: 8       # > 1 enables batching
+      batch_max_wait_ms: 10   # max time a request waits for the batch to fill
+"""
+
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from dockrion_common.logger import get_logger
+from starlette.concurrency import run_in_threadpool
+
+logger = get_logger(__name__)
+
+_PendingItem = Tuple[Dict[str, Any], "asyncio.Future[Dict[str, Any]]"]
+
+
+async def invoke_adapter(adapter: Any, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Invoke the adapter without blocking the event loop.
+
+    Adapters exposing ``ainvoke()`` are awaited directly; otherwise the
+    synchronous ``invoke()`` is run in the threadpool.
+    """
+    if hasattr(adapter, "ainvoke"):
+        return await adapter.ainvoke(payload)
+    return await run_in_threadpool(adapter.invoke, payload)
+
+
+class InvokeBatcher:
+    """
+    Micro-batching queue in front of an adapter.
+
+    Requests are queued by submit(). A background task takes the first
+    pending request, waits up to ``max_wait_ms`` for up to ``max_batch - 1``
+    more, then dispatches the batch and resolves each request's future.
+
+    Adapters exposing ``batch_invoke(payloads, return_exceptions=True)`` are
+    called once per batch in the threadpool. Other adapters are invoked once
+    per payload, concurrently.
+
+    Example:
+        >>> batcher = InvokeBatcher(adapter, max_batch=8, max_wait_ms=10)
+        >>> batcher.start()
+        >>> result = await batcher.submit({"text": "hello"})
+        >>> await batcher.stop()
+    """
+
+    def __init__(self, adapter: Any, max_batch: int, max_wait_ms: int) -> None:
+        self.adapter = adapter
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue[_PendingItem]" = asyncio.Queue()
+        self._task: Optional["asyncio.Task[None]"] = None
+        # Requests taken off the queue but not yet resolved
+        self._batch: List[_PendingItem] = []
+
+    def start(self) -> None:
+        """Start the background dispatch task."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the dispatch task and fail any requests still queued or in flight."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        pending = self._batch
+        self._batch = []
+        while not self._queue.empty():
+            pending.append(self._queue.get_nowait())
+        self._fail(pending, RuntimeError("Invoke batcher stopped"))
+
+    async def submit(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Queue a payload and wait for its result.
+
+        Args:
+            payload: Input dictionary for the adapter
+
+        Returns:
+            Output dictionary from the adapter
+
+        Raises:
+            Exception: Whatever the adapter raised for this payload
+        """
+        future: "asyncio.Future[Dict[str, Any]]" = asyncio.get_running_loop().create_future()
+        await self._queue.put((payload, future))
+        return await future
+
+    async def _collect(self) -> List[_PendingItem]:
+        """Wait for the first request, then gather more until full or timed out."""
+        batch = self._batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Dispatch loop: collect a batch, invoke the adapter, resolve futures."""
+        while True:
+            batch = await self._collect()
+            try:
+                await self._process(batch)
+            except Exception as e:
+                # Keep the loop alive; only this batch's requests see the error
+                logger.exception("Batch processing failed", batch_size=len(batch), error=str(e))
+                self._fail(batch, e)
+            # Not cleared on cancellation, so stop() can fail the in-flight batch
+            self._batch = []
+
+    async def _process(self, batch: List[_PendingItem]) -> None:
+        """Invoke the adapter for one batch and resolve each request's future."""
+        # Requests that timed out or disconnected while queued are skipped
+        batch = [(payload, future) for payload, future in batch if not future.done()]
+        if not batch:
+            return
+
+        payloads = [payload for payload, _ in batch]
+        try:
+            results = await self._dispatch(payloads)
+        except Exception as e:
+            logger.error("Batch invocation failed", batch_size=len(batch), error=str(e))
+            results = [e] * len(batch)
+
+        # Results can't be matched to requests, so resolve none of them
+        if len(results) != len(batch):
+            raise RuntimeError(f"Adapter returned {len(results)} results for {len(batch)} payloads")
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    @staticmethod
+    def _fail(batch: List[_PendingItem], error: BaseException) -> None:
+        """Set ``error`` on every unresolved future in ``batch``."""
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(error)
+
+    async def _dispatch(self, payloads: List[Dict[str, Any]]) -> List[Any]:
+        """Invoke the adapter for one batch, returning a result or exception per payload."""
+        if hasattr(self.adapter, "batch_invoke"):
+            return await run_in_threadpool(
+                self.adapter.batch_invoke, payloads, return_exceptions=True
+            )
+
+        return await asyncio.gather(
+            *(invoke_adapter(self.adapter, payload) for payload in payloads),
+            return_exceptions=True,
+        )
@@ -4,15 +4,30 @@ Policy Engine Integration for Dockrion Runtime
 Provides input validation, output redaction, and safety checks.
 """
 
-import json
 import re
 from typing import Any, Dict, List, Optional
 
 from dockrion_common.errors import ValidationError
 from dockrion_common.logger import get_logger
+from pydantic_core import from_json, to_json
 
 logger = get_logger(__name__)
 
+# Common prompt injection patterns
+_INJECTION_PATTERNS = (
+    r"(?i:ignore\s+(previous|above|all)\s+instructions)",
+    r"(?i:system\s*:\s*)",
+    r"<\|.*\|>",
+    r"(?i:\[INST\].*\[/INST\])",
+)
+
+# Injection patterns combined into a single regex so each input is scanned
+# once; named groups identify which pattern matched
+_INJECTION_GROUPS = {f"p{i}": pattern for i, pattern in enumerate(_INJECTION_PATTERNS)}
+_INJECTION_REGEX = re.compile(
+    "|".join(f"(?P<{name}>{pattern})" for name, pattern in _INJECTION_GROUPS.items())
+)
+
 
 class RuntimePolicyEngine:
     """
@@ -52,14 +67,6 @@ class RuntimePolicyEngine:
         # Compile redact patterns for efficiency
         self._compiled_patterns = [re.compile(pattern) for pattern in self.redact_patterns]
 
-        # Common prompt injection patterns
-        self._injection_patterns = [
-            re.compile(r"ignore\s+(previous|above|all)\s+instructions", re.IGNORECASE),
-            re.compile(r"system\s*:\s*", re.IGNORECASE),
-            re.compile(r"<\|.*\|>"),
-            re.compile(r"\[INST\].*\[/INST\]", re.IGNORECASE),
-        ]
-
     def validate_input(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Validate and sanitize input payload.
@@ -77,12 +84,13 @@ class RuntimePolicyEngine:
             return payload
 
         # Convert payload to string for pattern matching
-        payload_str = json.dumps(payload)
+        payload_str = to_json(payload).decode()
 
-        for pattern in self._injection_patterns:
-            if pattern.search(payload_str):
-                logger.warning(f"Potential prompt injection detected: {pattern.pattern}")
-                raise ValidationError("Potential prompt injection detected")
+        match = _INJECTION_REGEX.search(payload_str)
+        if match is not None:
+            pattern = _INJECTION_GROUPS.get(match.lastgroup or "")
+            logger.warning("Potential prompt injection detected", pattern=pattern)
+            raise ValidationError("Potential prompt injection detected")
 
         return payload
 
@@ -97,7 +105,7 @@ class RuntimePolicyEngine:
             Processed output with policies applied
         """
         # Convert to string for processing
-        output_str = json.dumps(output)
+        output_str = to_json(output).decode()
 
         # Apply redaction patterns
         for pattern in self._compiled_patterns:
@@ -111,11 +119,11 @@ class RuntimePolicyEngine:
             output_str = output_str[: self.max_output_chars]
             # Try to parse truncated JSON, fall back to wrapping in object
             try:
-                return json.loads(output_str)
-            except json.JSONDecodeError:
+                return from_json(output_str)
+            except ValueError:
                 return {"output": output_str, "_truncated": True}
 
-        return json.loads(output_str)
+        return from_json(output_str)
 
     def is_tool_allowed(self, tool_name: str) -> bool:
         """
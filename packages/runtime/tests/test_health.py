@@ -0,0 +1,45 @@
+"""Tests for the health and metrics endpoints."""
+
+from unittest.mock import patch
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from dockrion_runtime.config import RuntimeConfig, RuntimeState
+from dockrion_runtime.endpoints.health import create_health_router
+
+
+def _client(metrics_cache_ttl_sec: float) -> TestClient:
+    config = RuntimeConfig(
+        agent_name="test",
+        agent_framework="langgraph",
+        metrics_cache_ttl_sec=metrics_cache_ttl_sec,
+    )
+    app = FastAPI()
+    app.include_router(create_health_router(config, RuntimeState()))
+    return TestClient(app)
+
+
+class TestMetricsEndpoint:
+    """Tests for /metrics caching."""
+
+    def test_scrapes_within_ttl_reuse_rendered_payload(self):
+        client = _client(metrics_cache_ttl_sec=60)
+        with patch(
+            "dockrion_runtime.endpoints.health.generate_latest", return_value=b"metric 1\n"
+        ) as generate:
+            first = client.get("/metrics")
+            second = client.get("/metrics")
+
+        assert generate.call_count == 1
+        assert first.content == second.content == b"metric 1\n"
+
+    def test_zero_ttl_renders_every_scrape(self):
+        client = _client(metrics_cache_ttl_sec=0)
+        with patch(
+            "dockrion_runtime.endpoints.health.generate_latest", return_value=b"metric 1\n"
+        ) as generate:
+            client.get("/metrics")
+            client.get("/metrics")
+
+        assert generate.call_count == 2
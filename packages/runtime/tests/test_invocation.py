@@ -0,0 +1,146 @@
+"""Tests for adapter invocation helpers and the invoke batcher."""
+
+import asyncio
+from typing import Any, Dict, List
+
+import pytest
+
+from dockrion_runtime.invocation import InvokeBatcher, invoke_adapter
+
+
+class SyncAdapter:
+    """Adapter exposing only a synchronous invoke()."""
+
+    def invoke(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"echo": payload}
+
+
+class BatchAdapter:
+    """Adapter exposing batch_invoke() that records batch sizes."""
+
+    def __init__(self) -> None:
+        self.batch_sizes: List[int] = []
+
+    def invoke(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"echo": payload}
+
+    def batch_invoke(self, payloads, return_exceptions=False):
+        self.batch_sizes.append(len(payloads))
+        return [
+            ValueError("bad payload") if payload.get("fail") else {"echo": payload}
+            for payload in payloads
+        ]
+
+
+class TestInvokeAdapter:
+    """Tests for invoke_adapter()."""
+
+    @pytest.mark.asyncio
+    async def test_prefers_ainvoke(self):
+        class AsyncAdapter(SyncAdapter):
+            async def ainvoke(self, payload):
+                return {"async": True}
+
+        assert await invoke_adapter(AsyncAdapter(), {}) == {"async": True}
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_invoke(self):
+        assert await invoke_adapter(SyncAdapter(), {"a": 1}) == {"echo": {"a": 1}}
+
+
+class TestInvokeBatcher:
+    """Tests for InvokeBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_share_a_batch(self):
+        adapter = BatchAdapter()
+        batcher = InvokeBatcher(adapter, max_batch=4, max_wait_ms=50)
+        batcher.start()
+        try:
+            results = await asyncio.gather(*(batcher.submit({"n": i}) for i in range(4)))
+        finally:
+            await batcher.stop()
+
+        assert results == [{"echo": {"n": i}} for i in range(4)]
+        assert adapter.batch_sizes == [4]
+
+    @pytest.mark.asyncio
+    async def test_batch_is_capped_at_max_batch(self):
+        adapter = BatchAdapter()
+        batcher = InvokeBatcher(adapter, max_batch=2, max_wait_ms=50)
+        batcher.start()
+        try:
+            await asyncio.gather(*(batcher.submit({"n": i}) for i in range(5)))
+        finally:
+            await batcher.stop()
+
+        assert adapter.batch_sizes == [2, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_failures_are_isolated_per_request(self):
+        batcher = InvokeBatcher(BatchAdapter(), max_batch=2, max_wait_ms=50)
+        batcher.start()
+        try:
+            ok, failed = await asyncio.gather(
+                batcher.submit({"n": 1}),
+                batcher.submit({"fail": True}),
+                return_exceptions=True,
+            )
+        finally:
+            await batcher.stop()
+
+        assert ok == {"echo": {"n": 1}}
+        assert isinstance(failed, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_adapter_without_batch_invoke(self):
+        batcher = InvokeBatcher(SyncAdapter(), max_batch=4, max_wait_ms=10)
+        batcher.start()
+        try:
+            results = await asyncio.gather(batcher.submit({"a": 1}), batcher.submit({"b": 2}))
+        finally:
+            await batcher.stop()
+
+        assert results == [{"echo": {"a": 1}}, {"echo": {"b": 2}}]
+
+    @pytest.mark.asyncio
+    async def test_loop_survives_mismatched_batch_results(self):
+        class ShortBatchAdapter(BatchAdapter):
+            def batch_invoke(self, payloads, return_exceptions=False):
+                if len(payloads) > 1:
+                    return [{"echo": payloads[0]}]
+                return super().batch_invoke(payloads, return_exceptions)
+
+        batcher = InvokeBatcher(ShortBatchAdapter(), max_batch=2, max_wait_ms=50)
+        batcher.start()
+        try:
+            first, second = await asyncio.gather(
+                batcher.submit({"n": 1}),
+                batcher.submit({"n": 2}),
+                return_exceptions=True,
+            )
+            after = await batcher.submit({"n": 3})
+        finally:
+            await batcher.stop()
+
+        assert isinstance(first, RuntimeError)
+        assert isinstance(second, RuntimeError)
+        assert after == {"echo": {"n": 3}}
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_in_flight_requests(self):
+        started = asyncio.Event()
+
+        class SlowAdapter:
+            async def ainvoke(self, payload):
+                started.set()
+                await asyncio.sleep(10)
+
+        batcher = InvokeBatcher(SlowAdapter(), max_batch=1, max_wait_ms=10)
+        batcher.start()
+        request = asyncio.create_task(batcher.submit({"n": 1}))
+        await started.wait()
+        await batcher.stop()
+
+        with pytest.raises(RuntimeError, match="stopped"):
+            await request
@@ -0,0 +1,74 @@
+"""Tests for the /invoke endpoints."""
+
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import create_model
+
+from dockrion_runtime.auth import AuthContext
+from dockrion_runtime.config import RuntimeConfig, RuntimeState
+from dockrion_runtime.endpoints.invoke import create_invoke_router
+
+
+class EchoAdapter:
+    """Adapter echoing the payload back."""
+
+    def invoke(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        return {"result": payload["text"]}
+
+
+async def _no_auth(request: Request) -> AuthContext:
+    return AuthContext.anonymous()
+
+
+def _client(enable_streaming: bool) -> TestClient:
+    config = RuntimeConfig(
+        agent_name="test",
+        agent_framework="custom",
+        enable_streaming=enable_streaming,
+    )
+    state = RuntimeState()
+    state.adapter = EchoAdapter()
+    state.metrics = MagicMock()
+    state.policy_engine = MagicMock()
+    state.policy_engine.validate_input.side_effect = lambda payload: payload
+    state.policy_engine.apply_output_policies.side_effect = lambda result: result
+
+    app = FastAPI()
+    app.include_router(
+        create_invoke_router(
+            config,
+            state,
+            _no_auth,
+            create_model("TestInput", text=(str, ...)),
+            create_model("TestOutput", result=(str, ...)),
+        )
+    )
+    return TestClient(app)
+
+
+class TestInvokeContentNegotiation:
+    """Tests for Accept-based routing on /invoke."""
+
+    def test_event_stream_accept_streams_when_enabled(self):
+        response = _client(enable_streaming=True).post(
+            "/invoke", json={"text": "hi"}, headers={"Accept": "text/event-stream"}
+        )
+
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert "event: started" in response.text
+        assert "event: complete" in response.text
+
+    def test_json_accept_returns_json(self):
+        response = _client(enable_streaming=True).post("/invoke", json={"text": "hi"})
+
+        assert response.json()["output"] == {"result": "hi"}
+
+    def test_event_stream_accept_ignored_when_streaming_disabled(self):
+        response = _client(enable_streaming=False).post(
+            "/invoke", json={"text": "hi"}, headers={"Accept": "text/event-stream"}
+        )
+
+        assert response.json()["output"] == {"result": "hi"}
@@ -0,0 +1,20 @@
+"""Tests for shared endpoint response helpers."""
+
+import json
+
+from dockrion_common.http_models import ErrorResponse
+
+from dockrion_runtime.endpoints.responses import error_response
+
+
+class TestErrorResponse:
+    """Tests for error_response()."""
+
+    def test_body_matches_error_response_model(self):
+        response = error_response(400, 'Bad "input"\n', "VALIDATION_ERROR")
+
+        expected = ErrorResponse(error='Bad "input"\n', code="VALIDATION_ERROR")
+        assert response.status_code == 400
+        assert response.media_type == "application/json"
+        assert response.body == expected.model_dump_json().encode()
+        assert json.loads(response.body) == expected.model_dump()
@@ -96,9 +96,11 @@ def to_yaml_string(spec: DockSpec, exclude_none: bool = True) -> str:
 
     data = to_dict(spec, exclude_none=exclude_none)
 
-    # Use safe_dump with nice formatting
+    # Safe dump with nice formatting; prefer the libyaml emitter when PyYAML
+    # was built with it (same output, several times faster than pure Python)
     return yaml.dump(
         data,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
         default_flow_style=False,
         sort_keys=False,
         allow_unicode=True,
@@ -7,12 +7,13 @@ and invoking agents locally.
 """
 
 from .invoker import invoke_local
-from .loader import expand_env_vars, load_dockspec
+from .loader import clear_dockspec_cache, expand_env_vars, load_dockspec
 from .validate import validate, validate_dockspec
 
 __all__ = [
     "load_dockspec",
     "expand_env_vars",
+    "clear_dockspec_cache",
     "invoke_local",
     "validate_dockspec",
     "validate",
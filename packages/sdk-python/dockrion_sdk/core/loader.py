@@ -12,7 +12,7 @@ Provides functionality for loading and parsing Dockfiles:
 import os
 import re
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import yaml
 from dockrion_common import (
@@ -29,6 +29,35 @@ from dockrion_schema.dockfile_v1 import DockSpec
 
 logger = get_logger(__name__)
 
+# Parsed YAML keyed by resolved path, stamped with (st_mtime_ns, st_size) so an
+# edited Dockfile is re-read. Only the raw parse is cached: env expansion,
+# schema validation and secret checks depend on the environment and still run
+# on every load.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+_PARSE_CACHE_SIZE = 32
+
+
+def _read_dockfile(file_path: Path) -> Any:
+    """Parse a Dockfile's YAML, reusing the previous parse if the file is unchanged."""
+    key = str(file_path)
+    with open(file_path, "r", encoding="utf-8") as f:
+        st = os.fstat(f.fileno())
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        content = f.read()
+    data = yaml.safe_load(content)
+    if key not in _PARSE_CACHE and len(_PARSE_CACHE) >= _PARSE_CACHE_SIZE:
+        _PARSE_CACHE.pop(next(iter(_PARSE_CACHE)))
+    _PARSE_CACHE[key] = (stamp, data)
+    return data
+
+
+def clear_dockspec_cache() -> None:
+    """Drop all cached Dockfile parses (mainly for tests)."""
+    _PARSE_CACHE.clear()
+
 
 def expand_env_vars(data: Any) -> Any:
     """Recursively expand ${VAR} and ${VAR:-default} in dict/list values.
@@ -130,17 +159,14 @@ def load_dockspec(
     except Exception as e:
         logger.warning(f"Failed to load environment files: {e}")
 
-    # 2. Check if file exists
-    if not file_path.exists():
+    # 2-3. Read and parse YAML (a missing file surfaces from open(), which
+    # spares a separate exists() stat on the common path)
+    try:
+        data = _read_dockfile(file_path)
+    except FileNotFoundError:
         raise ValidationError(
             f"Dockfile not found: {path}\nMake sure the file exists and the path is correct."
-        )
-
-    # 3. Read and parse YAML
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-            data = yaml.safe_load(content)
+        ) from None
     except yaml.YAMLError as e:
         raise ValidationError(
             f"Invalid YAML in Dockfile: {path}\nError: {str(e)}\nPlease check the YAML syntax."
@@ -188,4 +214,5 @@ def load_dockspec(
 __all__ = [
     "load_dockspec",
     "expand_env_vars",
+    "clear_dockspec_cache",
 ]
@@ -78,6 +78,14 @@ _FALLBACK_RUNTIME_DEPENDENCIES = {
     "aiohttp": ">=3.9.0",
 }
 
+# Event loop and HTTP parser used by the generated container's uvicorn command.
+# uvicorn[standard] provides these, but extras are dropped when requirements are
+# merged, so they are listed explicitly (with the same marker uvicorn uses).
+_SERVER_DEPENDENCIES = {
+    "uvloop": '>=0.19.0; sys_platform != "win32"',
+    "httptools": ">=0.6.0",
+}
+
 _FALLBACK_FRAMEWORK_DEPENDENCIES = {
     "langgraph": {
         "langgraph": ">=0.0.20",
@@ -125,9 +133,9 @@ def _get_runtime_dependencies() -> Dict[str, str]:
     Falls back to hardcoded values when pyproject.toml is not available.
     """
     deps = get_runtime_dependencies_from_pyproject()
-    if deps:
-        return deps
-    return _FALLBACK_RUNTIME_DEPENDENCIES.copy()
+    if not deps:
+        deps = _FALLBACK_RUNTIME_DEPENDENCIES.copy()
+    return {**_SERVER_DEPENDENCIES, **deps}
 
 
 def _get_framework_dependencies(framework: str) -> Dict[str, str]:
@@ -382,7 +390,9 @@ class VersionResolver:
         """
         from .version import parse_constraints
 
-        dockrion_constraints = parse_constraints(dockrion_constraint_str)
+        # Environment markers don't take part in version comparison
+        version_str = dockrion_constraint_str.split(";", 1)[0]
+        dockrion_constraints = parse_constraints(version_str)
 
         # Check if the constraint ranges overlap
         return constraints_are_compatible(user_constraints, dockrion_constraints)
@@ -55,6 +55,78 @@ class TestLoadDockspec:
         assert spec.expose.port == 8080
 
 
+class TestDockfileParseCache:
+    """Tests for the mtime/size keyed Dockfile parse cache."""
+
+    DOCKFILE = """
+version: "1.0"
+agent:
+  name: {name}
+  description: ${{AGENT_DESC}}
+  entrypoint: fixtures.mock_agent:build_agent
+  framework: langgraph
+io_schema:
+  input:
+    type: object
+  output:
+    type: object
+expose:
+  port: 8080
+"""
+
+    def setup_method(self):
+        from dockrion_sdk.core import clear_dockspec_cache
+
+        clear_dockspec_cache()
+
+    def teardown_method(self):
+        from dockrion_sdk.core import clear_dockspec_cache
+
+        clear_dockspec_cache()
+
+    @pytest.fixture
+    def parse_calls(self, monkeypatch):
+        """Count YAML parses done by the loader."""
+        from dockrion_sdk.core import loader
+
+        calls = []
+        safe_load = loader.yaml.safe_load
+
+        def counting_safe_load(stream):
+            calls.append(stream)
+            return safe_load(stream)
+
+        monkeypatch.setattr(loader.yaml, "safe_load", counting_safe_load)
+        return calls
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path, monkeypatch, parse_calls):
+        """Test that reloading an unchanged Dockfile reuses the cached parse."""
+        dockfile_path = tmp_path / "Dockfile.yaml"
+        dockfile_path.write_text(self.DOCKFILE.format(name="cached-agent").strip())
+        monkeypatch.setenv("AGENT_DESC", "one")
+
+        first = load_dockspec(str(dockfile_path))
+        second = load_dockspec(str(dockfile_path))
+
+        assert first.agent.name == second.agent.name == "cached-agent"
+        assert len(parse_calls) == 1
+
+    def test_reload_tracks_edits_and_env(self, tmp_path, monkeypatch, parse_calls):
+        """Test that reloading a Dockfile re-expands env vars and picks up edits."""
+        dockfile_path = tmp_path / "Dockfile.yaml"
+        dockfile_path.write_text(self.DOCKFILE.format(name="first-agent").strip())
+
+        monkeypatch.setenv("AGENT_DESC", "one")
+        assert load_dockspec(str(dockfile_path)).agent.description == "one"
+        monkeypatch.setenv("AGENT_DESC", "two")
+        assert load_dockspec(str(dockfile_path)).agent.description == "two"
+        assert len(parse_calls) == 1
+
+        dockfile_path.write_text(self.DOCKFILE.format(name="second-agent-x").strip())
+        assert load_dockspec(str(dockfile_path)).agent.name == "second-agent-x"
+        assert len(parse_calls) == 2
+
+
 class TestExpandEnvVars:
     """Tests for expand_env_vars function."""
 
@@ -576,6 +576,21 @@ class TestDockrionMetaPackageInclusion:
         assert len(dockrion_entries) == 1
         assert "dockrion>=" in dockrion_entries[0]
 
+    def test_server_dependencies_included(self):
+        """Test that uvloop/httptools are included for the container's uvicorn command."""
+        merger = DependencyMerger(framework="langgraph")
+        result = merger.merge()
+
+        assert 'uvloop>=0.19.0; sys_platform != "win32"' in result.requirements
+        assert any(r.startswith("httptools") for r in result.requirements)
+
+    def test_user_uvloop_version_resolves_against_marked_constraint(self):
+        """Test that a user-pinned uvloop is compared without dockrion's marker."""
+        merger = DependencyMerger(framework="langgraph")
+        result = merger.merge(extra_dependencies=["uvloop>=0.21.0"])
+
+        assert "uvloop>=0.21.0" in result.requirements
+
     def test_dockrion_included_with_user_requirements(self):
         """Test that dockrion is included alongside user requirements."""
         with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
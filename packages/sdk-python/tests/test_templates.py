@@ -124,6 +124,10 @@ class TestTemplateRendering:
         assert "FROM python:" in dockerfile
         assert "WORKDIR" in dockerfile
         assert "EXPOSE" in dockerfile
+        assert '"--loop", "uvloop"' in dockerfile
+        assert "--no-access-log" not in dockerfile
+        assert "--compile-bytecode" in dockerfile
+        assert "python -m compileall -q /app" in dockerfile
 
     def test_render_requirements_basic(self, sample_dockfile):
         """Test rendering requirements template."""